@@ -6,11 +6,14 @@ from discord.ext.commands import Bot
 
 from pyston.exceptions import InvalidLanguage, TooManyRequests
 
+from .breaker import CircuitBreakers, CircuitOpen
 from .config import DEFAULT_CONFIG_DICT, ConfigManager
 from .cogs import cogs
-from .piston import get_codeblocks, run_code, process_output
+from .piston import PooledPystonClient, get_codeblocks, run_code, process_output
 from .errors import ErrorHandler
 from .help import HelpCog
+from .jsonlib import set_loads
+from .pool import HTTPPool
 
 from typing import TYPE_CHECKING, Callable, Dict, Optional
 
@@ -64,6 +67,18 @@ class JusBot(Bot):
     )
 
   async def setup_hook(self):
+    # This needs to be created before the cogs, as their clients draw sessions from it
+    self.http_pool = HTTPPool(
+      limit=self.config["pool_limit"],
+      limit_per_host=self.config["pool_limit_per_host"],
+      keepalive_timeout=self.config["pool_keepalive_timeout"],
+      dns_ttl=self.config["pool_dns_ttl"]
+    )
+    # One breaker per upstream host, so a host that is down fails fast instead of timing out
+    self.breakers = CircuitBreakers(**self.config["circuit_breaker"])
+    self.piston = PooledPystonClient(self.http_pool, breakers=self.breakers)
+    set_loads(self.config["json_loads"])
+
     for cog in cogs:
       # TODO: Implement cog configurations
       await self.add_cog(cog(self, False, False))
@@ -86,6 +101,11 @@ class JusBot(Bot):
   def run(self, *args, **kwargs):
     super().run(self.token, *args, **kwargs)
 
+  async def close(self):
+    await super().close()
+    if getattr(self, "http_pool", None) is not None:
+      await self.http_pool.close()
+
   async def on_message(self, message: Message):
     if message.author.bot:
       return
@@ -98,13 +118,15 @@ class JusBot(Bot):
           if not code.startswith("i#"):
             mention = message.author.mention
             try:
-              output = await run_code(lang, code)
+              output = await run_code(lang, code, client=self.piston)
               s = await process_output(output)
               await message.reply(discord.utils.escape_mentions(s))
             except InvalidLanguage:
               await message.reply(f"Unknown language, {mention}")
             except TooManyRequests:
               await message.reply(f"Bot is currently handling too many requests, try again later, {mention}")
+            except CircuitOpen:
+              await message.reply(f"Code execution is currently unavailable, try again later, {mention}")
     else:
       await self.process_commands(message)
 
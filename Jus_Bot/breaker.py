@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Deque, Dict, Iterator, NamedTuple, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+class BreakerState(str, Enum):
+  CLOSED = "closed"
+  OPEN = "open"
+  HALF_OPEN = "half-open"
+
+  def __str__(self):
+    return self.value
+
+class CircuitOpen(Exception):
+  """Exception that is raised instead of sending a request to a host whose breaker is open"""
+
+  def __init__(self, host: str, retry_after: float):
+    self.host = host
+    self.retry_after = retry_after
+    super().__init__(f"{host} is unavailable, retry in {retry_after:.0f}s")
+
+class _Outcome(NamedTuple):
+  time: float
+  failed: bool
+  slow: bool
+
+class CircuitBreaker:
+  """
+  A circuit breaker for the requests to a single host
+
+  The breaker is closed while the host is healthy. It opens once enough of the recent requests
+  failed or were slow, and requests fail fast with :class:`CircuitOpen` instead of waiting for
+  the host to time out. After `open_for` seconds it is half-open, letting `probes` requests
+  through: it closes if they all succeed, and opens again as soon as one fails.
+
+  Parameters
+  ----------
+  host: :class:`str`
+    The host the breaker is for, only used in messages.
+  failure_rate: :class:`float`
+    The share of failed requests that opens the breaker. Defaults to `0.5`
+  slow_call: :class:`float`
+    How long a request may take before it counts as slow, in seconds. Defaults to `10`
+  slow_rate: :class:`float`
+    The share of slow requests that opens the breaker. Defaults to `0.8`
+  window: :class:`int`
+    The number of recent requests the rates are taken over. Defaults to `20`
+  min_calls: :class:`int`
+    The number of recent requests needed before the breaker can open. Defaults to `5`
+  period: :class:`float`
+    How long a request counts as recent, in seconds. Defaults to `60`
+  open_for: :class:`float`
+    How long the breaker stays open before probing the host, in seconds. Defaults to `30`
+  probes: :class:`int`
+    The number of requests let through while half-open. Defaults to `1`
+  """
+
+  def __init__(
+    self,
+    host: str,
+    failure_rate: float = 0.5,
+    slow_call: float = 10.0,
+    slow_rate: float = 0.8,
+    window: int = 20,
+    min_calls: int = 5,
+    period: float = 60.0,
+    open_for: float = 30.0,
+    probes: int = 1
+  ):
+    self.host = host
+    self.failure_rate = failure_rate
+    self.slow_call = slow_call
+    self.slow_rate = slow_rate
+    self.min_calls = min_calls
+    self.period = period
+    self.open_for = open_for
+    self.probes = probes
+
+    self._state = BreakerState.CLOSED
+    self._outcomes: Deque[_Outcome] = deque(maxlen=window)
+    self._opened_at = 0.0
+    self._probing = 0
+    self._probed = 0
+    self._lock = Lock()
+
+    self.trips = 0
+    self.rejected = 0
+
+  def _recent(self, now: float) -> Deque[_Outcome]:
+    while self._outcomes and self._outcomes[0].time <= now - self.period:
+      self._outcomes.popleft()
+    return self._outcomes
+
+  def _rates(self, now: float) -> Tuple[float, float]:
+    outcomes = self._recent(now)
+    if not outcomes:
+      return 0.0, 0.0
+    return (
+      sum(o.failed for o in outcomes) / len(outcomes),
+      sum(o.slow for o in outcomes) / len(outcomes)
+    )
+
+  def _retry_after(self, now: float) -> float:
+    return max(0.0, self._opened_at + self.open_for - now)
+
+  def _open(self, now: float):
+    self._state = BreakerState.OPEN
+    self._opened_at = now
+    self.trips += 1
+
+  @property
+  def state(self) -> BreakerState:
+    """The state of the breaker, an open breaker is half-open once `open_for` has passed"""
+    with self._lock:
+      if self._state is BreakerState.OPEN and not self._retry_after(monotonic()):
+        return BreakerState.HALF_OPEN
+      return self._state
+
+  @property
+  def stats(self) -> Dict[str, float]:
+    """The breaker counters, `retry_after` is in seconds"""
+    with self._lock:
+      now = monotonic()
+      failure_rate, slow_rate = self._rates(now)
+      retry_after = self._retry_after(now) if self._state is BreakerState.OPEN else 0.0
+      state = BreakerState.HALF_OPEN if self._state is BreakerState.OPEN and not retry_after else self._state
+      return {
+        "state": str(state),
+        "calls": len(self._outcomes),
+        "failure_rate": failure_rate,
+        "slow_rate": slow_rate,
+        "trips": self.trips,
+        "rejected": self.rejected,
+        "retry_after": retry_after
+      }
+
+  def check(self):
+    """Raises :class:`CircuitOpen` if a request to the host would fail fast, without taking a probe
+
+    This is for callers that have to do something costly before the request, e.g. spend a query budget.
+    """
+    with self._lock:
+      retry_after = self._retry_after(monotonic())
+      if self._state is BreakerState.OPEN and retry_after:
+        self.rejected += 1
+        raise CircuitOpen(self.host, retry_after)
+
+  def allow(self):
+    """Admits a request to the host, raising :class:`CircuitOpen` if it should fail fast
+
+    Every admitted request has to be followed by `record` or `release`.
+    """
+    with self._lock:
+      now = monotonic()
+      if self._state is BreakerState.OPEN:
+        retry_after = self._retry_after(now)
+        if retry_after:
+          self.rejected += 1
+          raise CircuitOpen(self.host, retry_after)
+        self._state = BreakerState.HALF_OPEN
+        self._probing = self._probed = 0
+
+      if self._state is BreakerState.HALF_OPEN:
+        if self._probing >= self.probes - self._probed:
+          self.rejected += 1
+          raise CircuitOpen(self.host, 0.0)
+        self._probing += 1
+
+  def record(self, ok: bool, elapsed: float = 0.0):
+    """Records the outcome of an admitted request, `elapsed` is in seconds"""
+    with self._lock:
+      now = monotonic()
+      slow = elapsed >= self.slow_call
+      if self._state is BreakerState.HALF_OPEN:
+        self._probing = max(0, self._probing - 1)
+        if not ok or slow:
+          self._open(now)
+          return
+        self._probed += 1
+        if self._probed >= self.probes:
+          self._state = BreakerState.CLOSED
+          self._outcomes.clear()
+        return
+      if self._state is BreakerState.OPEN:
+        # A request admitted before the breaker opened
+        return
+
+      self._outcomes.append(_Outcome(now, not ok, slow))
+      if len(self._recent(now)) < self.min_calls:
+        return
+      failure_rate, slow_rate = self._rates(now)
+      if failure_rate >= self.failure_rate or slow_rate >= self.slow_rate:
+        self._open(now)
+
+  def release(self):
+    """Ends an admitted request without an outcome, e.g. if it was cancelled"""
+    with self._lock:
+      if self._state is BreakerState.HALF_OPEN:
+        self._probing = max(0, self._probing - 1)
+
+  @contextmanager
+  def guard(self, failures: Tuple[Type[BaseException], ...] = (Exception,)) -> Iterator[None]:
+    """Admits the request sent in the block and records its outcome
+
+    Only the exceptions in `failures` count against the host. Other exceptions
+    mean that the host did answer, and cancellations are not counted at all.
+    """
+    self.allow()
+    start = perf_counter()
+    try:
+      yield
+    except failures:
+      self.record(False, perf_counter() - start)
+      raise
+    except Exception:
+      self.record(True, perf_counter() - start)
+      raise
+    except BaseException:
+      self.release()
+      raise
+    else:
+      self.record(True, perf_counter() - start)
+
+class CircuitBreakers:
+  """
+  The circuit breakers of every upstream host, shared by the HTTP clients of the bot
+
+  Breakers are created on first use, with the options of :class:`CircuitBreaker`.
+  """
+
+  def __init__(self, **options):
+    self.options = options
+    self._breakers: Dict[str, CircuitBreaker] = {}
+
+  def __iter__(self) -> Iterator[CircuitBreaker]:
+    return iter(tuple(self._breakers.values()))
+
+  def __len__(self):
+    return len(self._breakers)
+
+  def get(self, host: str) -> CircuitBreaker:
+    """Gets the breaker of a host, creating it if needed"""
+    breaker = self._breakers.get(host)
+    if breaker is None:
+      breaker = self._breakers[host] = CircuitBreaker(host, **self.options)
+    return breaker
+
+  def for_url(self, url: str) -> CircuitBreaker:
+    """Gets the breaker of the host of a url"""
+    return self.get(urlsplit(url).netloc)
+
+  @property
+  def stats(self) -> Dict[str, Dict[str, float]]:
+    """The counters of every breaker, by host"""
+    return {breaker.host: breaker.stats for breaker in self}
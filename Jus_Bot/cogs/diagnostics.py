@@ -20,4 +20,21 @@ class Diagnostics(Cog):
   @command(help='Get websocket latency')
   async def ping(self, ctx: Context):
     embed = embed_template(self.bot, ctx.author, title='Pong! \U0001F3D3', description=f'{round(self.bot.latency*1000,1)}ms')
+    await ctx.reply(embed=embed)
+
+  @command(help='Get the state of the circuit breakers of external APIs')
+  async def breakers(self, ctx: Context):
+    embed = embed_template(self.bot, ctx.author, title='Circuit breakers')
+    for host, stats in self.bot.breakers.stats.items():
+      value = (
+        f'State: {stats["state"]}\n'
+        f'Failures: {stats["failure_rate"]:.0%} of {stats["calls"]} recent requests\n'
+        f'Slow: {stats["slow_rate"]:.0%}\n'
+        f'Tripped {stats["trips"]} times, failed fast {stats["rejected"]} times'
+      )
+      if stats["retry_after"]:
+        value += f'\nProbing in {stats["retry_after"]:.0f}s'
+      embed.add_field(name=host, value=value, inline=False)
+    if not embed.fields:
+      embed.description = 'No requests have been sent yet'
     await ctx.reply(embed=embed)
\ No newline at end of file
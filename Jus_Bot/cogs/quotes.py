@@ -6,7 +6,9 @@ from discord.ext.commands import Cog, command, Context
 from discord.ext.tasks import loop
 
 from ..utils import embed_template, error_template
+from ..breaker import CircuitOpen
 from ..quotes import QODClient, RateLimitExceeded
+from ..quotes.client import FAILURES
 
 if TYPE_CHECKING:
   from ..bot import JusBot
@@ -21,7 +23,7 @@ class Quotes(Cog):
     self.hidden = hidden
     self.suppress = suppress
 
-    self.client = QODClient()
+    self.client = QODClient(pool=bot.http_pool, breakers=bot.breakers)
 
     self.qods: Dict[str, Quote] = {}
     self.categories = ()
@@ -34,7 +36,8 @@ class Quotes(Cog):
       self.categories = self.categories or await self.client.categories()
       for category in self.categories:
         self.qods[category] = await self.client.qod(category=category)
-    except RateLimitExceeded:
+    except (RateLimitExceeded, CircuitOpen, *FAILURES):
+      # The quotes of the last update are kept until the next one
       pass
 
   @command(help="Gives a Quote of the Day")
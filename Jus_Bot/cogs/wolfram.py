@@ -1,17 +1,111 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
+import logging
+
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from discord.ext.commands import Cog, Context, command
 
+from ..breaker import CircuitOpen
 from ..ui.paginator import Paginator, Page
 from ..utils import embed_template, error_template
-from ..wolfram import AsyncClient
+from ..wolfram import AsyncClient, ConversationStore, DiskCache, Priority, QuotaGovernor, ResultCache
+from ..wolfram.exceptions import BudgetExhausted, InterpretationError, TransportError
+from ..wolfram.policy import RequestPolicy
+from ..wolfram.transcode import AVAILABLE as TRANSCODE_AVAILABLE, TranscodeOptions, Transcoder
 
 import discord
 
 if TYPE_CHECKING:
   from ..bot import JusBot
+  from ..wolfram.models import Pod
+  from ..wolfram.paging import PagedQuery
+
+log = logging.getLogger(__name__)
+
+# Discord rate limits message edits, so pods that arrive close together are shown in one edit
+EDIT_INTERVAL = 1.0
+
+class _PodPages:
+  """Keeps the pages of a sent paginator in sync with the pods of a result as they arrive"""
+
+  def __init__(self, cog: WolframAlpha, ctx: Context, paginator: Paginator, pages: Dict[str, Page]):
+    self.cog = cog
+    self.ctx = ctx
+    self.paginator = paginator
+    self.pages = pages
+    self.changed = False
+    self.last_edit = monotonic()
+
+  def show(self, pod: Pod):
+    """Adds the page of a pod, or replaces it if the pod was shown before"""
+    if not pod.text:
+      return
+    embed = self.cog._pod_embed(self.ctx, pod)
+    page = self.pages.get(pod.id)
+    if page is not None:
+      page.embed = embed
+    elif self.paginator.page_count < 25:
+      page = self.pages[pod.id] = Page(embed=embed)
+      self.paginator.add_page(page, index=1 if pod.primary else None)
+    else:
+      return
+    self.changed = True
+
+  async def refresh(self, force: bool = False):
+    """Edits the message if any page changed, at most every `EDIT_INTERVAL` unless forced"""
+    # The page browser is left alone, it picks up the changes when it is closed
+    if not self.changed or self.paginator.view is not self.paginator.default_view:
+      return
+    if not force and monotonic() - self.last_edit < EDIT_INTERVAL:
+      return
+    await self.paginator.update()
+    self.last_edit = monotonic()
+    self.changed = False
+
+class _PodPaginator(Paginator):
+  """A paginator that fetches the pods of later pages as the user pages forward"""
+
+  def __init__(self, pages: List[Page], query: PagedQuery, **options):
+    super().__init__(pages, **options)
+    self.query = query
+    self.next_page = 1
+    self.more_pages = query.has_page(1)
+    self.pod_pages: Optional[_PodPages] = None
+
+  async def on_page_change(self, interaction: discord.Interaction):
+    # The next page of pods is needed once the last page is reached
+    while self.more_pages and self._current_page >= self.page_count - 1:
+      if not interaction.response.is_done():
+        # Fetching can take longer than Discord waits for a response
+        await interaction.response.defer()
+      if not await self._load_next():
+        break
+
+    if self.more_pages:
+      # One page ahead is prefetched, so it is usually ready by the time it is needed
+      self.query.prefetch(self.next_page)
+
+  async def _load_next(self) -> bool:
+    """Loads the next page of pods, returns `False` if it could not be fetched"""
+    try:
+      res = await self.query.page(self.next_page, priority=Priority.INTERACTIVE)
+    except (TransportError, CircuitOpen):
+      # The page is fetched again the next time the user pages forward
+      log.warning("Failed to fetch page %d of a Wolfram|Alpha query", self.next_page, exc_info=True)
+      return False
+    except (BudgetExhausted, InterpretationError):
+      self.more_pages = False
+      return False
+    self.next_page += 1
+
+    if res is not None:
+      for pod in res.pods or ():
+        self.pod_pages.show(pod)
+    self.more_pages = res is not None and self.query.has_page(self.next_page) and self.page_count < 25
+    return True
 
 class WolframAlpha(Cog):
   """Get useful information from the Wolfram|Alpha v2.0 API"""
@@ -21,12 +115,91 @@ class WolframAlpha(Cog):
     self.hidden = hidden
     self.suppress = suppress
     self.appid = bot.wolfram_appid
-    self.client = AsyncClient(self.appid)
+
+    path = bot.config["wolfram_cache_path"]
+    self.store = DiskCache(path) if path is not None else None
+    self.client = AsyncClient(
+      self.appid,
+      pool=bot.http_pool,
+      cache=ResultCache(),
+      store=self.store,
+      governor=QuotaGovernor(**bot.config["wolfram_quota"]),
+      lazy=True, # Only the text of each pod is used
+      retention=bot.config["wolfram_retention"],
+      profile=bot.config["wolfram_profile"],
+      policy=RequestPolicy(**bot.config["wolfram_policy"]),
+      breakers=bot.breakers
+    )
+    # Follow-ups of `wolframask` continue the conversation of the same user in the same channel
+    self.conversations = ConversationStore(**bot.config["wolfram_conversations"])
+    # Simple API images are re-encoded before they are uploaded if pillow is installed
+    transcode = bot.config["wolfram_transcode"]
+    self.transcoder = Transcoder(TranscodeOptions(**transcode)) if transcode is not None and TRANSCODE_AVAILABLE else None
+
+  async def cog_unload(self):
+    await self.client.close()
+    if self.transcoder is not None:
+      self.transcoder.close()
+    if self.store is not None:
+      await self.store.aclose()
+
+  def _pod_embed(self, ctx: Context, pod: Pod) -> discord.Embed:
+    return embed_template(
+      self.bot, ctx.author,
+      title=pod.title,
+      description=pod.text,
+      colour=discord.Color.orange()
+    ).set_author(
+      name="Powered by Wolfram|Alpha v2.0 API",
+      url="https://wolframalpha.com/",
+      icon_url=self.bot.user.display_avatar.url
+    )
+
+  def _no_result_embed(self, ctx: Context) -> discord.Embed:
+    return error_template(
+      self.bot, ctx.author,
+      title="Error",
+      description="No result found",
+      colour=discord.Color.orange()
+    ).set_author(
+      name="Powered by Wolfram|Alpha v2.0 API",
+      url="https://wolframalpha.com/",
+      icon_url=self.bot.user.display_avatar.url
+    )
+
+  def _unavailable_embed(self, ctx: Context) -> discord.Embed:
+    return error_template(
+      self.bot, ctx.author,
+      title="Error",
+      description="Wolfram|Alpha is not responding, please try again later",
+      colour=discord.Color.orange()
+    ).set_author(
+      name="Powered by Wolfram|Alpha v2.0 API",
+      url="https://wolframalpha.com/",
+      icon_url=self.bot.user.display_avatar.url
+    )
 
   @command(help="Search up something using the Wolfram|Alpha API")
   async def wolfram(self, ctx: Context, *, text):
-    async with ctx.typing():
-      res = await self.client.full_results_query(text)
+    try:
+      async with ctx.typing():
+        # Slow pods are deferred, so the pods that are ready can be shown right away
+        # Only the first few pods are fetched, the rest are fetched as the user pages forward
+        query = self.client.paged_query(text, page_size=self.bot.config["wolfram_page_size"])
+        res = await query.page(0, priority=Priority.INTERACTIVE, async_pods=True)
+    except BudgetExhausted:
+      embed = error_template(
+        self.bot, ctx.author,
+        title="Error",
+        description="The Wolfram|Alpha query budget for this month has been used up, please try again next month",
+        colour=discord.Color.orange()
+      )
+      await ctx.send(embed=embed)
+      return
+    except (TransportError, CircuitOpen):
+      # Raised once the retries of the request policy are used up, or right away while Wolfram|Alpha is down
+      await ctx.send(embed=self._unavailable_embed(ctx))
+      return
 
     embeds = []
     if res.success:
@@ -60,35 +233,58 @@ class WolframAlpha(Cog):
 
         embeds.append(embed)
 
-      primary = None
+      pages = [Page(embed=embed) for embed in embeds]
+      pages_by_pod: Dict[str, Page] = {}
+
+      def add_pod(pod: Pod):
+        page = pages_by_pod[pod.id] = Page(embed=self._pod_embed(ctx, pod))
+        if pod.primary:
+          pages.insert(1, page)
+        else:
+          pages.append(page)
+
       for pod in res.pods:
         if pod.text:
-          embed = embed_template(
-            self.bot, ctx.author,
-            title=pod.title,
-            description=pod.text,
-            colour=discord.Color.orange()
-          ).set_author(
-            name="Powered by Wolfram|Alpha v2.0 API",
-            url="https://wolframalpha.com/",
-            icon_url=self.bot.user.display_avatar.url
-          )
-          if pod.primary:
-            primary = embed
-          else:
-            embeds.append(embed)
+          add_pod(pod)
 
-      if primary is not None:
-        embeds.insert(1, primary)
+      # Pods that timed out are recalculated while the rest is shown
+      recalculation = self.client.recalculate_in_background(res) if res.recalculate else None
+      deferred = self.client.fetch_deferred(res)
+      try:
+        if not pages:
+          # Nothing is ready yet, so the first pod to arrive is waited for
+          async with ctx.typing():
+            async for pod in deferred:
+              if pod.text:
+                add_pod(pod)
+                break
 
-      paginator = Paginator(
-        pages=[
-          Page(embed=embed) 
-          for embed in embeds
-        ]
-      )
+        if not pages:
+          await ctx.send(embed=self._no_result_embed(ctx))
+          return
+
+        paginator = _PodPaginator(pages, query)
+        await paginator.send_to(ctx)
 
-      await paginator.send_to(ctx)
+        pod_pages = paginator.pod_pages = _PodPages(self, ctx, paginator, pages_by_pod)
+        async for pod in deferred:
+          pod_pages.show(pod)
+          await pod_pages.refresh()
+        await pod_pages.refresh(force=True)
+
+        if recalculation is not None:
+          try:
+            pods = await recalculation
+          except Exception:
+            # The partial answer is still good, e.g. if the budget ran out in the meantime
+            pods = []
+          for pod in pods:
+            pod_pages.show(pod)
+          await pod_pages.refresh(force=True)
+      finally:
+        await deferred.aclose()
+        if recalculation is not None:
+          recalculation.cancel()
 
     elif res.is_fallthrough:
       embed = error_template(
@@ -139,15 +335,87 @@ class WolframAlpha(Cog):
       
     
     else:
+      await ctx.send(embed=self._no_result_embed(ctx))
+
+  @command(name="wolframimage", help="Get the result of something from Wolfram|Alpha as an image")
+  async def wolfram_image(self, ctx: Context, *, text):
+    try:
+      async with ctx.typing():
+        image = await self.client.simple_query(text, priority=Priority.INTERACTIVE)
+        file = None
+        if self.transcoder is not None:
+          try:
+            conversion = await self.transcoder.transcode(image)
+          except Exception:
+            # The image is uploaded as it is instead, the failure is counted by the transcoder
+            log.exception("Failed to transcode a Simple API image")
+          else:
+            file = discord.File(io.BytesIO(conversion.data), conversion.filename)
+        if file is None:
+          file = discord.File(image.open(), "result.gif")
+    except BudgetExhausted:
       embed = error_template(
         self.bot, ctx.author,
         title="Error",
-        description="No result found",
+        description="The Wolfram|Alpha query budget for this month has been used up, please try again next month",
         colour=discord.Color.orange()
-      ).set_author(
-        name="Powered by Wolfram|Alpha v2.0 API",
-        url="https://wolframalpha.com/",
-        icon_url=self.bot.user.display_avatar.url
       )
-      
-      await ctx.send(embed=embed)
\ No newline at end of file
+      await ctx.send(embed=embed)
+      return
+    except InterpretationError:
+      await ctx.send(embed=self._no_result_embed(ctx))
+      return
+    except (TransportError, CircuitOpen):
+      await ctx.send(embed=self._unavailable_embed(ctx))
+      return
+
+    await ctx.send(file=file)
+
+  @command(name="wolframask", help="Ask Wolfram|Alpha something, follow-up questions continue the conversation")
+  async def wolfram_ask(self, ctx: Context, *, text):
+    key = (ctx.author.id, ctx.channel.id)
+    conversation = self.conversations.get(key)
+    try:
+      async with ctx.typing():
+        if conversation is not None:
+          res = await self.client.conversational_followup_query(text, conversation, priority=Priority.INTERACTIVE)
+        else:
+          res = await self.client.conversational_query(text, priority=Priority.INTERACTIVE)
+    except BudgetExhausted:
+      embed = error_template(
+        self.bot, ctx.author,
+        title="Error",
+        description="The Wolfram|Alpha query budget for this month has been used up, please try again next month",
+        colour=discord.Color.orange()
+      )
+      await ctx.send(embed=embed)
+      return
+    except InterpretationError:
+      await ctx.send(embed=self._no_result_embed(ctx))
+      return
+    except (TransportError, CircuitOpen):
+      await ctx.send(embed=self._unavailable_embed(ctx))
+      return
+
+    self.conversations.put(key, res)
+    embed = embed_template(
+      self.bot, ctx.author,
+      title=text,
+      description=res.result,
+      colour=discord.Color.orange()
+    ).set_author(
+      name="Powered by Wolfram|Alpha Conversational API",
+      url="https://wolframalpha.com/",
+      icon_url=self.bot.user.display_avatar.url
+    )
+    await ctx.reply(embed=embed)
+
+  @command(name="wolframforget", help="End your conversation with Wolfram|Alpha in this channel")
+  async def wolfram_forget(self, ctx: Context):
+    ended = self.conversations.pop((ctx.author.id, ctx.channel.id)) is not None
+    embed = embed_template(
+      self.bot, ctx.author,
+      title="Conversation ended" if ended else "No conversation to end",
+      colour=discord.Color.orange()
+    )
+    await ctx.reply(embed=embed)
\ No newline at end of file
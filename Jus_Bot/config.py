@@ -49,6 +49,20 @@ class ConfigDict(typing.TypedDict):
   error_colour: typing.Callable[[], Colour]
   error_handler: ErrorHandler
   error_msg: typing.Dict[ErrorType, typing.List[str]]
+  pool_limit: int
+  pool_limit_per_host: int
+  pool_keepalive_timeout: float
+  pool_dns_ttl: typing.Optional[int]
+  json_loads: typing.Optional[typing.Callable[[bytes], typing.Any]]
+  circuit_breaker: typing.Dict[str, typing.Any]
+  wolfram_cache_path: typing.Optional[str]
+  wolfram_quota: typing.Dict[str, typing.Any]
+  wolfram_retention: str
+  wolfram_page_size: typing.Optional[int]
+  wolfram_profile: typing.Optional[str]
+  wolfram_transcode: typing.Optional[typing.Dict[str, typing.Any]]
+  wolfram_conversations: typing.Dict[str, typing.Any]
+  wolfram_policy: typing.Dict[str, typing.Any]
 
 class SetupConfigDict(typing.TypedDict):
   """Configurations needed to specified to run the bot"""
@@ -70,6 +84,55 @@ DEFAULT_CONFIG_DICT: ConfigDict = {
   "default_colour": Colour.random,
   "error_colour": Colour.brand_red,
   "error_handler": DefaultErrorHandler,
+  "pool_limit": 100,
+  "pool_limit_per_host": 10,
+  "pool_keepalive_timeout": 30.0,
+  "pool_dns_ttl": 300,
+  "json_loads": None,
+  # Options of `breaker.CircuitBreaker`, used for every upstream host
+  "circuit_breaker": {
+    "failure_rate": 0.5,
+    "slow_call": 10.0,
+    "slow_rate": 0.8,
+    "window": 20,
+    "min_calls": 5,
+    "period": 60.0,
+    "open_for": 30.0
+  },
+  "wolfram_cache_path": None,
+  # Options of `wolfram.QuotaGovernor`. The monthly usage is kept in `budget_path`, relative to the
+  # working directory like the setup file, so restarts do not reset it. `None` only keeps it in memory
+  "wolfram_quota": {
+    "rate": 1.0,
+    "burst": 5,
+    "max_concurrency": 4,
+    "monthly_budget": 2000,
+    "budget_path": "wolfram_budget.json"
+  },
+  "wolfram_retention": "compact",
+  "wolfram_page_size": 3,
+  "wolfram_profile": "text-only",
+  # Options of `wolfram.transcode.TranscodeOptions`, `None` uploads Simple API images as they are
+  # Lossy WebP blurs the text of Simple API images without making them much smaller,
+  # optimized PNGs that are quantized once they exceed the target do better
+  "wolfram_transcode": {
+    "format": "png",
+    "quality": 80,
+    "max_width": None,
+    "colors": None,
+    "target_bytes": 512 * 1024
+  },
+  "wolfram_conversations": {
+    "max_entries": 1024,
+    "ttl": 10 * 60
+  },
+  # Options of `wolfram.policy.RequestPolicy`, a user is waiting on every request of the cog
+  "wolfram_policy": {
+    "connect_timeout": 5,
+    "total_timeout": 15,
+    "retries": 2,
+    "hedge": True
+  },
   "error_msg": {
     "default": [
       "Error!",
@@ -0,0 +1,41 @@
+"""
+JSON decoding for API responses
+
+Response bodies are decoded straight from bytes, with orjson if it is installed
+and the standard library otherwise. A different decoder can be plugged in with `set_loads`.
+"""
+from __future__ import annotations
+
+import json
+
+from typing import Any, Callable, Optional, Union
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+Loads = Callable[[Union[bytes, str]], Any]
+
+# `json.loads` detects the encoding of bytes itself, so bodies never need to be decoded to text first
+DEFAULT_LOADS: Loads = orjson.loads if orjson is not None else json.loads
+
+_loads: Loads = DEFAULT_LOADS
+
+def loads(data: Union[bytes, str]) -> Any:
+  """Decodes a JSON document with the current decoder"""
+  return _loads(data)
+
+def set_loads(func: Optional[Loads]):
+  """Sets the decoder used by `loads`, `None` restores the default
+
+  The decoder is given the raw response body as `bytes`.
+  """
+  global _loads
+  _loads = func if func is not None else DEFAULT_LOADS
+
+def backend() -> str:
+  """The name of the current decoder"""
+  if _loads is DEFAULT_LOADS:
+    return "orjson" if orjson is not None else "json"
+  return getattr(_loads, "__module__", None) or repr(_loads)
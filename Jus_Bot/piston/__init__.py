@@ -1 +1 @@
-from .core import get_codeblocks, run_code, process_output
\ No newline at end of file
+from .core import PooledPystonClient, get_codeblocks, run_code, process_output
\ No newline at end of file
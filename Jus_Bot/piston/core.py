@@ -1,17 +1,89 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import typing
 
+from aiohttp import ClientError
 from pyston import File, PystonClient
+from pyston.exceptions import InternalServerError, UnexpectedError
+from pyston.http_handler import HTTP
 
 if typing.TYPE_CHECKING:
   from pyston.models import Output
+  from ..breaker import CircuitBreakers
+  from ..pool import HTTPPool
 
 
 MAX_LEN = 2000
 MAX_LINE = 10
 
+# Failures that count against Piston, errors in the code that was run do not
+FAILURES = (InternalServerError, UnexpectedError, ClientError, asyncio.TimeoutError)
+
+
+
+
+class _PooledHTTP(HTTP):
+  """Pyston's HTTP handler, drawing its session from a `HTTPPool` instead of owning one"""
+
+  def __init__(
+    self,
+    base_url: str,
+    apikey: typing.Optional[str],
+    pool: HTTPPool,
+    breakers: typing.Optional[CircuitBreakers] = None
+  ):
+    self._pool = pool
+    self._breakers = breakers
+    super().__init__(base_url, apikey)
+
+  def _setup(self):
+    self._session = self._pool.session("piston", headers=self._headers)
+
+  async def get_response(self, method: str, endpoint: str, data: typing.Optional[str] = None):
+    if self._breakers is None:
+      return await super().get_response(method, endpoint, data)
+    # Raises `CircuitOpen` right away while Piston is down
+    with self._breakers.for_url(self.BASE_URL).guard(FAILURES):
+      return await super().get_response(method, endpoint, data)
+
+  async def close(self):
+    # The session belongs to the pool, which closes it on shutdown
+    pass
+
+  def __del__(self):
+    pass
+
+class PooledPystonClient(PystonClient):
+  """A `PystonClient` that reuses connections from the bot's `HTTPPool`
+
+  `PystonClient.__init__` is not called, as it creates pyston's own HTTP handler,
+  which opens a session of its own that would only be closed when it is garbage collected.
+  The attributes it sets are set here instead.
+
+  Unlike pyston's handler, which turns off TLS verification for every request,
+  requests go through the pool's connector and the certificate of the Piston host is verified.
+
+  Parameters
+  ----------
+  pool: :class:`~Jus_Bot.pool.HTTPPool`
+    The connection pool to draw the session from
+  breakers: Optional[:class:`~Jus_Bot.breaker.CircuitBreakers`]
+    The circuit breakers of the hosts requests are sent to, if any
+  """
+
+  def __init__(
+    self,
+    pool: HTTPPool,
+    api_key: typing.Optional[str] = None,
+    base_url: typing.Optional[str] = PystonClient.BASE_URL,
+    breakers: typing.Optional[CircuitBreakers] = None
+  ):
+    # The attributes of `PystonClient.__init__`, with a pooled handler
+    self.base_url = base_url
+    self._http_session = _PooledHTTP(self.base_url, api_key, pool, breakers)
+    self._runtimes = None
 
 
 
@@ -19,8 +91,13 @@ def get_codeblocks(code: str) -> typing.List[typing.Tuple[str, str]]:
   codeblocks = re.findall(r"```([a-zA-Z0-9]*)\s([\s\S(^\\`{3})]*?)\s*```", code)
   return codeblocks
 
-async def run_code(lang: str, code: str, filename: str = None) -> Output:
-  client = PystonClient()
+async def run_code(
+  lang: str,
+  code: str,
+  filename: str = None,
+  client: typing.Optional[PystonClient] = None
+) -> Output:
+  client = client or PystonClient()
   code = [File(code, filename=filename)]
   output = await client.execute(
     lang.lower(),
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Optional
+
+import aiohttp
+
+class HTTPPool:
+  """
+  A connection pool hub shared by every HTTP client of the bot
+
+  All sessions handed out by the hub are bound to a single `aiohttp.TCPConnector`,
+  so connections, keep-alive and the DNS cache are reused across the wolfram, quotes
+  and piston clients instead of each request doing its own handshake.
+
+  Parameters
+  ----------
+  limit: :class:`int`
+    The total number of simultaneous connections. Defaults to `100`
+  limit_per_host: :class:`int`
+    The number of simultaneous connections to a single host. Defaults to `10`
+  keepalive_timeout: :class:`float`
+    How long an idle connection is kept alive, in seconds. Defaults to `30`
+  dns_ttl: Optional[:class:`int`]
+    How long resolved addresses are cached, in seconds. `None` caches them forever.
+    Defaults to `300`
+  """
+
+  def __init__(
+    self,
+    limit: int = 100,
+    limit_per_host: int = 10,
+    keepalive_timeout: float = 30.0,
+    dns_ttl: Optional[int] = 300
+  ):
+    self.limit = limit
+    self.limit_per_host = limit_per_host
+    self.keepalive_timeout = keepalive_timeout
+    self.dns_ttl = dns_ttl
+
+    self._connector: Optional[aiohttp.TCPConnector] = None
+    self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    self.hits: Counter = Counter()
+    self.misses: Counter = Counter()
+    self.dns_hits = 0
+    self.dns_misses = 0
+
+  def _trace_config(self, name: str) -> aiohttp.TraceConfig:
+    """Creates the trace config used to count pool hits and misses for a session"""
+    async def on_reuse(session, context, params):
+      self.hits[name] += 1
+
+    async def on_create(session, context, params):
+      self.misses[name] += 1
+
+    async def on_dns_hit(session, context, params):
+      self.dns_hits += 1
+
+    async def on_dns_miss(session, context, params):
+      self.dns_misses += 1
+
+    trace = aiohttp.TraceConfig()
+    trace.on_connection_reuseconn.append(on_reuse)
+    trace.on_connection_create_end.append(on_create)
+    trace.on_dns_cache_hit.append(on_dns_hit)
+    trace.on_dns_cache_miss.append(on_dns_miss)
+    return trace
+
+  @property
+  def closed(self) -> bool:
+    """Whether the pool has been closed or not started yet"""
+    return self._connector is None or self._connector.closed
+
+  @property
+  def connector(self) -> aiohttp.TCPConnector:
+    """The connector shared by every session, created on first use"""
+    if self.closed:
+      self._connector = aiohttp.TCPConnector(
+        limit=self.limit,
+        limit_per_host=self.limit_per_host,
+        keepalive_timeout=self.keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=self.dns_ttl
+      )
+      self._sessions.clear()
+    return self._connector
+
+  def session(self, name: str, **kwargs) -> aiohttp.ClientSession:
+    """Gets the session registered under `name`, creating it if needed
+
+    Sessions only differ in their default headers and other options passed in
+    `kwargs`, they all draw connections from the same pool. Note that `kwargs`
+    are only used when the session is first created.
+    """
+    session = self._sessions.get(name)
+    if session is None or session.closed:
+      session = aiohttp.ClientSession(
+        connector=self.connector,
+        connector_owner=False,
+        trace_configs=[self._trace_config(name)],
+        **kwargs
+      )
+      self._sessions[name] = session
+    return session
+
+  @property
+  def stats(self) -> Dict[str, int]:
+    """The pool counters, summed over every session"""
+    return {
+      "hits": sum(self.hits.values()),
+      "misses": sum(self.misses.values()),
+      "dns_hits": self.dns_hits,
+      "dns_misses": self.dns_misses,
+      "sessions": len(self._sessions)
+    }
+
+  async def close(self):
+    """|coro|
+
+    Closes every session as well as the shared connector
+    """
+    for session in self._sessions.values():
+      await session.close()
+    self._sessions.clear()
+    if self._connector is not None:
+      await self._connector.close()
+      self._connector = None
@@ -1,10 +1,28 @@
-from aiohttp import ClientSession
+from __future__ import annotations
 
+import asyncio
+
+from aiohttp import ClientError, ClientResponse, ClientSession
+
+from ..jsonlib import loads
 from .models import Quote, QuoteResponse, Response
 from .exceptions import RateLimitExceeded, UnknownError
 
 import typing
 
+if typing.TYPE_CHECKING:
+  from ..breaker import CircuitBreakers
+  from ..pool import HTTPPool
+
+# Failures that count against quotes.rest, a rate limit only means this bot asked too often
+FAILURES = (UnknownError, ClientError, asyncio.TimeoutError)
+
+def _error_message(data: typing.Any, default: str) -> str:
+  try:
+    return data["error"]["message"]
+  except (TypeError, KeyError):
+    return default
+
 class QODClient:
 
   BASE_URL = "https://quotes.rest/qod"
@@ -13,19 +31,42 @@ class QODClient:
     "languages"
   )
 
-  def __init__(self):
+  def __init__(self, pool: typing.Optional[HTTPPool] = None, breakers: typing.Optional[CircuitBreakers] = None):
     self._categories: list = None
     self._languages: list = None
+    self._pool = pool
+    self._breakers = breakers
+
+  async def _read_response(self, res: ClientResponse) -> Response:
+    body = await res.read()
+    try:
+      data = loads(body)
+    except ValueError:
+      # e.g. the HTML page of a proxy in front of quotes.rest
+      data = None
+
+    if res.status == 429:
+      raise RateLimitExceeded(_error_message(data, "Too many requests"))
+    elif res.status != 200:
+      raise UnknownError(_error_message(data, f"quotes.rest responded with status {res.status}"))
+    elif data is None:
+      raise UnknownError("quotes.rest sent a response that is not JSON")
+    return data
 
   async def _get_response(self, url: str) -> Response:
+    if self._breakers is not None:
+      # Raises `CircuitOpen` right away while quotes.rest is down
+      with self._breakers.for_url(url).guard(FAILURES):
+        return await self._send(url)
+    return await self._send(url)
+
+  async def _send(self, url: str) -> Response:
+    if self._pool is not None:
+      async with self._pool.session("quotes").get(url) as res:
+        return await self._read_response(res)
     async with ClientSession() as session:
       async with session.get(url) as res:
-        data: Response = await res.json()
-        if res.status == 429:
-          raise RateLimitExceeded(data["error"]["message"])
-        elif res.status != 200:
-          raise UnknownError(data["error"]["message"])
-    return data
+        return await self._read_response(res)
 
   async def qod(self, language: str = "en", category: typing.Optional[str] = None) -> Quote:
     url = f"{self.BASE_URL}?language={language}"
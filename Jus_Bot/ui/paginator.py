@@ -4,7 +4,7 @@ from .pages import Page
 from ..utils import embed_template
 from .interface import Interface, InterfaceView
 
-from typing import List, Union
+from typing import List, Optional, Union
 
 import discord
 
@@ -47,6 +47,7 @@ class _PageSelect(InterfaceView):
     page = int(select.values[0])
     self.parent._current_page = page
     self.parent.set_view(self.parent.default_view)
+    await self.parent.on_page_change(interaction)
     await self.parent.update(interaction)
 
   @discord.ui.button(label="Close", style=discord.ButtonStyle.danger, emoji=EMOJIS["stop"], row=ROW["stop"])
@@ -66,11 +67,13 @@ class PaginatorView(InterfaceView):
   @discord.ui.button(style=discord.ButtonStyle.primary, emoji=EMOJIS["start"], row=ROW["start"])
   async def start_button(self, interaction: discord.Interaction, button: discord.ui.Button):
     self.parent._current_page = 0
+    await self.parent.on_page_change(interaction)
     await self.parent.update(interaction)
 
   @discord.ui.button(style=discord.ButtonStyle.primary, emoji=EMOJIS["back"], row=ROW["back"])
   async def back_button(self, interaction: discord.Interaction, button: discord.ui.Button):
     self.parent._current_page -= 1
+    await self.parent.on_page_change(interaction)
     await self.parent.update(interaction)
 
   @discord.ui.button(style=discord.ButtonStyle.secondary, emoji=EMOJIS["page"], row=ROW["page"])
@@ -100,11 +103,13 @@ class PaginatorView(InterfaceView):
   @discord.ui.button(style=discord.ButtonStyle.primary, emoji=EMOJIS["forward"], row=ROW["forward"])
   async def forward_button(self, interaction: discord.Interaction, button: discord.ui.Button):
     self.parent._current_page += 1
+    await self.parent.on_page_change(interaction)
     await self.parent.update(interaction)
 
   @discord.ui.button(style=discord.ButtonStyle.primary, emoji=EMOJIS["end"], row=ROW["end"])
   async def end_button(self, interaction: discord.Interaction, button: discord.ui.Button):
     self.parent._current_page = self.parent.page_count - 1
+    await self.parent.on_page_change(interaction)
     await self.parent.update(interaction)
 
   @discord.ui.button(label="Close", style=discord.ButtonStyle.danger, emoji=EMOJIS["stop"], row=ROW["stop"])
@@ -120,6 +125,8 @@ class Paginator(Interface):
   """
   view: Union[_PageSelect, PaginatorView]
   max_size = 2000
+  # Whether pages can still be added after the last page, which keeps the forward buttons enabled
+  more_pages = False
 
   def __init__(self, pages: List[Page], **options):
     # NOTE: This is to fix a potential issue for the page browser
@@ -139,12 +146,33 @@ class Paginator(Interface):
 
     super().__init__(custom_view=custom_view, **options)
 
+  async def on_page_change(self, interaction: discord.Interaction):
+    """Called when the user changes the page, before the message is updated.
+    This can be overridden in subclasses to add pages on demand, the page the user
+    asked for may be past the last page until then
+    """
+
   def _check(self, page: Page, page_index: int):
     if not isinstance(page, Page):
       raise TypeError(f"Page {page_index+1} is not a 'Page' type")
     elif len(page) > self.max_size:
       raise ValueError(f"Page {page_index+1} exceeds the size limit of 2000 characters")
 
+  def add_page(self, page: Page, index: Optional[int] = None):
+    """Adds a page to the end of the paginator, or before `index` if given.
+    The current page stays the same, call `update` to show the new page count
+    """
+    if self.page_count >= 25:
+      raise ValueError("Number of pages exceeds 25")
+    self._check(page, self.page_count if index is None else index)
+
+    if index is None:
+      self._pages.append(page)
+    else:
+      self._pages.insert(index, page)
+      if index <= self._current_page:
+        self._current_page += 1
+
   @property
   def pages(self):
     """Returns a list of pages"""
@@ -169,14 +197,14 @@ class Paginator(Interface):
   @property
   def kwargs(self):
     if self.view == self.default_view:
-      self.view.page_button.label = f"{self.current_page+1}/{self.page_count}"
+      self.view.page_button.label = f"{self.current_page+1}/{self.page_count}{'+' if self.more_pages else ''}"
 
       self.view.enable_all()
 
       if self.current_page == 0:
         self.view.start_button.disabled = True
         self.view.back_button.disabled = True
-      if self.current_page == self.page_count - 1:
+      if self.current_page == self.page_count - 1 and not self.more_pages:
         self.view.forward_button.disabled = True
         self.view.end_button.disabled = True
       if self.page_count == 1:
@@ -1,12 +1,30 @@
+from .bulk import BulkQuery, BulkResult
+from .cache import ResultCache
 from .client import Client, AsyncClient
-from .params import Bool, LatLong, Units
+from .conversations import Conversation, ConversationStore
+from .models import Retention
+from .store import DiskCache
+from .ratelimit import Priority, QuotaGovernor
+from .params import Bool, LatLong, Profile, Units
+from .policy import RequestPolicy
 from . import api
 
 __all__ = (
   Client,
   AsyncClient,
+  BulkQuery,
+  BulkResult,
+  ResultCache,
+  Conversation,
+  ConversationStore,
+  DiskCache,
+  QuotaGovernor,
+  RequestPolicy,
+  Priority,
+  Retention,
   api,
   Bool,
   LatLong,
+  Profile,
   Units
 )
\ No newline at end of file
@@ -1,159 +1,146 @@
 from __future__ import annotations
 
-from .exceptions import InterpretationError, MissingParameters, InvalidAppID, WolframException
-from .models import ConversationalResults, FullResults, Model, SimpleImage
+from ..jsonlib import loads
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from .exceptions import InterpretationError, MissingParameters, InvalidAppID, ServerError, WolframException
+from .models import ConversationalResults, FullResults, Model, Pod, SimpleImage
+from .schema import decode_full_results, typed_decoding_enabled
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
 
 if TYPE_CHECKING:
-  from requests import Response
-  from aiohttp import ClientResponse
+  from .spool import SpooledBuffer
+  from .transport import Response
 
 class API:
   VERSION: int
   ENDPOINT: str
   PARAMS: Dict[str, str] = {}
-
-  def format_results(resp: Response):
+  # The parameter that holds the input string
+  INPUT: str = "i"
+  # How long results are kept by a `ResultCache`, in seconds. `None` disables caching
+  CACHE_TTL: Optional[float] = None
+  # Whether raw responses can be kept by a `DiskCache`, and for how long
+  PERSIST: bool = False
+  PERSIST_TTL: Optional[float] = None
+  # Whether the body is streamed into a `SpooledBuffer` instead of being read whole
+  STREAMED: bool = False
+  # Whether identical in-flight requests can share one response
+  COALESCE: bool = True
+
+  def cacheable(result: Any) -> bool:
+    """Whether a result can be cached"""
+    return True
+
+  def parse(data: bytes):
+    """Constructs a result from a raw response body"""
     raise NotImplementedError
 
-  async def async_format_results(resp: ClientResponse):
-    raise NotImplementedError
+def check_status(resp: Response):
+  """Raises the exception of an error status, this is the same for every API
+
+  The FullResults API reports errors in the body instead, with a 200 status.
+  """
+  if resp.status == 501:
+    raise InterpretationError("input was unable to be interpreted by the API")
+  elif resp.status == 400:
+    raise MissingParameters("input parameter was not found")
+  elif resp.status == 403:
+    # In this case it is likely an invalid app id
+    if resp.text == "Error 1: Invalid appid":
+      raise InvalidAppID("App ID was invalid")
+    else:
+      raise WolframException(resp.text) # This should not happen
+  elif resp.status >= 500:
+    # Raised like transport errors, as Wolfram|Alpha is unavailable either way
+    raise ServerError(f"request failed with status {resp.status}")
+  elif resp.status >= 400:
+    raise WolframException(f"request failed with status {resp.status}")
+
+def handle_response(api: Type[API], resp: Response) -> Any:
+  """Constructs the result of an API from a response, raising for error statuses"""
+  check_status(resp)
+  return api.parse(resp.body)
 
 
 
 class FullResultsAPI(API):
   VERSION = 2
   ENDPOINT = "query"
+  INPUT = "input"
   PARAMS = {
     "output": "json"
   }
+  CACHE_TTL = 15 * 60
+  PERSIST = True
+  PERSIST_TTL = 6 * 60 * 60
+
+  def cacheable(result: FullResults) -> bool:
+    # Errors are usually caused by the app id, and should not stick around.
+    # The urls of deferred pods and recalculations expire, so `async` and partial results are not kept either.
+    # A partial result would also be recalculated again on every hit
+    return not result.is_error and not result.deferred and not result.recalculate
 
-  def format_results(resp: Response) -> FullResults:
-    raw = resp.json()
-    return FullResults.from_dict(raw["queryresult"])
+  def query_result(data: bytes):
+    """Decodes the `queryresult` of a response body, into a typed struct inside a `typed_decoding` block"""
+    if typed_decoding_enabled():
+      return decode_full_results(data)
+    return loads(data)["queryresult"]
 
-  async def async_format_results(resp: ClientResponse) -> FullResults:
-    raw = await resp.json()
-    return FullResults.from_dict(raw["queryresult"])
+  def parse(data: bytes) -> FullResults:
+    return FullResults.from_dict(FullResultsAPI.query_result(data))
+
+  def parse_pod(data: bytes) -> Pod:
+    """Constructs a deferred pod from the response to its `async` url"""
+    raw = loads(data)
+    raw = raw.get("queryresult", raw)
+    if "pods" in raw:
+      raw = raw["pods"][0]
+    return Pod.from_dict(raw)
 
 
 
 class SimpleAPI(API):
   VERSION = 1
   ENDPOINT = "simple"
+  CACHE_TTL = 15 * 60
+  PERSIST = True
+  PERSIST_TTL = 6 * 60 * 60
+  STREAMED = True
 
-  def format_results(resp: Response) -> SimpleImage:
-    if resp.status_code == 501:
-      raise InterpretationError("input was unable to be interpreted by the API")
-    elif resp.status_code == 400:
-      raise MissingParameters("input parameter was not found")
-    elif resp.status_code == 403:
-      # In this case it is likely an invalid app id
-      if resp.text == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(resp.text) # This should not happen
-
-    return SimpleImage(resp.content)
-
-  async def async_format_results(resp: ClientResponse) -> SimpleImage:
-    if resp.status == 501:
-      raise InterpretationError("input was unable to be interpreted by the API")
-    elif resp.status == 400:
-      raise MissingParameters("input parameter was not found")
-    elif resp.status == 403:
-      # In this case it is likely an invalid app id
-      if await resp.text() == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(await resp.text()) # This should not happen
-
-    return SimpleImage(await resp.read())
+  def parse(data: Union[bytes, SpooledBuffer]) -> SimpleImage:
+    return SimpleImage(data)
 
 
 
 class ShortAPI(API):
   VERSION = 1
   ENDPOINT = "result"
+  CACHE_TTL = 15 * 60
 
-  def format_results(resp: Response) -> str:
-    if resp.status_code == 501:
-      raise InterpretationError("input was unable to be interpreted by the API")
-    elif resp.status_code == 400:
-      raise MissingParameters("input parameter was not found")
-    elif resp.status_code == 403:
-      # In this case it is likely an invalid app id
-      if resp.text == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(resp.text) # This should not happen
-
-    return resp.text
-
-  async def async_format_results(resp: ClientResponse) -> str:
-    if resp.status == 501:
-      raise InterpretationError("input was unable to be interpreted by the API")
-    elif resp.status == 400:
-      raise MissingParameters("input parameter was not found")
-    elif resp.status == 403:
-      # In this case it is likely an invalid app id
-      if await resp.text() == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(await resp.text()) # This should not happen
-
-    return await resp.text()
+  def parse(data: bytes) -> str:
+    return data.decode("utf-8")
 
 
 
 class SpokenAPI(API):
   VERSION = 1
   ENDPOINT = "spoken"
+  CACHE_TTL = 15 * 60
 
-  def format_results(resp: Response) -> str:
-    if resp.status_code == 501:
-      raise InterpretationError("input was unable to be interpreted by the API")
-    elif resp.status_code == 400:
-      raise MissingParameters("input parameter was not found")
-    elif resp.status_code == 403:
-      # In this case it is likely an invalid app id
-      if resp.text == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(resp.text) # This should not happen
-
-    return resp.text
-
-  async def async_format_results(resp: ClientResponse) -> str:
-    if resp.status == 501:
-      raise InterpretationError("input was unable to be interpreted by the API")
-    elif resp.status == 400:
-      raise MissingParameters("input parameter was not found")
-    elif resp.status == 403:
-      # In this case it is likely an invalid app id
-      if await resp.text == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(await resp.text) # This should not happen
-
-    return await resp.text()
+  def parse(data: bytes) -> str:
+    return data.decode("utf-8")
 
 
 
 class ConversationalAPI(API):
   VERSION = 1
   ENDPOINT = "conversation.jsp"
+  # Every result starts its own conversation on the server, so it is never shared between callers
+  COALESCE = False
 
-  def format_results(resp: Response) -> ConversationalResults:
-    if resp.status_code == 403:
-      # In this case it is likely an invalid app id
-      if resp.text == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(resp.text) # This should not happen
-
-    raw = resp.json()
+  def parse(data: bytes) -> ConversationalResults:
+    raw = loads(data)
 
     if raw.get("conversationID") is None: # This is a little bit of hard coding, might be reworked
       error = raw.get("error")
@@ -165,14 +152,3 @@ class ConversationalAPI(API):
         raise WolframException(error) # Worse case scenario
     else:
       return ConversationalResults.from_dict(raw)
-
-  async def async_format_results(resp: ClientResponse) -> ConversationalResults:
-    if resp.status == 403:
-      # In this case it is likely an invalid app id
-      if await resp.text == "Error 1: Invalid appid":
-        raise InvalidAppID("App ID was invalid")
-      else:
-        raise WolframException(await resp.text) # This should not happen
-
-    raw = await resp.json()
-    return ConversationalResults.from_dict(raw)
\ No newline at end of file
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+
+from typing import (
+  TYPE_CHECKING,
+  Any,
+  AsyncIterator,
+  Callable,
+  Generator,
+  Iterable,
+  List,
+  NamedTuple,
+  Optional
+)
+
+from .ratelimit import Priority
+
+if TYPE_CHECKING:
+  from .api import API
+  from .client import AsyncClient
+
+log = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], Any]
+
+class BulkResult(NamedTuple):
+  """The outcome of a single query in a bulk query"""
+  index: int
+  input: str
+  result: Any = None
+  error: Optional[BaseException] = None
+
+  @property
+  def ok(self) -> bool:
+    """Whether the query succeeded"""
+    return self.error is None
+
+class BulkQuery:
+  """
+  Runs many queries with bounded concurrency, not meant to be created directly
+
+  Iterating over it with `async for` yields each :class:`BulkResult` as soon
+  as it completes, while awaiting it returns every result in input order.
+  Errors are captured per query instead of aborting the batch.
+
+  Parameters
+  ----------
+  client: :class:`~wolfram.AsyncClient`
+    The client to send the queries with.
+  inputs: Iterable[`str`]
+    The input strings to query.
+  api: Type[:class:`~wolfram.api.API`]
+    The API to query.
+  concurrency: :class:`int`
+    The maximum number of queries in flight.
+  progress: Optional[Callable[[:class:`int`, :class:`int`], Any]]
+    Called with the number of finished queries and the total after every query,
+    can be a coroutine function. Errors raised by it are logged, and do not stop the batch.
+  priority: :class:`int`
+    The priority every query is admitted with by the governor.
+  params:
+    The other parameters passed to every query.
+  """
+
+  def __init__(
+    self,
+    client: AsyncClient,
+    inputs: Iterable[str],
+    api: API,
+    concurrency: int,
+    progress: Optional[ProgressCallback],
+    params: dict,
+    priority: int = Priority.BACKGROUND
+  ):
+    if concurrency < 1:
+      raise ValueError("concurrency must be at least 1")
+    self.client = client
+    self.inputs: List[str] = list(inputs)
+    self.api = api
+    self.concurrency = concurrency
+    self.progress = progress
+    self.params = params
+    self.priority = priority
+
+    self.done = 0
+    self._queue: Optional[asyncio.Queue] = None
+    self._workers: List[asyncio.Task] = []
+    self._cancelled = False
+
+  @property
+  def total(self) -> int:
+    """The number of queries in the batch"""
+    return len(self.inputs)
+
+  @property
+  def started(self) -> bool:
+    return self._queue is not None
+
+  @property
+  def finished(self) -> bool:
+    """Whether every query has completed"""
+    return self.done == self.total
+
+  def _start(self):
+    if self.started:
+      raise RuntimeError("bulk query can only be consumed once")
+    self._queue = asyncio.Queue()
+    if self._cancelled:
+      # Cancelled before it was consumed, so no query is sent
+      self._queue.put_nowait(None)
+      return
+    pending = iter(enumerate(self.inputs))
+    workers = min(self.concurrency, self.total)
+    self._workers = [asyncio.ensure_future(self._worker(pending)) for _ in range(workers)]
+    if not self._workers:
+      self._queue.put_nowait(None)
+
+  async def _worker(self, pending):
+    for index, text in pending:
+      try:
+        result = await self.client.query(self.api, priority=self.priority, **{self.api.INPUT: text}, **self.params)
+      except asyncio.CancelledError:
+        raise
+      except Exception as e:
+        item = BulkResult(index, text, error=e)
+      else:
+        item = BulkResult(index, text, result=result)
+
+      self.done += 1
+      self._queue.put_nowait(item)
+      if self.done == self.total:
+        self._queue.put_nowait(None)
+
+      if self.progress is not None:
+        await self._report_progress()
+
+  async def _report_progress(self):
+    try:
+      ret = self.progress(self.done, self.total)
+      if inspect.isawaitable(ret):
+        await ret
+    except asyncio.CancelledError:
+      raise
+    except Exception:
+      # A worker that died here would leave the rest of the batch waiting forever
+      log.exception("Progress callback of a bulk query failed")
+
+  def cancel(self):
+    """Cancels the queries that have not completed yet"""
+    if self._cancelled:
+      return
+    self._cancelled = True
+    for worker in self._workers:
+      worker.cancel()
+    if self._queue is not None and not self.finished:
+      self._queue.put_nowait(None)
+
+  async def __aiter__(self) -> AsyncIterator[BulkResult]:
+    self._start()
+    try:
+      while True:
+        item = await self._queue.get()
+        if item is None:
+          break
+        yield item
+    finally:
+      # The consumer stopped early or was cancelled, the rest is not needed anymore
+      if not self.finished:
+        self.cancel()
+
+  async def gather(self) -> List[BulkResult]:
+    """|coro|
+
+    Waits for every query, returning their results in input order
+
+    Raises
+    ------
+    asyncio.CancelledError
+      The bulk query was cancelled before every query completed.
+    """
+    results: List[Optional[BulkResult]] = [None] * self.total
+    async for item in self:
+      results[item.index] = item
+    if not self.finished:
+      raise asyncio.CancelledError("bulk query was cancelled")
+    return results
+
+  def __await__(self) -> Generator[Any, None, List[BulkResult]]:
+    return self.gather().__await__()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Mapping, NamedTuple, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+  from .api import API
+
+class _Missing:
+  def __repr__(self):
+    return "MISSING"
+
+MISSING: Any = _Missing()
+
+# Parameters that hold the free-form query text for each API
+INPUT_PARAMS = ("input", "i")
+
+def normalize_input(text: str, ignorecase: bool = False) -> str:
+  """Normalizes query text so that trivially different queries share a cache entry
+
+  Wolfram|Alpha is case sensitive, e.g. "Mg" and "mg" differ, so case is only
+  folded for queries sent with `ignorecase`.
+  """
+  text = " ".join(str(text).split())
+  return text.casefold() if ignorecase else text
+
+def make_key(api: Type[API], url: Optional[str], params: Mapping[str, Any]) -> Tuple:
+  """Creates the cache key of a query from its API, base url and every parameter"""
+  ignorecase = str(params.get("ignorecase", "")).lower() == "true"
+  items = []
+  for k, v in params.items():
+    if k in INPUT_PARAMS:
+      v = normalize_input(v, ignorecase)
+    else:
+      v = str(v)
+    items.append((k, v))
+  return (api.VERSION, api.ENDPOINT, url, tuple(sorted(items)))
+
+class CacheEntry(NamedTuple):
+  value: Any
+  size: int
+  expires: float
+
+class ResultCache:
+  """
+  A bounded in-memory cache of API results
+
+  Entries expire after a per-API time to live and the least recently
+  used entries are evicted once either the entry or the byte limit is exceeded.
+
+  Parameters
+  ----------
+  max_entries: :class:`int`
+    The maximum number of entries held by the cache. Defaults to `512`
+  max_bytes: :class:`int`
+    The maximum total size of the cached responses, in bytes. Defaults to 16 MiB
+  ttls: Optional[Mapping[Type[:class:`~wolfram.api.API`], :class:`float`]]
+    The time to live of entries, in seconds, by API. APIs that are not
+    specified use their `CACHE_TTL`, and are not cached if that is `None`
+  """
+
+  def __init__(
+    self,
+    max_entries: int = 512,
+    max_bytes: int = 16 * 1024 * 1024,
+    ttls: Optional[Mapping[Type[API], float]] = None
+  ):
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self.ttls: Dict[Type[API], Optional[float]] = dict(ttls or {})
+
+    self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+    self._bytes = 0
+    self._lock = Lock()
+
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.expirations = 0
+
+  def __len__(self):
+    return len(self._entries)
+
+  def __contains__(self, key: Hashable):
+    return self.get(key, touch=False) is not MISSING
+
+  @property
+  def size(self) -> int:
+    """The total size of the cached responses, in bytes"""
+    return self._bytes
+
+  @property
+  def stats(self) -> Dict[str, int]:
+    """The cache counters"""
+    return {
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "expirations": self.expirations,
+      "entries": len(self._entries),
+      "bytes": self._bytes
+    }
+
+  def ttl_for(self, api: Type[API]) -> Optional[float]:
+    """Gets the time to live of entries for an API, `None` if it should not be cached"""
+    return self.ttls.get(api, api.CACHE_TTL)
+
+  def _remove(self, key: Hashable):
+    entry = self._entries.pop(key)
+    self._bytes -= entry.size
+
+  def get(self, key: Hashable, *, touch: bool = True) -> Any:
+    """Gets a cached value, or `MISSING` if there is no live entry for the key"""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry.expires <= monotonic():
+        self._remove(key)
+        self.expirations += 1
+        entry = None
+
+      if not touch:
+        return MISSING if entry is None else entry.value
+
+      if entry is None:
+        self.misses += 1
+        return MISSING
+
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return entry.value
+
+  def put(self, key: Hashable, value: Any, size: int, ttl: float):
+    """Caches a value, evicting the least recently used entries if needed
+
+    Values larger than `max_bytes` are never cached.
+    """
+    if size > self.max_bytes:
+      return
+    with self._lock:
+      if key in self._entries:
+        self._remove(key)
+      self._entries[key] = CacheEntry(value, size, monotonic() + ttl)
+      self._bytes += size
+
+      while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+        oldest = next(iter(self._entries))
+        self._remove(oldest)
+        self.evictions += 1
+
+  def invalidate(self, key: Hashable):
+    """Removes an entry from the cache, if present"""
+    with self._lock:
+      if key in self._entries:
+        self._remove(key)
+
+  def clear(self):
+    """Removes every entry from the cache"""
+    with self._lock:
+      self._entries.clear()
+      self._bytes = 0
@@ -1,22 +1,82 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Sequence, overload
+import asyncio
+
+from contextlib import contextmanager, nullcontext
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Type, Union, overload
+from weakref import WeakSet
 from urllib.parse import urlencode
 
-from .api import API, ConversationalAPI, FullResultsAPI, ShortAPI, SimpleAPI, SpokenAPI
-from .exceptions import MissingParameters, ParameterConflict
-from .params import Units
+from .api import API, ConversationalAPI, FullResultsAPI, ShortAPI, SimpleAPI, SpokenAPI, check_status, handle_response
+from .bulk import BulkQuery
+from .paging import PagedQuery
+from .cache import MISSING, make_key
+from .exceptions import BudgetExhausted, MissingParameters, ParameterConflict, TransportError
+from .models import Retention, lazy_models, retain_raw
+from .params import PROFILE_PARAMS, Profile, Units
+from .policy import RequestPolicy
+from .ratelimit import Priority
+from .schema import AVAILABLE as TYPED_AVAILABLE, typed_decoding
+from .spool import SpooledBuffer
+from .transport import AiohttpTransport, RequestsTransport, Response, Timeout, Transport
+from ..breaker import CircuitBreaker, CircuitOpen
 
 if TYPE_CHECKING:
-  from .models import FullResults, ConversationalResults, SimpleImage
+  from .models import FullResults, ConversationalResults, Pod, SimpleImage
+  from .conversations import Conversation
   from .params import Bool, LatLong
+  from typing import Any, Hashable
+  from .bulk import ProgressCallback
+  from .cache import ResultCache
+  from .ratelimit import QuotaGovernor
+  from .store import DiskCache
+  from ..breaker import CircuitBreakers
+  from ..pool import HTTPPool
 
-import aiohttp
-import requests
+# Attempts that are refused instead of being sent, which end the retries of a request.
+# The breaker of the host is checked again before every retry, so retries stop once it opens
+REFUSED = (BudgetExhausted, CircuitOpen)
 
 
 class ClientBase:
-  """The base class of Clients"""
+  """The base class of Clients
+
+  Parameters
+  ----------
+  appid: `str`
+    The App ID to query the APIs with.
+  cache: Optional[:class:`~wolfram.cache.ResultCache`]
+    The cache to keep results in. If not given, results are not cached.
+  store: Optional[:class:`~wolfram.store.DiskCache`]
+    The persistent cache to keep raw responses in, checked after `cache`.
+  governor: Optional[:class:`~wolfram.ratelimit.QuotaGovernor`]
+    The rate limiter that requests have to pass through. Cached results are not limited.
+  lazy: `bool`
+    Whether results are decoded lazily, constructing nested models only when they are
+    first accessed. Defaults to `False`.
+  retention: Union[:class:`~wolfram.models.Retention`, `str`]
+    How much of the raw response every model keeps, one of `keep`, `drop` or `compact`.
+    Dropping it roughly halves the memory held by cached results, at the cost of
+    `Model.raw` being rebuilt from the fields. Defaults to `keep`.
+  typed: `bool`
+    Whether FullResults responses are decoded and validated into the structs generated from
+    `types.py` before the models are constructed, which requires msgspec. Keys that are not
+    described in `types.py` are not kept. Defaults to `False`.
+  profile: Optional[Union[:class:`~wolfram.Profile`, `str`]]
+    The request profile of FullResults queries, which decides how much of every pod is sent.
+    If not given, the API sends its default formats.
+  transport: Optional[:class:`~wolfram.transport.Transport`]
+    The transport to send requests with. If not given, the client creates its default one
+    and closes it along with the client.
+  policy: Optional[:class:`~wolfram.policy.RequestPolicy`]
+    How requests are timed out, retried and hedged. Every API gets a copy of it,
+    so that hedging follows the latencies of that API. If not given, the default policy is used.
+  policies: Optional[Mapping[Type[:class:`~wolfram.api.API`], :class:`~wolfram.policy.RequestPolicy`]]
+    The policies of specific APIs, used instead of `policy`.
+  breakers: Optional[:class:`~Jus_Bot.breaker.CircuitBreakers`]
+    The circuit breakers of the hosts requests are sent to. While the breaker of a host is open,
+    queries that are not cached raise :class:`~Jus_Bot.breaker.CircuitOpen` right away.
+  """
   BASE_URL = "https://api.wolframalpha.com/"
 
   API_VERSION = {
@@ -24,42 +84,282 @@ class ClientBase:
     2: "v2/"
   }
 
-  def __init__(self, appid: str):
+  def __init__(
+    self,
+    appid: str,
+    cache: Optional[ResultCache] = None,
+    store: Optional[DiskCache] = None,
+    governor: Optional[QuotaGovernor] = None,
+    lazy: bool = False,
+    retention: Union[Retention, str] = Retention.KEEP,
+    typed: bool = False,
+    profile: Optional[Union[Profile, str]] = None,
+    transport: Optional[Transport] = None,
+    policy: Optional[RequestPolicy] = None,
+    policies: Optional[Mapping[Type[API], RequestPolicy]] = None,
+    breakers: Optional[CircuitBreakers] = None
+  ):
+    if typed and not TYPED_AVAILABLE:
+      raise RuntimeError("msgspec must be installed for typed decoding")
     self._appid = appid
+    self.lazy = lazy
+    self.retention = Retention(retention)
+    self.typed = typed
+    self.profile = Profile(profile) if profile is not None else None
+    self._cache = cache
+    self._store = store
+    self._governor = governor
+    self._owns_transport = transport is None
+    self._transport = transport if transport is not None else self._default_transport()
+    self._policy = policy if policy is not None else RequestPolicy()
+    self._policies: Dict[Type[API], RequestPolicy] = dict(policies or {})
+    self._breakers = breakers
+
+    self.requests = 0
+    self.failures = 0
+    self.bytes_received = 0
+    self.request_time = 0.0
+
+  def _default_transport(self) -> Transport:
+    raise NotImplementedError
 
   @property
   def appid(self) -> str:
     """The App ID in use by the client"""
     return self._appid
 
+  @property
+  def cache(self) -> Optional[ResultCache]:
+    """The result cache in use by the client, if any"""
+    return self._cache
 
+  @property
+  def store(self) -> Optional[DiskCache]:
+    """The persistent cache in use by the client, if any"""
+    return self._store
 
-class Client(ClientBase):
-  """Client to interact with the APIs"""
+  @property
+  def governor(self) -> Optional[QuotaGovernor]:
+    """The rate limiter in use by the client, if any"""
+    return self._governor
 
-  def query(self, api: API, url: Optional[str] = None, **params):
+  @property
+  def transport(self) -> Transport:
+    """The transport requests are sent with"""
+    return self._transport
+
+  @property
+  def policy(self) -> RequestPolicy:
+    """The policy that the policies of APIs without their own are copied from"""
+    return self._policy
+
+  def policy_for(self, api: Type[API]) -> RequestPolicy:
+    """Gets the policy requests to an API are sent with"""
+    policy = self._policies.get(api)
+    if policy is None:
+      policy = self._policies[api] = self._policy.copy()
+    return policy
+
+  @property
+  def breakers(self) -> Optional[CircuitBreakers]:
+    """The circuit breakers in use by the client, if any"""
+    return self._breakers
+
+  def _breaker_for(self, url: str) -> Optional[CircuitBreaker]:
+    """Gets the circuit breaker of the host of a url, and fails fast if it is open"""
+    if self._breakers is None:
+      return None
+    breaker = self._breakers.for_url(url)
+    # Checked before the rate limiter, so that requests that fail fast do not spend the budget
+    breaker.check()
+    return breaker
+
+  @property
+  def policy_stats(self) -> Dict[str, Dict[str, float]]:
+    """The counters of the policy of every API that was queried, by API name"""
+    return {api.__name__: policy.stats for api, policy in self._policies.items()}
+
+  @property
+  def stats(self) -> Dict[str, float]:
+    """The request counters, `request_time` is in seconds"""
+    return {
+      "requests": self.requests,
+      "failures": self.failures,
+      "bytes_received": self.bytes_received,
+      "request_time": self.request_time
+    }
+
+  def _prepare(self, api: API, url: Optional[str], params: dict) -> Tuple[str, dict]:
+    """Builds the url of a query, along with the parameters it is cached under"""
     if not issubclass(api, API):
       raise TypeError("api must be `API` type")
 
-
     if api.VERSION not in self.API_VERSION.keys():
       raise ValueError(f"Unknown API version '{api.VERSION}'.")
 
-    api_version = self.API_VERSION[api.VERSION]
-
     try:
-      params = "?" + urlencode(
-        tuple(
-          dict(appid=self.appid, **api.PARAMS, **params).items()
-        )
-      )
+      query = dict(appid=self.appid, **api.PARAMS, **params)
     except TypeError:
       raise ParameterConflict("cannot pass a parameter specified by `API` object")
 
     base_url = url if url is not None else self.BASE_URL
-    url = base_url + api_version + api.ENDPOINT + params
-    resp = requests.get(url)
-    return api.format_results(resp)
+    params = "?" + urlencode(tuple(query.items()), doseq=True)
+    return base_url + self.API_VERSION[api.VERSION] + api.ENDPOINT + params, query
+
+  def _observe(self, resp: Response):
+    """Called with every response the transport gets, before it is checked"""
+    self.requests += 1
+    self.bytes_received += resp.size
+    self.request_time += resp.elapsed
+    if resp.status >= 400:
+      self.failures += 1
+
+  def _handle(self, api: API, resp: Response) -> Any:
+    """Constructs the result of a response, with the decoding options of the client"""
+    self._observe(resp)
+    with self._decoding():
+      return handle_response(api, resp)
+
+  @contextmanager
+  def _decoding(self) -> Iterator[None]:
+    """Applies the decoding options of the client to the models constructed in the block"""
+    with lazy_models(self.lazy), retain_raw(self.retention), typed_decoding(self.typed):
+      yield
+
+  def _full_results_params(self, params: dict) -> dict:
+    """Converts the parameters of a FullResults query to the ones the API takes, filling in the request profile"""
+    profile = params.pop("profile", None) or self.profile
+    if profile is not None:
+      params = {**PROFILE_PARAMS[Profile(profile)], **params}
+
+    # For some reason unlike the other APIs the FullResults API units parameter is metric or nonmetric
+    # instead of imperial, so we'll just do a replace if it is imperial
+    units = params.get("units", None)
+    if units is not None and str(units) == str(Units.IMPERIAL):
+      params["units"] = "nonmetric"
+
+    async_pods = params.pop("async_pods", None)
+    if async_pods:
+      params["async"] = "true" if async_pods is True else async_pods
+
+    podindex = params.pop("podindex", None)
+    if podindex is not None:
+      params["podindex"] = ",".join(str(index) for index in podindex)
+
+    for name in ("includepodid", "excludepodid"):
+      ids = params.get(name)
+      if ids is not None and not isinstance(ids, str):
+        # The API takes one parameter per pod id
+        params[name] = tuple(ids)
+
+    format = params.pop("format", None)
+    if format is not None:
+      params["format"] = format if isinstance(format, str) else ",".join(format)
+    return params
+
+  def _limit(self, priority: int):
+    """Gets the context manager that holds a request until the governor admits it"""
+    if self._governor is None:
+      return nullcontext()
+    return self._governor.limit(self.appid, priority)
+
+  def _cache_key(self, api: API, url: Optional[str], params: dict) -> Optional[Hashable]:
+    """Gets the cache key for a query, or `None` if the client does not cache"""
+    if self._cache is None and self._store is None:
+      return None
+    return make_key(api, url, params)
+
+  def _recall(self, api: API, key: Hashable) -> Any:
+    """Gets a result from the in-memory cache, or `MISSING`"""
+    if self._cache is None or not self._cache.ttl_for(api):
+      return MISSING
+    return self._cache.get(key)
+
+  def _remember(self, api: API, key: Hashable, result: Any, size: int):
+    """Keeps a result in the in-memory cache, if the API is cached"""
+    if self._cache is None:
+      return
+    ttl = self._cache.ttl_for(api)
+    if ttl:
+      self._cache.put(key, result, size, ttl)
+
+  def _persist_ttl(self, api: API) -> Optional[float]:
+    """Gets how long raw responses of the API are persisted, `None` if they are not"""
+    if self._store is None:
+      return None
+    return self._store.ttl_for(api)
+
+
+
+class Client(ClientBase):
+  """Client to interact with the APIs"""
+
+  def _default_transport(self) -> Transport:
+    return RequestsTransport()
+
+  def query(self, api: API, url: Optional[str] = None, **params):
+    """Sends a query to an API, going through the caches and rate limiter first if set
+
+    Raises
+    ------
+    ~wolfram.BudgetExhausted
+      The monthly budget of the App ID has been spent.
+    """
+    full_url, query = self._prepare(api, url, params)
+
+    key = self._cache_key(api, url, query)
+    if key is not None:
+      result = self._recall(api, key)
+      if result is not MISSING:
+        return result
+      if self._persist_ttl(api):
+        data = self._store.get(key)
+        if data is not None:
+          with self._decoding():
+            result = api.parse(data)
+          self._remember(api, key, result, len(data))
+          return result
+
+    breaker = self._breaker_for(full_url)
+
+    def attempt(timeout: Timeout) -> Response:
+      # Every attempt is admitted and counted by the governor on its own
+      limit = self._governor.limit_sync(self.appid) if self._governor is not None else nullcontext()
+      with limit:
+        return self._send(full_url, api.STREAMED, timeout, breaker)
+
+    resp = self.policy_for(api).send(attempt, REFUSED)
+    result = self._handle(api, resp)
+
+    if key is not None and api.cacheable(result):
+      self._remember(api, key, result, resp.size)
+      ttl = self._persist_ttl(api)
+      if ttl:
+        data = resp.body.getvalue() if isinstance(resp.body, SpooledBuffer) else resp.body
+        self._store.put(key, data, ttl)
+        self._store.maybe_vacuum()
+    return result
+
+  def _send(self, url: str, stream: bool, timeout: Timeout, breaker: Optional[CircuitBreaker]) -> Response:
+    """Sends a single attempt of a request, recording its outcome with the breaker of its host"""
+    if breaker is None:
+      return self._transport.get(url, stream=stream, timeout=timeout)
+    breaker.allow()
+    try:
+      resp = self._transport.get(url, stream=stream, timeout=timeout)
+    except TransportError:
+      breaker.record(False)
+      raise
+    except BaseException:
+      breaker.release()
+      raise
+    breaker.record(resp.status < 500, resp.elapsed)
+    return resp
+
+  def close(self):
+    """Closes the transport, unless it was given to the client"""
+    if self._owns_transport:
+      self._transport.close()
 
   # NOTE: Not all parameters are supported
   # Additionally, parameters produced by timeout and async related params are not easily accessible atm
@@ -75,6 +375,7 @@ class Client(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -92,6 +393,7 @@ class Client(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -109,6 +411,7 @@ class Client(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -126,6 +429,7 @@ class Client(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -164,23 +468,15 @@ class Client(ClientBase):
       Specifies an assumption, such as the meaning of a word or the value of a formula variable.
     units: Optional[:class:`~wolfram.Units`]
       Lets you specify the preferred measurement system, either "metric" or "imperial" (US customary units).
+    profile: Optional[Union[:class:`~wolfram.Profile`, `str`]]
+      The request profile to use instead of the client's, e.g. `text-only` to leave out images.
+      Parameters that are given take precedence over those of the profile.
     \*\*params
       A keyword argument list of other parameters to be passed to the API.
       All parameters can be found at https://products.wolframalpha.com/api/documentation?scrollTo=parameter-reference.
+      `includepodid` and `excludepodid` may be sequences of pod ids.
     """
-
-    # For some reason unlike the other APIs the FullResults API units parameter is metric or nonmetric
-    # instead of imperial, so we'll just do a replace if it is imperial
-    units = params.get("units", None)
-    if units is not None and units == Units.IMPERIAL:
-      params["units"] == "nonmetric"
-
-    format = params.pop("format", None)
-
-    if format is not None:
-      return self.query(api=FullResultsAPI, input=input, format=",".join(format), **params)
-    else:
-      return self.query(api=FullResultsAPI, input=input, **params)
+    return self.query(api=FullResultsAPI, input=input, **self._full_results_params(params))
 
   @overload
   def conversational_query(
@@ -198,7 +494,7 @@ class Client(ClientBase):
     self,
     i: str,
     *,
-    conversationalID: str,
+    conversationID: str,
     url: str,
     s: Optional[int] = None,
     geolocation: Optional[LatLong] = None,
@@ -220,7 +516,7 @@ class Client(ClientBase):
     ----------
     i: `str`
       The input string to be interpreted.
-    conversationalID: Optional[`str`]
+    conversationID: Optional[`str`]
       The ID used for follow-up queries.
     url: Optional[`str`]
       The host url to send follow-up queries to.
@@ -244,7 +540,7 @@ class Client(ClientBase):
     ~wolfram.MissingParameters
       A required parameter was not specified for a follow-up query.
     """
-    convID = params.get("conversationalID", None)
+    convID = params.get("conversationID", None)
     url = params.get("url", None)
     if convID is not None and url is None:
       raise MissingParameters("missing required parameter `url`.")
@@ -257,7 +553,7 @@ class Client(ClientBase):
   def conversational_followup_query(
     self,
     i: str,
-    result: ConversationalResults,
+    result: Union[ConversationalResults, Conversation],
     *,
     geolocation: Optional[str] = None,
     ip: Optional[str] = None,
@@ -265,17 +561,25 @@ class Client(ClientBase):
   ) -> ConversationalResults:
     ...
 
-  def conversational_followup_query(self, i: str, result: ConversationalResults, **params):
+  def conversational_followup_query(
+    self,
+    i: str,
+    result: Union[ConversationalResults, Conversation],
+    **params
+  ):
     """
     
     Convenience method to send a follow-up query using a `~wolfarm.ConversationalResults` object
+
+    The query goes straight to the host the conversation is pinned to.
     
     Parameters
     ----------
     i: `str`
       The input string to be interpreted.
-    result: :class:`~wolfram.ConversationalResults`
-      The query result that the follow-up query is based on.
+    result: Union[:class:`~wolfram.ConversationalResults`, :class:`~wolfram.conversations.Conversation`]
+      The query result that the follow-up query is based on, or its conversation from a
+      :class:`~wolfram.conversations.ConversationStore`.
     geolocation: Optional[:class:`~wolfram.LatLong`]
       Specifies a custom query location based on a latitude/longitude pair.
     ip: Optional[`str`]
@@ -438,32 +742,366 @@ class Client(ClientBase):
 
 
 class AsyncClient(ClientBase):
-  """Async client to interact with the APIs, powered by aiohttp"""
+  """Async client to interact with the APIs, powered by aiohttp
+
+  Parameters
+  ----------
+  appid: `str`
+    The App ID to query the APIs with.
+  pool: Optional[:class:`~Jus_Bot.pool.HTTPPool`]
+    The connection pool to draw sessions from. If not given,
+    a new session is opened for every request.
+  cache: Optional[:class:`~wolfram.cache.ResultCache`]
+    The cache to keep results in. If not given, results are not cached.
+  store: Optional[:class:`~wolfram.store.DiskCache`]
+    The persistent cache to keep raw responses in, checked after `cache`.
+  governor: Optional[:class:`~wolfram.ratelimit.QuotaGovernor`]
+    The rate limiter that requests have to pass through. Cached results are not limited.
+  lazy: `bool`
+    Whether results are decoded lazily, constructing nested models only when they are
+    first accessed. Defaults to `False`.
+  retention: Union[:class:`~wolfram.models.Retention`, `str`]
+    How much of the raw response every model keeps, one of `keep`, `drop` or `compact`.
+    Dropping it roughly halves the memory held by cached results, at the cost of
+    `Model.raw` being rebuilt from the fields. Defaults to `keep`.
+  typed: `bool`
+    Whether FullResults responses are decoded and validated into the structs generated from
+    `types.py` before the models are constructed, which requires msgspec. Keys that are not
+    described in `types.py` are not kept. Defaults to `False`.
+  profile: Optional[Union[:class:`~wolfram.Profile`, `str`]]
+    The request profile of FullResults queries, which decides how much of every pod is sent.
+    If not given, the API sends its default formats.
+  transport: Optional[:class:`~wolfram.transport.Transport`]
+    The transport to send requests with. If not given, an aiohttp transport
+    drawing from `pool` is used.
+  policy: Optional[:class:`~wolfram.policy.RequestPolicy`]
+    How requests are timed out, retried and hedged. Every API gets a copy of it,
+    so that hedging follows the latencies of that API. If not given, the default policy is used.
+  policies: Optional[Mapping[Type[:class:`~wolfram.api.API`], :class:`~wolfram.policy.RequestPolicy`]]
+    The policies of specific APIs, used instead of `policy`.
+  breakers: Optional[:class:`~Jus_Bot.breaker.CircuitBreakers`]
+    The circuit breakers of the hosts requests are sent to. While the breaker of a host is open,
+    queries that are not cached raise :class:`~Jus_Bot.breaker.CircuitOpen` right away.
+  """
+
+  def __init__(
+    self,
+    appid: str,
+    pool: Optional[HTTPPool] = None,
+    cache: Optional[ResultCache] = None,
+    store: Optional[DiskCache] = None,
+    governor: Optional[QuotaGovernor] = None,
+    lazy: bool = False,
+    retention: Union[Retention, str] = Retention.KEEP,
+    typed: bool = False,
+    profile: Optional[Union[Profile, str]] = None,
+    transport: Optional[Transport] = None,
+    policy: Optional[RequestPolicy] = None,
+    policies: Optional[Mapping[Type[API], RequestPolicy]] = None,
+    breakers: Optional[CircuitBreakers] = None
+  ):
+    self._pool = pool
+    super().__init__(
+      appid,
+      cache=cache,
+      store=store,
+      governor=governor,
+      lazy=lazy,
+      retention=retention,
+      typed=typed,
+      profile=profile,
+      transport=transport,
+      policy=policy,
+      policies=policies,
+      breakers=breakers
+    )
+    self._inflight: Dict[str, asyncio.Task] = {}
+    self._coalesced = 0
+    self._bulk_queries: WeakSet[BulkQuery] = WeakSet()
+    self._paged_queries: WeakSet[PagedQuery] = WeakSet()
+    self._background: Set[asyncio.Task] = set()
+
+  def _default_transport(self) -> Transport:
+    return AiohttpTransport(self._pool)
 
-  async def query(self, api: API, url: Optional[str] = None, **params):
-    if not issubclass(api, API):
-      raise TypeError("api must be `API` type")
+  @property
+  def pool(self) -> Optional[HTTPPool]:
+    """The connection pool in use by the client, if any"""
+    return self._pool
 
+  @property
+  def coalesced(self) -> int:
+    """The number of requests that were saved by sharing an identical in-flight request"""
+    return self._coalesced
 
-    if api.VERSION not in self.API_VERSION.keys():
-      raise ValueError(f"Unknown API version '{api.VERSION}'.")
+  async def query(
+    self,
+    api: API,
+    url: Optional[str] = None,
+    *,
+    priority: int = Priority.NORMAL,
+    **params
+  ):
+    """|coro|
+
+    Sends a query to an API, going through the caches and rate limiter first if set.
+    `priority` decides which requests are admitted first by the rate limiter.
+
+    Raises
+    ------
+    ~wolfram.BudgetExhausted
+      The monthly budget of the App ID has been spent.
+    """
+    full_url, query = self._prepare(api, url, params)
+
+    key = self._cache_key(api, url, query)
+    if key is not None:
+      result = self._recall(api, key)
+      if result is not MISSING:
+        return result
+      if self._persist_ttl(api):
+        data = await self._store.aget(key)
+        if data is not None:
+          with self._decoding():
+            result = api.parse(data)
+          self._remember(api, key, result, len(data))
+          return result
+
+    url = full_url
+    if not api.COALESCE:
+      return await self._request(api, url, key, priority)
+
+    # Identical requests that are already in flight are shared instead of being sent again
+    shared = url in self._inflight
+    result = await self._shared(url, lambda: self._request(api, url, key, priority))
+    if shared and getattr(result, "deferred", None):
+      # Every caller replaces the deferred pods of its own result in `fetch_deferred`
+      result = result.fork()
+    return result
+
+  async def _shared(self, url: str, request) -> Any:
+    """Awaits the request for a url that is in flight, or starts it with `request()`"""
+    task = self._inflight.get(url)
+    if task is None:
+      task = asyncio.ensure_future(request())
+      self._inflight[url] = task
+      task.add_done_callback(lambda t: self._request_done(url, t))
+    else:
+      self._coalesced += 1
+    # Shielded so that a cancelled caller does not cancel the request for everyone else
+    return await asyncio.shield(task)
+
+  def bulk_query(
+    self,
+    inputs: Iterable[str],
+    api: API = FullResultsAPI,
+    *,
+    concurrency: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    priority: int = Priority.BACKGROUND,
+    **params
+  ) -> BulkQuery:
+    """
+    Query an API with many inputs at once.
+
+    The returned :class:`~wolfram.bulk.BulkQuery` can either be awaited to get every
+    :class:`~wolfram.bulk.BulkResult` in input order, or iterated over with `async for`
+    to get them as they complete. Errors are captured per input instead of being raised.
+
+    Parameters
+    ----------
+    inputs: Iterable[`str`]
+      The input strings to query.
+    api: Type[:class:`~wolfram.api.API`]
+      The API to query. Defaults to the FullResults API.
+    concurrency: Optional[`int`]
+      The maximum number of queries in flight. Defaults to the per host
+      connection limit of the pool, or `10` without one.
+    progress: Optional[Callable[[`int`, `int`], Any]]
+      Called with the number of finished queries and the total after every query,
+      can be a coroutine function.
+    priority: :class:`int`
+      The priority the queries are admitted with by the governor, so that batches
+      do not hold up interactive queries. Defaults to `Priority.BACKGROUND`
+    \*\*params
+      Other parameters to be passed with every query. For the FullResults API they are
+      the ones `full_results_query` takes, including `profile`, otherwise they are sent to `query` as is.
+    """
+    if issubclass(api, FullResultsAPI):
+      params = self._full_results_params(params)
+    if concurrency is None:
+      concurrency = self._pool.limit_per_host if self._pool is not None and self._pool.limit_per_host else 10
+    bulk = BulkQuery(self, inputs, api, concurrency, progress, params, priority)
+    self._bulk_queries.add(bulk)
+    return bulk
+
+  def paged_query(self, input: str, *, page_size: Optional[int] = 3, **params) -> PagedQuery:
+    """
+    Query the FullResults API a page of pods at a time.
 
-    api_version = self.API_VERSION[api.VERSION]
+    The returned :class:`~wolfram.paging.PagedQuery` fetches each page with `podindex`
+    when it is asked for, so only the pods that are shown are computed.
 
+    Parameters
+    ----------
+    input: `str`
+      The input string to be interpreted.
+    page_size: Optional[`int`]
+      The number of pods per page, `None` fetches every pod at once. Defaults to `3`
+    \*\*params
+      Other parameters to be passed with every page, these are sent to `full_results_query` as is.
+    """
+    paged = PagedQuery(self, input, page_size, params)
+    self._paged_queries.add(paged)
+    return paged
+
+  async def fetch_deferred(self, result: FullResults) -> AsyncIterator[Pod]:
+    """
+    Fetches the deferred pods of an `async` result in parallel, yielding each pod as it arrives.
+
+    Every fetched pod replaces its stub in `result.pods`, unless the stub was replaced by a
+    `recalculate` in the meantime. Pods that fail to be fetched are left deferred.
+    Pods that are already being fetched for another result are shared.
+    Fetches are not counted by the governor, as the query already was.
+    """
+    tasks = {
+      asyncio.ensure_future(self._fetch_pod(pod.async_url.url)): pod
+      for pod in result.deferred
+    }
+    pending = set(tasks)
     try:
-      params = "?" + urlencode(
-        tuple(
-          dict(appid=self.appid, **api.PARAMS, **params).items()
-        )
-      )
-    except TypeError:
-      raise ParameterConflict("cannot pass a parameter specified by `API` object")
-      
-    base_url = url if url is not None else self.BASE_URL
-    url = base_url + api_version + api.ENDPOINT + params
-    async with aiohttp.ClientSession() as client:
-      async with client.get(url) as resp:
-        result = await api.async_format_results(resp)
+      while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+          if task.exception() is not None:
+            continue
+          pod = task.result()
+          if result.replace_pod(tasks[task], pod):
+            yield pod
+    finally:
+      # The consumer stopped early, the rest is not needed anymore
+      for task in pending:
+        task.cancel()
+
+  async def _fetch_pod(self, url: str) -> Pod:
+    # Callers that share a coalesced result fetch its deferred pods once
+    return await self._shared(url, lambda: self._fetch_pod_now(url))
+
+  async def _fetch_pod_now(self, url: str) -> Pod:
+    resp = await self._get(url)
+    with self._decoding():
+      return FullResultsAPI.parse_pod(resp.body)
+
+  async def recalculate(self, result: FullResults, *, priority: int = Priority.BACKGROUND) -> List[Pod]:
+    """|coro|
+
+    Follows the `recalculate` url of a result whose scanners timed out, and merges
+    the pods computed since into the result.
+
+    Returns the pods that were added or replaced, which is empty if there was nothing to recalculate.
+
+    Raises
+    ------
+    ~wolfram.BudgetExhausted
+      The monthly budget of the App ID has been spent.
+    """
+    if not result.recalculate:
+      return []
+    resp = await self._get(result.recalculate.url, priority)
+    recalculated = self._handle(FullResultsAPI, resp)
+    return result.merge(recalculated)
+
+  def recalculate_in_background(
+    self,
+    result: FullResults,
+    *,
+    priority: int = Priority.BACKGROUND
+  ) -> asyncio.Task:
+    """Same as `recalculate`, but runs in a task that is cancelled when the client is closed"""
+    task = asyncio.ensure_future(self.recalculate(result, priority=priority))
+    self._background.add(task)
+    task.add_done_callback(self._background.discard)
+    return task
+
+  async def _get(self, url: str, priority: Optional[int] = None) -> Response:
+    """Gets a url that was given by the API, raising for error statuses
+
+    Every attempt is admitted by the governor if a priority is given.
+    """
+    # Such urls are the async pods and recalculations of FullResults queries
+    breaker = self._breaker_for(url)
+
+    async def attempt(timeout: Timeout) -> Response:
+      if priority is None:
+        return await self._send(url, False, timeout, breaker)
+      async with self._limit(priority):
+        return await self._send(url, False, timeout, breaker)
+
+    resp = await self.policy_for(FullResultsAPI).asend(attempt, REFUSED)
+    self._observe(resp)
+    check_status(resp)
+    return resp
+
+  async def close(self):
+    """|coro|
+
+    Cancels every running bulk query, paged query and background recalculation,
+    then closes the transport unless it was given to the client.
+    The pool, if any, is left to its owner
+    """
+    for bulk in list(self._bulk_queries):
+      bulk.cancel()
+    for paged in list(self._paged_queries):
+      paged.cancel()
+    for task in list(self._background):
+      task.cancel()
+    if self._owns_transport:
+      await self._transport.aclose()
+
+  async def _send(self, url: str, stream: bool, timeout: Timeout, breaker: Optional[CircuitBreaker]) -> Response:
+    """Sends a single attempt of a request, recording its outcome with the breaker of its host"""
+    if breaker is None:
+      return await self._transport.aget(url, stream=stream, timeout=timeout)
+    breaker.allow()
+    try:
+      resp = await self._transport.aget(url, stream=stream, timeout=timeout)
+    except TransportError:
+      breaker.record(False)
+      raise
+    except BaseException:
+      breaker.release()
+      raise
+    breaker.record(resp.status < 500, resp.elapsed)
+    return resp
+
+  def _request_done(self, url: str, task: asyncio.Task):
+    if self._inflight.get(url) is task:
+      del self._inflight[url]
+    if not task.cancelled():
+      # Marks the exception as retrieved, in case every caller was cancelled
+      task.exception()
+
+  async def _request(self, api: API, url: str, key: Optional[Hashable], priority: int):
+    """Sends a request and caches the result"""
+    breaker = self._breaker_for(url)
+
+    async def attempt(timeout: Timeout) -> Response:
+      # Every attempt is admitted and counted by the governor on its own
+      async with self._limit(priority):
+        return await self._send(url, api.STREAMED, timeout, breaker)
+
+    resp = await self.policy_for(api).asend(attempt, REFUSED)
+    result = self._handle(api, resp)
+
+    if key is not None and api.cacheable(result):
+      self._remember(api, key, result, resp.size)
+      ttl = self._persist_ttl(api)
+      if ttl:
+        data = resp.body
+        if isinstance(data, SpooledBuffer):
+          # Streamed bodies are only read back whole to be persisted
+          data = await asyncio.get_running_loop().run_in_executor(None, data.getvalue)
+        await self._store.aput(key, data, ttl)
     return result
 
   # NOTE: Not all parameters are supported
@@ -480,6 +1118,8 @@ class AsyncClient(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    async_pods: Optional[Union[bool, float]] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -497,6 +1137,8 @@ class AsyncClient(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    async_pods: Optional[Union[bool, float]] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -514,6 +1156,8 @@ class AsyncClient(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    async_pods: Optional[Union[bool, float]] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -531,6 +1175,8 @@ class AsyncClient(ClientBase):
     ignorecase: Optional[Bool] = None,
     assumption: Optional[str] = None,
     units: Optional[Units] = None,
+    async_pods: Optional[Union[bool, float]] = None,
+    profile: Optional[Union[Profile, str]] = None,
     **params
   ) -> FullResults:
     ...
@@ -569,23 +1215,19 @@ class AsyncClient(ClientBase):
       Specifies an assumption, such as the meaning of a word or the value of a formula variable.
     units: Optional[:class:`~wolfram.Units`]
       Lets you specify the preferred measurement system, either "metric" or "imperial" (US customary units).
+    async_pods: Optional[Union[`bool`, `float`]]
+      Whether pods that take long to compute are deferred, `True` waits as long as the API
+      does by default and a number is the seconds to wait. Deferred pods can be fetched
+      with :meth:`fetch_deferred`, and results with any are not cached.
+    profile: Optional[Union[:class:`~wolfram.Profile`, `str`]]
+      The request profile to use instead of the client's, e.g. `text-only` to leave out images.
+      Parameters that are given take precedence over those of the profile.
     \*\*params
       A keyword argument list of other parameters to be passed to the API.
       All parameters can be found at https://products.wolframalpha.com/api/documentation?scrollTo=parameter-reference.
+      `includepodid` and `excludepodid` may be sequences of pod ids.
     """
-
-    # For some reason unlike the other APIs the FullResults API units parameter is metric or nonmetric
-    # instead of imperial, so we'll just do a replace if it is imperial
-    units = params.get("units", None)
-    if units is not None and units == Units.IMPERIAL:
-      params["units"] == "nonmetric"
-
-    format = params.pop("format", None)
-
-    if format is not None:
-      return await self.query(api=FullResultsAPI, input=input, format=",".join(format), **params)
-    else:
-      return await self.query(api=FullResultsAPI, input=input, **params)
+    return await self.query(api=FullResultsAPI, input=input, **self._full_results_params(params))
 
   @overload
   async def conversational_query(
@@ -603,7 +1245,7 @@ class AsyncClient(ClientBase):
     self,
     i: str,
     *,
-    conversationalID: str,
+    conversationID: str,
     url: str,
     s: Optional[int] = None,
     geolocation: Optional[str] = None,
@@ -625,7 +1267,7 @@ class AsyncClient(ClientBase):
     ----------
     i: `str`
       The input string to be interpreted.
-    conversationalID: Optional[`str`]
+    conversationID: Optional[`str`]
       The ID used for follow-up queries.
     url: Optional[`str`]
       The host url to send follow-up queries to.
@@ -649,7 +1291,7 @@ class AsyncClient(ClientBase):
     ~wolfram.MissingParameters
       A required parameter was not specified for a follow-up query.
     """
-    convID = params.get("conversationalID", None)
+    convID = params.get("conversationID", None)
     url = params.get("url", None)
     if convID is not None and url is None:
       raise MissingParameters("missing required parameter `url`.")
@@ -662,7 +1304,7 @@ class AsyncClient(ClientBase):
   async def conversational_followup_query(
     self,
     i: str,
-    result: ConversationalResults,
+    result: Union[ConversationalResults, Conversation],
     *,
     geolocation: Optional[str] = None,
     ip: Optional[str] = None,
@@ -670,17 +1312,25 @@ class AsyncClient(ClientBase):
   ) -> ConversationalResults:
     ...
 
-  async def conversational_followup_query(self, i: str, result: ConversationalResults, **params):
+  async def conversational_followup_query(
+    self,
+    i: str,
+    result: Union[ConversationalResults, Conversation],
+    **params
+  ):
     """|coro|
     
     Convenience method to send a follow-up query using a `~wolfarm.ConversationalResults` object
+
+    The query goes straight to the host the conversation is pinned to.
     
     Parameters
     ----------
     i: `str`
       The input string to be interpreted.
-    result: :class:`~wolfram.ConversationalResults`
-      The query result that the follow-up query is based on.
+    result: Union[:class:`~wolfram.ConversationalResults`, :class:`~wolfram.conversations.Conversation`]
+      The query result that the follow-up query is based on, or its conversation from a
+      :class:`~wolfram.conversations.ConversationStore`.
     geolocation: Optional[:class:`~wolfram.LatLong`]
       Specifies a custom query location based on a latitude/longitude pair.
     ip: Optional[`str`]
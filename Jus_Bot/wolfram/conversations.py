@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Hashable, NamedTuple, Optional
+
+if TYPE_CHECKING:
+  from .models import ConversationalResults
+
+class Conversation(NamedTuple):
+  """What is needed to send a follow-up query, taken from a :class:`~wolfram.models.ConversationalResults`"""
+  conversationID: str
+  host: str
+  s: Optional[int] = None
+
+  @classmethod
+  def from_result(cls, result: ConversationalResults) -> Conversation:
+    return cls(result.conversationID, result.host, result.s)
+
+  @property
+  def followup_url(self) -> str:
+    """The url of the host the conversation is pinned to"""
+    return f"https://{self.host}/api/"
+
+  @property
+  def followup_params(self) -> dict:
+    """A dictionary of parameters that should be sent with the follow up request"""
+    d = dict(conversationID=self.conversationID)
+    if self.s is not None:
+      d["s"] = self.s
+    return d
+
+class _Entry(NamedTuple):
+  conversation: Conversation
+  expires: float
+
+class ConversationStore:
+  """
+  A bounded store of ongoing Conversational API conversations, e.g. one per user and channel
+
+  Conversations expire once they have not been continued for `ttl` seconds,
+  and the least recently continued ones are evicted once `max_entries` is exceeded.
+
+  Parameters
+  ----------
+  max_entries: :class:`int`
+    The maximum number of conversations held by the store. Defaults to `1024`
+  ttl: :class:`float`
+    How long a conversation is kept after its last query, in seconds. Defaults to 10 minutes
+  """
+
+  def __init__(self, max_entries: int = 1024, ttl: float = 10 * 60):
+    self.max_entries = max_entries
+    self.ttl = ttl
+
+    self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+    self._lock = Lock()
+
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.expirations = 0
+
+  def __len__(self):
+    return len(self._entries)
+
+  @property
+  def stats(self) -> Dict[str, int]:
+    """The store counters"""
+    return {
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "expirations": self.expirations,
+      "entries": len(self._entries)
+    }
+
+  def get(self, key: Hashable) -> Optional[Conversation]:
+    """Gets the conversation of a key, or `None` if it has none or it expired"""
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry.expires <= monotonic():
+        del self._entries[key]
+        self.expirations += 1
+        entry = None
+
+      if entry is None:
+        self.misses += 1
+        return None
+
+      self._entries.move_to_end(key)
+      self.hits += 1
+      return entry.conversation
+
+  def put(self, key: Hashable, result: ConversationalResults):
+    """Keeps the conversation of a result under a key, replacing any earlier one"""
+    with self._lock:
+      self._entries.pop(key, None)
+      self._entries[key] = _Entry(Conversation.from_result(result), monotonic() + self.ttl)
+
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def pop(self, key: Hashable) -> Optional[Conversation]:
+    """Ends the conversation of a key, returning it if there was one"""
+    with self._lock:
+      entry = self._entries.pop(key, None)
+    return entry.conversation if entry is not None else None
+
+  def clear(self):
+    """Removes every conversation from the store"""
+    with self._lock:
+      self._entries.clear()
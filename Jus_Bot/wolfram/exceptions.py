@@ -11,4 +11,19 @@ class MissingParameters(WolframException):
   """Exception that is raised when a required parameter is missing. This should rarely be raised"""
 
 class InvalidAppID(WolframException):
-  """Exception that is raised when an App ID is invalid"""
\ No newline at end of file
+  """Exception that is raised when an App ID is invalid"""
+
+class BudgetExhausted(WolframException):
+  """Exception that is raised when the monthly request budget of an App ID has been spent"""
+
+class InvalidResponse(WolframException):
+  """Exception that is raised when a response does not match the shape described in `types.py`"""
+
+class TransportError(WolframException):
+  """Exception that is raised when a request fails before a response is received, e.g. the connection was refused"""
+
+class RequestTimeout(TransportError):
+  """Exception that is raised when a request takes longer than its timeout"""
+
+class ServerError(TransportError):
+  """Exception that is raised when the API still responds with a server error after the request was retried"""
\ No newline at end of file
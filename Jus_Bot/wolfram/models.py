@@ -4,14 +4,32 @@ data classes are here
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field, InitVar
+import asyncio
+import copy
+import os
+import shutil
+import sys
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields, InitVar, MISSING
+from enum import Enum
 from typing import (
+  Any,
+  BinaryIO,
   Callable,
+  ClassVar,
+  Dict,
+  FrozenSet,
   Generic,
+  Iterator,
   Mapping,
+  NamedTuple,
   Optional,
   List,
   TYPE_CHECKING,
+  Tuple,
+  Type,
   TypeVar,
   Union
 )
@@ -42,15 +60,83 @@ from .types import (
   SourceDict
 )
 from .factory import optional_factory, list_map_factory, always_list_factory
+from .schema import UNSET, TypedResponse
+from .spool import CHUNK_SIZE, SpooledBuffer
 
 if TYPE_CHECKING:
   from dataclasses import Field
 
+# Setting `JUS_DICT_MODELS` gives models the `__dict__` layout of older versions,
+# so that `benchmarks.model_memory` can compare both layouts on the same interpreter
+SLOTS = sys.version_info >= (3, 10) and not os.environ.get("JUS_DICT_MODELS")
+# The structs of typed decoding, empty without msgspec
+TYPED = (TypedResponse,) if TypedResponse is not None else ()
+
 DictT = TypeVar("DictT", bound=WolframDict)
+ModelT = TypeVar("ModelT", bound="Model")
+
+_lazy: ContextVar[bool] = ContextVar("lazy_models", default=False)
+
+@contextmanager
+def lazy_models(enabled: bool = True) -> Iterator[None]:
+  """Makes `Model.from_dict` construct lazy models within the block by default
+
+  Lazy models only run their field factories when the field is first accessed,
+  so nested models that are never read are never constructed.
+  """
+  token = _lazy.set(enabled)
+  try:
+    yield
+  finally:
+    _lazy.reset(token)
+
+class Retention(str, Enum):
+  """What a model keeps of the mapping it was constructed from"""
+  KEEP = "keep"
+  """The whole mapping is kept, `Model.raw` returns it as is"""
+  DROP = "drop"
+  """Nothing is kept, `Model.raw` is rebuilt from the fields"""
+  COMPACT = "compact"
+  """Only keys that are not fields of the model are kept, and merged into the rebuilt `Model.raw`"""
+
+_retention: ContextVar[Retention] = ContextVar("raw_retention", default=Retention.KEEP)
+
+@contextmanager
+def retain_raw(policy: Union[Retention, str]) -> Iterator[None]:
+  """Sets the `Retention` policy of models constructed by `Model.from_dict` within the block
+
+  Dropping the raw mapping roughly halves the memory held by a result,
+  which matters for results that are kept in caches.
+  """
+  token = _retention.set(Retention(policy))
+  try:
+    yield
+  finally:
+    _retention.reset(token)
+
+def _retained(raw: DictT, retention: Retention, names: FrozenSet[str]) -> Optional[dict]:
+  """Gets what a model keeps of `raw` under a retention policy"""
+  if retention is Retention.KEEP:
+    return raw
+  if retention is Retention.COMPACT:
+    return {k: v for k, v in raw.items() if k not in names} or None
+  return None
+
+def _encode(value: Any) -> Any:
+  """Converts a field value back into its JSON form, as far as the value allows"""
+  if isinstance(value, Model):
+    return value.raw
+  if isinstance(value, list):
+    return [_encode(v) for v in value]
+  if isinstance(value, WolframURL):
+    return value.url
+  return value
 
 
 
 class WolframURL:
+  __slots__ = ("_path", "_query")
+
   def __init__(self, url: str):
     url = url.split("?")
     if len(url) > 1:
@@ -92,74 +178,262 @@ class WolframURL:
 
 
 
-def model_field(factory: Optional[Callable] = None, **kwargs) -> Field:
+def model_field(factory: Optional[Callable] = None, key: Optional[str] = None, **kwargs) -> Field:
+  """A field of a model, `key` is the key of the field in the mapping if it differs from its name"""
   return field(
-    metadata={"factory": factory},
+    metadata={"factory": factory, "key": key},
     **kwargs
   )
 
-def optional_field(factory: Callable, match=None, **kwargs) -> Field:
+def optional_field(factory: Callable, match=None, key: Optional[str] = None, **kwargs) -> Field:
   return field(
     default=None,
-    metadata={"factory": optional_factory(factory, match=match)},
+    metadata={"factory": optional_factory(factory, match=match), "key": key},
     **kwargs
   )
 
+class DecodeStep(NamedTuple):
+  """A single step of a model's decode plan"""
+  name: str
+  key: str # The key in the mapping, usually the same as the name
+  factory: Optional[Callable]
+  default: Any # `MISSING` if the field is required
+
+def _compile_decoder(
+  cls: Type[ModelT],
+  plan: Tuple[DecodeStep, ...],
+  typed: bool = False
+) -> Callable[[DictT], ModelT]:
+  """Generates a function that constructs `cls` from a mapping by running its decode plan
+
+  This does the same as the dataclass `__init__` followed by `__post_init__`,
+  without looking up any field metadata or setting attributes twice.
+  If `typed` is `True`, the function constructs `cls` from a struct of `schema` instead,
+  reading its attributes directly.
+
+  Optional fields that are absent are left as `None` without calling their factory,
+  so the sections a request profile leaves out cost nothing to decode.
+  """
+  namespace = {
+    "cls": cls,
+    "MISSING": MISSING,
+    "UNSET": UNSET,
+    "KEEP": Retention.KEEP,
+    "retained": _retained,
+    "names": cls._field_keys
+  }
+  lines = [
+    "def decode(raw, retention):",
+    "  self = cls.__new__(cls)",
+    "  self._retention = retention",
+    "  self._raw_data = raw if retention is KEEP else retained(raw, retention, names)"
+  ]
+  if not typed:
+    lines.append("  get = raw.get")
+  for i, step in enumerate(plan):
+    namespace[f"d{i}"] = step.default
+    missing = f"    raise TypeError({cls.__name__ + '.from_dict() missing required field: ' + repr(step.key)!r})"
+    if step.factory is not None and step.default is None:
+      namespace[f"f{i}"] = step.factory
+      if typed:
+        lines.append(f"  v = getattr(raw, {step.key!r}, None)")
+        lines.append(f"  self.{step.name} = None if v is None or v is UNSET else f{i}(v)")
+      else:
+        lines.append(f"  v = get({step.key!r})")
+        lines.append(f"  self.{step.name} = None if v is None else f{i}(v)")
+      continue
+    if typed:
+      lines.append(f"  v = getattr(raw, {step.key!r}, UNSET)")
+      lines.append("  if v is UNSET:")
+      lines.append(missing if step.default is MISSING else f"    v = d{i}")
+      value = "v"
+    elif step.default is MISSING:
+      lines.append(f"  v = get({step.key!r}, MISSING)")
+      lines.append("  if v is MISSING:")
+      lines.append(missing)
+      value = "v"
+    else:
+      value = f"get({step.key!r}, d{i})"
+    if step.factory is not None:
+      namespace[f"f{i}"] = step.factory
+      value = f"f{i}({value})"
+    lines.append(f"  self.{step.name} = {value}")
+  lines.append("  return self")
+
+  exec("\n".join(lines), namespace)
+  decode = namespace["decode"]
+  decode.__qualname__ = f"{cls.__qualname__}.{'_decode_typed' if typed else '_decode'}"
+  return decode
+
+def model(cls: Type[ModelT]) -> Type[ModelT]:
+  """Turns a `Model` subclass into a dataclass, and builds its decode plan
+
+  The plan is a `DecodeStep` per field, which `from_dict` runs instead of
+  reflecting on the dataclass fields for every instance.
+  Models are slotted where supported (Python 3.10+), so instances have no `__dict__`.
+
+  Without slots, class level defaults of fields with a factory are removed, so that
+  an unset field of a lazy model falls through to `Model.__getattr__`.
+  The dataclass `__init__` keeps its own copy of the defaults.
+  """
+  cls = dataclass(cls, slots=SLOTS)
+
+  plan = []
+  for f in fields(cls):
+    if f.default_factory is not MISSING:
+      raise TypeError("model fields cannot have a default factory")
+    plan.append(DecodeStep(f.name, f.metadata.get("key") or f.name, f.metadata.get("factory"), f.default))
+
+  cls._plan = tuple(plan)
+  cls._field_keys = frozenset(step.key for step in plan)
+  cls._decode = staticmethod(_compile_decoder(cls, cls._plan))
+  cls._decode_typed = staticmethod(_compile_decoder(cls, cls._plan, typed=True))
+  cls._factories = {
+    step.name: step.factory
+    for step in plan
+    if step.factory is not None
+  }
+  if not SLOTS: # Slotted dataclasses have no class level defaults
+    for name in cls._factories:
+      if name in cls.__dict__:
+        delattr(cls, name)
+  return cls
+
 @dataclass
 class Model(Generic[DictT]):
   """The base class of all Wolfram|Alpha models"""
+  # Models are slotted, as large results are kept around in caches
+  __slots__ = ("_raw_data", "_retention", "_pending")
+
   _raw: InitVar[DictT]
+  _plan: ClassVar[Tuple[DecodeStep, ...]] = ()
+  _field_keys: ClassVar[FrozenSet[str]] = frozenset()
+  _decode: ClassVar[Callable[[DictT, Retention], Model]]
+  _decode_typed: ClassVar[Callable[[Any, Retention], Model]]
+  _factories: ClassVar[Dict[str, Callable]] = {}
 
   def __post_init__(self, _raw: DictT=None):
-    self._raw = _raw
-    for attr, field in self.__dataclass_fields__.items():
-      # This is a little hacky, but no better way to do this with dataclasses
-      factory = field.metadata.get("factory")
-      if factory is not None:
-        val = getattr(self, attr)
-        setattr(self, attr, factory(val))
+    self._raw_data = _raw
+    self._retention = Retention.KEEP
+    for attr, factory in self._factories.items():
+      setattr(self, attr, factory(getattr(self, attr)))
 
   def __getattr__(self, attr):
-    return self.raw[attr]
+    # Unset slots and protocol lookups (e.g. by copy and pickle) must not reach the raw fallback
+    if attr in Model.__slots__ or attr == "raw" or attr.startswith("__"):
+      raise AttributeError(attr)
+
+    # Fields of lazy models are constructed on first access
+    pending = getattr(self, "_pending", None)
+    if pending and attr in pending:
+      lazy_token = _lazy.set(True)
+      retention_token = _retention.set(self._retention)
+      try:
+        val = self._factories[attr](pending[attr])
+      finally:
+        _retention.reset(retention_token)
+        _lazy.reset(lazy_token)
+      setattr(self, attr, val)
+      del pending[attr]
+      return val
+
+    # Every field is an attribute, so only the keys kept in the raw mapping are left
+    try:
+      return self._raw_data[attr]
+    except (KeyError, TypeError):
+      # Raised as an AttributeError so that `hasattr` and the like still work
+      raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {attr!r}") from None
 
   def __getitem__(self, item):
     return self.raw[item]
 
   @classmethod
-  def from_dict(cls, raw: DictT):
-    """Constructs the model from a mapping"""
-    return cls(
-      _raw = raw,
-      **{
-        k: v
-        for k, v in raw.items()
-        if k in cls.__dataclass_fields__.keys()
-      }
-    )
+  def from_dict(
+    cls,
+    raw: DictT,
+    lazy: Optional[bool] = None,
+    retention: Optional[Union[Retention, str]] = None
+  ):
+    """Constructs the model from a mapping
+
+    If `lazy` is `True`, fields with a factory are only constructed on first access.
+    Defaults to lazy inside a `lazy_models` block.
+
+    `retention` decides how much of the mapping is kept by the model and its
+    nested models, see `Retention`. Defaults to the policy set by `retain_raw`,
+    which keeps everything.
+    """
+    if lazy is None:
+      lazy = _lazy.get()
+    retention = _retention.get() if retention is None else Retention(retention)
+    if lazy:
+      return cls._from_dict_lazy(raw, retention)
+    decode = cls._decode if type(raw) is dict or not isinstance(raw, TYPED) else cls._decode_typed
+    if retention is not _retention.get():
+      # Nested models are constructed by the factories, which only see the context
+      with retain_raw(retention):
+        return decode(raw, retention)
+    return decode(raw, retention)
+
+  @classmethod
+  def _from_dict_lazy(cls, raw: DictT, retention: Retention):
+    self = cls.__new__(cls)
+    self._retention = retention
+    self._raw_data = _retained(raw, retention, cls._field_keys)
+    pending = {}
+    for name, key, factory, default in cls._plan:
+      val = raw.get(key, default)
+      if val is MISSING:
+        raise TypeError(f"{cls.__name__}.from_dict() missing required field: '{key}'")
+      if factory is not None and not (val is None and default is None):
+        pending[name] = val
+      else:
+        setattr(self, name, val)
+    self._pending = pending
+    return self
+
+  def _detach_raw(self):
+    """Keeps only the unknown keys of the raw mapping, as it no longer matches the fields once they are changed"""
+    if getattr(self, "_retention", Retention.KEEP) is Retention.KEEP:
+      raw = getattr(self, "_raw_data", None)
+      self._raw_data = _retained(raw, Retention.COMPACT, self._field_keys) if raw is not None else None
+      self._retention = Retention.COMPACT
 
   @property
   def _to_dict(self) -> DictT:
     """Returns the model with it's values in a dictionary excluding private variables,
     not to be called directly"""
     d = {}
-    for k in self.__dataclass_fields__.keys():
-      if not k.startswith("_"):
-        if isinstance(k, Model):
-          d[k] = getattr(self, k).raw
-        else:
-          d[k] = getattr(self, k)
+    for name, key, _, default in self._plan:
+      if name.startswith("_"):
+        continue
+      v = getattr(self, name)
+      # Optional keys that were not in the mapping are left out, as they were
+      if v is None and default is None:
+        continue
+      d[key] = _encode(v)
     return d
 
   @property
   def raw(self) -> DictT:
-    """Returns the raw dictionary of the model"""
-    return self._raw if self._raw is not None else self._to_dict
+    """Returns the raw dictionary of the model
+
+    Unless the model keeps the whole mapping, this is rebuilt from the fields on every access,
+    so values are as decoded (e.g. `score` is a `float`) rather than as sent by the API.
+    """
+    raw = getattr(self, "_raw_data", None)
+    if getattr(self, "_retention", Retention.KEEP) is Retention.KEEP and raw is not None:
+      return raw
+    d = self._to_dict
+    if raw:
+      d.update(raw)
+    return d
 
 
 
 # Subpod models
 
-@dataclass
+@model
 class Image(Model[ImageDict]):
   width: int
   height: int
@@ -185,7 +459,7 @@ class Image(Model[ImageDict]):
     return f"Image(title={self.title}, alt={self.alt}, src={self.src})"
 
 
-@dataclass
+@model
 class Audio(Model[AudioDict]):
   type: str
   url: WolframURL = model_field(factory=WolframURL)
@@ -194,7 +468,7 @@ class Audio(Model[AudioDict]):
 
 # Assumptions
 
-@dataclass
+@model
 class Assumption(Model[AssumptionDict]):
   name: str
   desc: str
@@ -203,7 +477,7 @@ class Assumption(Model[AssumptionDict]):
   def __repr__(self):
     return f"Assumption(name={self.name})"
   
-@dataclass
+@model
 class AssumptionsCollection(Model[AssumptionsDict]):
   type: str
   template: str
@@ -243,19 +517,44 @@ class AssumptionsCollection(Model[AssumptionsDict]):
 
 # Warnings
 
-@dataclass
+@model
 class Warning(Model[WarningDict], Generic[DictT]):
+  """A warning about the query
+
+  Subclasses are registered by the key that only their kind of warning has,
+  e.g. `class SpellCheckWarning(Warning, discriminator="word")`, which is how
+  `to_subclass` picks the model for a warning. The subclass registered with
+  `default=True` is used for warnings without any of the keys.
+  """
   text: str
 
+  # Keyed by discriminator, the default subclass is kept under `None`
+  _registry: ClassVar[Dict[Optional[str], Type[Warning]]] = {}
+  _discriminator: ClassVar[Optional[str]] = None
+  _default: ClassVar[bool] = False
+
+  def __init_subclass__(cls, discriminator: Optional[str] = None, default: bool = False, **kwargs):
+    # Zero argument `super` would refer to the class before it was slotted
+    super(Warning, cls).__init_subclass__(**kwargs)
+    if discriminator is None and not default:
+      # Slotted dataclasses are created again without the class arguments
+      discriminator = cls.__dict__.get("_discriminator")
+      default = cls.__dict__.get("_default", False)
+    cls._discriminator = discriminator
+    cls._default = default
+    if discriminator is not None:
+      cls._registry[discriminator] = cls
+    if default:
+      cls._registry[None] = cls
+
   @classmethod
   def _find_cls(cls, warning: DictT):
-    for sub in cls.__subclasses__():
-      if all(
-        k in warning.keys() or k == "text"
-        for k in sub.__dataclass_fields__.keys()
-      ):
+    registry = cls._registry
+    for key in warning:
+      sub = registry.get(key)
+      if sub is not None:
         return sub
-    return cls
+    return registry.get(None, cls)
 
   @classmethod
   def to_subclass(cls, warning: DictT):
@@ -267,29 +566,29 @@ class Warning(Model[WarningDict], Generic[DictT]):
     """The warning message provided by Wolfram|Alpha"""
     return self.text
 
-@dataclass
-class SpellCheckWarning(Warning[SpellCheckWarningDict]):
+@model
+class SpellCheckWarning(Warning[SpellCheckWarningDict], discriminator="word"):
   word: str
   suggestion: str
 
-@dataclass
-class DelimiterWarning(Warning[DelimiterWarningDict]):
+@model
+class DelimiterWarning(Warning[DelimiterWarningDict], default=True):
   pass
 
-@dataclass
-class TranslationWarning(Warning[TranslationWarningDict]):
+@model
+class TranslationWarning(Warning[TranslationWarningDict], discriminator="phrase"):
   phrase: str
   trans: str
   lang: str
 
-@dataclass
+@model
 class Alternative(Model[AlternativeDict]):
   level: str
   val: str
   score: float = model_field(factory=float)
 
-@dataclass
-class ReinterpretWarning(Warning[ReinterpretWarningDict]):
+@model
+class ReinterpretWarning(Warning[ReinterpretWarningDict], discriminator="new"):
   new: str
   level: str
   score: float = model_field(factory=float)
@@ -307,13 +606,13 @@ class ReinterpretWarning(Warning[ReinterpretWarningDict]):
 
 # Queries that are not understood
 
-@dataclass
+@model
 class DidYouMean(Model[DidYouMeanDict]):
   level: str
   val: str
   score: float = model_field(factory=float)
 
-@dataclass
+@model
 class LanguageMsg(Model[LanguageMsgDict]):
   english: str
   other: str
@@ -322,21 +621,21 @@ class LanguageMsg(Model[LanguageMsgDict]):
   def msg(self):
     return f"{self.english}\n{self.other}"
 
-@dataclass
+@model
 class FutureTopic(Model[FutureTopicDict]):
   topic: str
   msg: str
 
-@dataclass
+@model
 class ExamplePage(Model[ExamplePageDict]):
   category: str
   url: WolframURL = model_field(factory=WolframURL)
 
-@dataclass
+@model
 class Tip(Model[TipsDict]):
   text: str
 
-@dataclass
+@model
 class Generalization(Model[GeneralizationDict]):
   topic: str
   desc: str
@@ -346,7 +645,7 @@ class Generalization(Model[GeneralizationDict]):
 
 # Errors usually caused by bad app ids
 
-@dataclass
+@model
 class Error(Model[ErrorDict]):
   msg: str
   code: int = model_field(factory=int)
@@ -355,14 +654,14 @@ class Error(Model[ErrorDict]):
 
 # Sources
 
-@dataclass
+@model
 class Source(Model[SourceDict]):
   text: str
   url: WolframURL = model_field(factory=WolframURL)
 
 
 
-@dataclass
+@model
 class SubPod(Model[SubPodDict]):
   title: str
   plaintext: Optional[str] = optional_field(
@@ -378,26 +677,37 @@ class SubPod(Model[SubPodDict]):
 
 
 
-@dataclass
+@model
 class Pod(Model[PodDict]):
   title: str
   position: int
   id: str
   numsubpods: int
+  # Deferred pods of `async` queries have no subpods until they are fetched
   subpods: List[SubPod] = model_field(
     factory=list_map_factory(
       SubPod.from_dict
-    )
+    ),
+    default=()
   )
   error: Optional[Error] = optional_field(
     factory=Error.from_dict,
     match=False
   )
   primary: bool = False
+  async_url: Optional[WolframURL] = optional_field(
+    factory=WolframURL,
+    key="async"
+  )
 
   def __repr__(self):
     return f"Pod(title={self.title}, numsubpods={self.numsubpods}, primary={self.primary})"
 
+  @property
+  def is_deferred(self) -> bool:
+    """If the pod is still being computed, and has to be fetched from `async_url`"""
+    return self.async_url is not None
+
   @property
   def text(self) -> Optional[str]:
     for subpod in self.subpods:
@@ -405,7 +715,7 @@ class Pod(Model[PodDict]):
         return subpod.plaintext
 
 
-@dataclass
+@model
 class FullResults(Model[FullResultsDict]):
   success: bool
   numpods: int
@@ -477,7 +787,65 @@ class FullResults(Model[FullResultsDict]):
 
   @property
   def is_error(self) -> bool:
-    return self.error is not None
+    # The API sends `"error": false` when there is no error
+    return bool(self.error)
+
+  def fork(self) -> FullResults:
+    """A copy of the result with a list of pods of its own, so replacing its pods does not change this result
+
+    The pods themselves are shared until they are replaced.
+    """
+    other = copy.copy(self)
+    pending = getattr(self, "_pending", None)
+    if pending:
+      # Otherwise reading a field of one result would take it from the other
+      other._pending = dict(pending)
+    if not (pending and "pods" in pending) and self.pods is not None:
+      other.pods = list(self.pods)
+    return other
+
+  def replace_pod(self, old: Pod, new: Pod) -> bool:
+    """Replaces a pod of the result, e.g. a deferred pod with the pod fetched for it
+
+    Returns `False` if the pod is no longer part of the result, e.g. after a `merge`.
+    """
+    for index, pod in enumerate(self.pods or ()):
+      if pod is old:
+        self.pods[index] = new
+        self._detach_raw()
+        return True
+    return False
+
+  def merge(self, other: FullResults) -> List[Pod]:
+    """Merges the pods of a recalculated result into this one, matching them by id
+
+    Pods are kept in order of position. Returns the pods that were added or replaced.
+    """
+    pods = list(self.pods or ())
+    index = {pod.id: i for i, pod in enumerate(pods)}
+    merged = []
+    for pod in other.pods or ():
+      i = index.get(pod.id)
+      if i is None:
+        pods.append(pod)
+      else:
+        pods[i] = pod
+      merged.append(pod)
+    pods.sort(key=lambda pod: pod.position)
+
+    if self.pods is None:
+      self.pods = pods
+    else:
+      self.pods[:] = pods
+    self.numpods = len(pods)
+    self.recalculate = other.recalculate
+    self._detach_raw()
+    return merged
+
+  @property
+  def deferred(self) -> List[Pod]:
+    """The pods that are still being computed, only sent by `async` queries"""
+    return [pod for pod in self.pods or () if pod.is_deferred]
 
   @property
   def primary(self) -> Optional[Pod]:
@@ -504,7 +872,7 @@ class FullResults(Model[FullResultsDict]):
     A fallthrough result occurs when the API does not understand your query.
     For more information, read https://products.wolframalpha.com/api/documentation/#queries-that-are-not-understood
     """
-    return not self.success and self.error is None
+    return not self.success and not self.error
 
   @property
   def fallthrough(self):
@@ -515,7 +883,7 @@ class FullResults(Model[FullResultsDict]):
 
 
 
-@dataclass
+@model
 class ConversationalResults(Model[ConversationalResultsDict]):
   conversationID: str
   host: str
@@ -546,26 +914,61 @@ class ConversationalResults(Model[ConversationalResultsDict]):
 
 try:
   from PIL import Image as _Image
-  from io import StringIO
 except ImportError:
   _Image = None
 
 class SimpleImage:
-  """Represents an image given via the Simple API"""
-  def __init__(self, data: bytes):
-    self._data = data
+  """Represents an image given via the Simple API
+
+  The image is kept in a :class:`~wolfram.spool.SpooledBuffer`, in memory while it is small
+  and in a temporary file otherwise. Use `open` or `view` to read it without copying,
+  e.g. `discord.File(image.open(), "result.gif")`.
+  """
+  def __init__(self, data: Union[bytes, SpooledBuffer]):
+    self._buffer = data if isinstance(data, SpooledBuffer) else SpooledBuffer.from_bytes(data)
+
+  @property
+  def size(self) -> int:
+    """The size of the image data, in bytes"""
+    return self._buffer.size
 
   @property
   def data(self) -> bytes:
-    """Returns the raw image data"""
-    return self._data
+    """Returns the raw image data, this reads the whole file if the image is not in memory"""
+    return self._buffer.getvalue()
+
+  async def aread(self) -> bytes:
+    """|coro|
+
+    Same as `data`, but reads the file in a thread
+    """
+    if not self._buffer.rolled:
+      return self._buffer.getvalue()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, self._buffer.getvalue)
+
+  def open(self) -> BinaryIO:
+    """Opens a new read-only file object of the image data"""
+    return self._buffer.open()
+
+  def view(self) -> memoryview:
+    """A read-only view of the image data"""
+    return self._buffer.view()
 
   def get_image(self) -> _Image.Image:
     if _Image is None:
       raise Exception("pillow must be installed to convert to image")
-    return _Image.open(StringIO(self.data))
+    return _Image.open(self.open())
 
   def save_to(self, fp: str):
-    """Saves the image to a specified file path"""
-    img = self.get_image()
-    img.save(fp)
\ No newline at end of file
+    """Saves the image data as it was sent to a specified file path"""
+    with self.open() as src, open(fp, "wb") as dst:
+      shutil.copyfileobj(src, dst, CHUNK_SIZE)
+
+  async def asave_to(self, fp: str):
+    """|coro|
+
+    Same as `save_to`, but writes the file in a thread
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, self.save_to, fp)
\ No newline at end of file
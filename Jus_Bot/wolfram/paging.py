@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .ratelimit import Priority
+
+if TYPE_CHECKING:
+  from .client import AsyncClient
+  from .models import FullResults
+
+def _retrieve_exception(task: asyncio.Task):
+  # Prefetched pages may fail without anyone waiting for them
+  if not task.cancelled():
+    task.exception()
+
+class PagedQuery:
+  """
+  Fetches the pods of a FullResults query a few at a time, not meant to be created directly
+
+  Every page is a separate query for the pods at its `podindex`, so pods that are never
+  looked at are never computed. A page with fewer pods than `page_size` is the last one.
+
+  Parameters
+  ----------
+  client: :class:`~wolfram.AsyncClient`
+    The client to send the queries with.
+  input: `str`
+    The input string to query.
+  page_size: Optional[:class:`int`]
+    The number of pods per page, `None` fetches every pod as a single page.
+  params:
+    The other parameters passed to every query.
+  """
+
+  def __init__(self, client: AsyncClient, input: str, page_size: Optional[int], params: dict):
+    if page_size is not None and page_size < 1:
+      raise ValueError("page_size must be at least 1")
+    self.client = client
+    self.input = input
+    self.page_size = page_size
+    self.params = params
+
+    self._pages: Dict[int, asyncio.Task] = {}
+    self._last_page: Optional[int] = None
+
+  def podindex(self, page: int) -> List[int]:
+    """The indexes of the pods on a page, starting from 1 like the API"""
+    start = page * self.page_size + 1
+    return list(range(start, start + self.page_size))
+
+  def has_page(self, page: int) -> bool:
+    """Whether a page may have pods, `False` once it is known to be past the last page"""
+    if self.page_size is None:
+      return page == 0
+    return self._last_page is None or page <= self._last_page
+
+  async def _fetch(self, page: int, priority: int, params: dict) -> FullResults:
+    if self.page_size is not None:
+      params = dict(params, podindex=self.podindex(page))
+    result = await self.client.full_results_query(self.input, priority=priority, **self.params, **params)
+    if self.page_size is None or len(result.pods or ()) < self.page_size:
+      if self._last_page is None or page < self._last_page:
+        self._last_page = page
+    return result
+
+  def _task(self, page: int, priority: int, params: dict) -> asyncio.Task:
+    task = self._pages.get(page)
+    if task is None or (task.done() and not task.cancelled() and task.exception() is not None):
+      # Failed pages are fetched again
+      task = self._pages[page] = asyncio.ensure_future(self._fetch(page, priority, params))
+      task.add_done_callback(_retrieve_exception)
+    return task
+
+  async def page(self, page: int, *, priority: int = Priority.NORMAL, **params) -> Optional[FullResults]:
+    """|coro|
+
+    Gets a page, fetching it unless it was fetched or prefetched before.
+    Returns `None` if the page is past the last page.
+
+    `params` are only sent if the page is not being fetched already, e.g. `async_pods` for the first page.
+    """
+    if not self.has_page(page):
+      return None
+    # Shielded so that a cancelled caller does not throw away the page
+    return await asyncio.shield(self._task(page, priority, params))
+
+  def prefetch(self, page: int):
+    """Starts fetching a page in the background, if it may have pods"""
+    if self.page_size is not None and self.has_page(page):
+      self._task(page, Priority.BACKGROUND, {})
+
+  def cancel(self):
+    """Cancels the pages that are still being fetched"""
+    for task in self._pages.values():
+      task.cancel()
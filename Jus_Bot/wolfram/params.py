@@ -15,6 +15,22 @@ class Units(WolframEnum):
   METRIC = "metric"
   IMPERIAL = "imperial"
 
+class Profile(WolframEnum):
+  """How much of every pod the FullResults API sends, the parameters of each are in `PROFILE_PARAMS`"""
+  TEXT_ONLY = "text-only"
+  TEXT_IMAGE = "text+img"
+  FULL = "full"
+
+# Pods that are only a picture, they have no plaintext to show without images
+IMAGE_PODS = ("Plot", "Plots", "3DPlot", "ContourPlot", "NumberLine", "VisualRepresentation")
+
+# Parameters given to a query take precedence over those of its profile
+PROFILE_PARAMS = {
+  Profile.TEXT_ONLY: {"format": ("plaintext",), "excludepodid": IMAGE_PODS},
+  Profile.TEXT_IMAGE: {"format": ("plaintext", "image")},
+  Profile.FULL: {"format": ("plaintext", "image", "imagemap", "minput", "moutput", "sound")}
+}
+
 
 
 class LatLong:
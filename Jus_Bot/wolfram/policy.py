@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import random
+
+from collections import deque
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Dict, FrozenSet, Optional, Tuple, Type
+
+from .exceptions import RequestTimeout, TransportError
+from .transport import Timeout
+
+if TYPE_CHECKING:
+  from .transport import Response
+
+# Statuses of failures that may not happen again. 501 means the input was not understood, so it is not one
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+class RequestPolicy:
+  """
+  How the requests of an API are timed out, retried and hedged
+
+  Every request the client sends is a GET, so any of them can safely be sent again.
+  Only failures that may not happen again are retried: timeouts, connection errors
+  and the statuses in `RETRY_STATUSES`. Retries wait a random time of up to `backoff`,
+  doubling with every retry until `max_backoff`, so that clients do not retry in lockstep.
+
+  Hedging sends a second request once the first takes longer than the `hedge_quantile`
+  of recent latencies, and takes whichever successful response comes first. This cuts the slowest
+  responses at the cost of the hedged requests, so it is only for async clients and off by default.
+  Every attempt is admitted by the rate limiter on its own. An attempt that is refused instead of
+  being sent, e.g. because the budget is spent, ends the request with the outcome of the attempt before it.
+
+  Parameters
+  ----------
+  connect_timeout: Optional[:class:`float`]
+    How long connecting may take, in seconds. Defaults to `5`
+  total_timeout: Optional[:class:`float`]
+    How long a single attempt may take, in seconds. Defaults to `20`
+  retries: :class:`int`
+    The number of times a failed request is sent again. Defaults to `2`
+  backoff: :class:`float`
+    The longest wait before the first retry, in seconds. Defaults to `0.25`
+  max_backoff: :class:`float`
+    The longest wait before any retry, in seconds. Defaults to `4`
+  hedge: :class:`bool`
+    Whether slow requests are hedged. Defaults to `False`
+  hedge_quantile: :class:`float`
+    The quantile of recent latencies after which a request is hedged. Defaults to `0.95`
+  min_samples: :class:`int`
+    The number of latencies needed before requests are hedged. Defaults to `20`
+  """
+
+  def __init__(
+    self,
+    connect_timeout: Optional[float] = 5.0,
+    total_timeout: Optional[float] = 20.0,
+    retries: int = 2,
+    backoff: float = 0.25,
+    max_backoff: float = 4.0,
+    hedge: bool = False,
+    hedge_quantile: float = 0.95,
+    min_samples: int = 20
+  ):
+    self.timeout = Timeout(connect_timeout, total_timeout)
+    self.retries = retries
+    self.backoff = backoff
+    self.max_backoff = max_backoff
+    self.hedge = hedge
+    self.hedge_quantile = hedge_quantile
+    self.min_samples = min_samples
+
+    self._latencies: Deque[float] = deque(maxlen=200)
+
+    self.requests = 0
+    self.attempts = 0
+    self.retried = 0
+    self.timeouts = 0
+    self.failures = 0
+    self.hedged = 0
+    self.hedge_wins = 0
+    self.latency = 0.0
+
+  def copy(self) -> RequestPolicy:
+    """A policy with the same settings and fresh counters"""
+    return RequestPolicy(
+      self.timeout.connect,
+      self.timeout.total,
+      self.retries,
+      self.backoff,
+      self.max_backoff,
+      self.hedge,
+      self.hedge_quantile,
+      self.min_samples
+    )
+
+  def quantile(self, q: float) -> Optional[float]:
+    """A quantile of the latencies of recent requests in seconds, `None` without any"""
+    if not self._latencies:
+      return None
+    latencies = sorted(self._latencies)
+    return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+  @property
+  def stats(self) -> Dict[str, float]:
+    """The policy counters, latencies are in seconds"""
+    return {
+      "requests": self.requests,
+      "attempts": self.attempts,
+      "retried": self.retried,
+      "timeouts": self.timeouts,
+      "failures": self.failures,
+      "hedged": self.hedged,
+      "hedge_wins": self.hedge_wins,
+      "latency": self.latency,
+      "p50": self.quantile(0.5),
+      "p95": self.quantile(0.95)
+    }
+
+  def hedge_delay(self) -> Optional[float]:
+    """How long to wait before hedging a request, `None` if it should not be hedged"""
+    if not self.hedge or len(self._latencies) < self.min_samples:
+      return None
+    return self.quantile(self.hedge_quantile)
+
+  def backoff_for(self, retry: int) -> float:
+    """The time to wait before a retry, with full jitter"""
+    return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** retry))
+
+  def _should_retry(self, retry: int, resp: Optional[Response], error: Optional[Exception]) -> bool:
+    if isinstance(error, RequestTimeout):
+      self.timeouts += 1
+    failed = error is not None or resp.status in RETRY_STATUSES
+    if failed and retry < self.retries:
+      self.retried += 1
+      return True
+    return False
+
+  def _done(self, start: float, resp: Optional[Response]):
+    elapsed = perf_counter() - start
+    self.latency += elapsed
+    if resp is not None and resp.status < 400:
+      self._latencies.append(elapsed)
+    else:
+      self.failures += 1
+
+  def send(
+    self,
+    request: Callable[[Timeout], Response],
+    refused: Tuple[Type[Exception], ...] = ()
+  ) -> Response:
+    """Sends a sync request with the policy, `request` sends a single attempt.
+    It raises one of `refused` if the attempt was not sent, which is only raised
+    for the first attempt. Sync requests are never hedged.
+    """
+    self.requests += 1
+    start = perf_counter()
+    retry = 0
+    resp, error = None, None
+    while True:
+      self.attempts += 1
+      try:
+        resp, error = request(self.timeout), None
+      except refused as e:
+        if not retry:
+          error = e
+        break
+      except TransportError as e:
+        resp, error = None, e
+      if not self._should_retry(retry, resp, error):
+        break
+      sleep(self.backoff_for(retry))
+      retry += 1
+
+    self._done(start, resp)
+    if error is not None:
+      raise error
+    return resp
+
+  async def asend(
+    self,
+    request: Callable[[Timeout], Awaitable[Response]],
+    refused: Tuple[Type[Exception], ...] = ()
+  ) -> Response:
+    """|coro|
+
+    Sends an async request with the policy, `request` sends a single attempt.
+    It raises one of `refused` if the attempt was not sent, which is only raised
+    for the first attempt, and a refused hedge is not waited for.
+    """
+    self.requests += 1
+    start = perf_counter()
+    retry = 0
+    resp, error = None, None
+    while True:
+      try:
+        resp, error = await self._hedged(request), None
+      except refused as e:
+        if not retry:
+          error = e
+        break
+      except TransportError as e:
+        resp, error = None, e
+      if not self._should_retry(retry, resp, error):
+        break
+      await asyncio.sleep(self.backoff_for(retry))
+      retry += 1
+
+    self._done(start, resp)
+    if error is not None:
+      raise error
+    return resp
+
+  async def _hedged(self, request: Callable[[Timeout], Awaitable[Response]]) -> Response:
+    self.attempts += 1
+    delay = self.hedge_delay()
+    first = asyncio.ensure_future(request(self.timeout))
+    if delay is None:
+      return await first
+
+    try:
+      done, _ = await asyncio.wait({first}, timeout=delay)
+    except asyncio.CancelledError:
+      first.cancel()
+      raise
+    if done:
+      return first.result()
+
+    self.attempts += 1
+    self.hedged += 1
+    second = asyncio.ensure_future(request(self.timeout))
+    pending = {first, second}
+    try:
+      while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        # A server error may be fast, so it does not cancel an attempt that may still succeed
+        succeeded = [
+          task for task in done
+          if task.exception() is None and task.result().status not in RETRY_STATUSES
+        ]
+        if succeeded:
+          self.hedge_wins += succeeded[0] is second
+          return succeeded[0].result()
+        # The other request may still succeed if this one failed. If both failed
+        # the first one is raised, as the hedged one may not have been sent at all
+        if not pending:
+          return first.result()
+    finally:
+      for task in pending:
+        task.cancel()
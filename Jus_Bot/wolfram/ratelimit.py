@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from enum import IntEnum
+from itertools import count
+from time import monotonic
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import BudgetExhausted
+
+log = logging.getLogger(__name__)
+
+class Priority(IntEnum):
+  """The priority of a request, lower values are served first"""
+  INTERACTIVE = 0
+  NORMAL = 5
+  BACKGROUND = 10
+
+
+
+class TokenBucket:
+  """
+  A token bucket, refilled continuously
+
+  Parameters
+  ----------
+  rate: :class:`float`
+    The number of tokens added per second.
+  capacity: :class:`int`
+    The maximum number of tokens, which is the largest burst allowed.
+  """
+
+  def __init__(self, rate: float, capacity: int):
+    self.rate = rate
+    self.capacity = capacity
+    self._tokens = float(capacity)
+    self._updated = monotonic()
+
+  def _refill(self):
+    now = monotonic()
+    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+    self._updated = now
+
+  @property
+  def tokens(self) -> float:
+    """The number of tokens currently available"""
+    self._refill()
+    return self._tokens
+
+  def try_take(self) -> bool:
+    """Takes a token if one is available"""
+    self._refill()
+    if self._tokens >= 1:
+      self._tokens -= 1
+      return True
+    return False
+
+  def give_back(self):
+    """Returns a token that was taken but not used"""
+    self._tokens = min(self.capacity, self._tokens + 1)
+
+  def delay(self) -> float:
+    """The time until a token is available, in seconds"""
+    self._refill()
+    return max(0.0, (1 - self._tokens) / self.rate)
+
+
+
+class _Gate:
+  """Admits requests for an app id, by priority, once a token and a concurrency slot are free"""
+
+  def __init__(self, bucket: TokenBucket, max_concurrency: int):
+    self.bucket = bucket
+    self.slots = max_concurrency
+
+    self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+    self._seq = count()
+    self._timer: Optional[asyncio.TimerHandle] = None
+
+    # The sync client cannot take part in the priority queue, it just waits its turn
+    self._cond = threading.Condition()
+
+  def _dispatch(self):
+    self._timer = None
+    while self._waiters and self.slots > 0:
+      if not self.bucket.try_take():
+        loop = asyncio.get_running_loop()
+        self._timer = loop.call_later(self.bucket.delay(), self._dispatch)
+        return
+      _, _, fut = heapq.heappop(self._waiters)
+      if fut.done(): # Cancelled while waiting
+        self.bucket.give_back()
+        continue
+      self.slots -= 1
+      fut.set_result(None)
+
+  async def acquire(self, priority: int):
+    if not self._waiters and self.slots > 0 and self.bucket.try_take():
+      self.slots -= 1
+      return
+
+    fut = asyncio.get_running_loop().create_future()
+    heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+    if self._timer is None:
+      self._dispatch()
+    try:
+      await fut
+    except asyncio.CancelledError:
+      if fut.done() and not fut.cancelled():
+        # The slot was granted just as the caller got cancelled
+        self.release()
+      raise
+
+  def release(self):
+    self.slots += 1
+    if self._waiters and self._timer is None:
+      self._dispatch()
+
+  def acquire_sync(self):
+    with self._cond:
+      while not (self.slots > 0 and self.bucket.try_take()):
+        self._cond.wait(self.bucket.delay() or None)
+      self.slots -= 1
+
+  def release_sync(self):
+    with self._cond:
+      self.slots += 1
+      self._cond.notify()
+
+
+
+class QuotaGovernor:
+  """
+  Keeps requests of each app id within its allowance
+
+  Requests are admitted by a token bucket per app id and a cap on concurrent requests,
+  waiters with a higher `Priority` are served first. Every admitted request is counted
+  against a monthly budget, once it is spent `BudgetExhausted` is raised without
+  contacting the API.
+
+  Parameters
+  ----------
+  rate: :class:`float`
+    The number of requests allowed per second. Defaults to `1`
+  burst: :class:`int`
+    The number of requests that can be sent at once after being idle. Defaults to `5`
+  max_concurrency: :class:`int`
+    The maximum number of concurrent requests per app id. Defaults to `4`
+  monthly_budget: Optional[:class:`int`]
+    The number of requests allowed per calendar month (UTC), `None` for no limit.
+    Defaults to `2000`, the allowance of the free plan
+  budget_path: Optional[`str`]
+    The path of the JSON file the monthly usage is kept in, so it survives restarts.
+    If not given, usage is only tracked in memory.
+
+  Note that a governor should only be shared between clients of the same kind,
+  as the sync `Client` does not take part in the priority queue.
+  """
+
+  def __init__(
+    self,
+    rate: float = 1.0,
+    burst: int = 5,
+    max_concurrency: int = 4,
+    monthly_budget: Optional[int] = 2000,
+    budget_path: Optional[str] = None
+  ):
+    self.rate = rate
+    self.burst = burst
+    self.max_concurrency = max_concurrency
+    self.monthly_budget = monthly_budget
+    self.budget_path = budget_path
+
+    self._gates: Dict[str, _Gate] = {}
+    self._month = self._current_month()
+    self._used: Dict[str, int] = {}
+    self._lock = threading.Lock()
+    # Held while the usage is written, so that concurrent requests do not race to replace the file
+    self._save_lock = threading.Lock()
+    self._load()
+
+  @staticmethod
+  def _current_month() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m")
+
+  def _load(self):
+    if self.budget_path is None or not os.path.exists(self.budget_path):
+      return
+    with open(self.budget_path, "r") as f:
+      data = json.load(f)
+    if data.get("month") == self._month:
+      self._used = data.get("used", {})
+
+  def _save(self):
+    """Writes the usage to `budget_path`, a failure is logged instead of failing the request"""
+    if self.budget_path is None:
+      return
+    with self._save_lock:
+      with self._lock:
+        data = {"month": self._month, "used": dict(self._used)}
+      tmp = None
+      try:
+        with tempfile.NamedTemporaryFile(
+          "w", dir=os.path.dirname(os.path.abspath(self.budget_path)), suffix=".tmp", delete=False
+        ) as f:
+          tmp = f.name
+          json.dump(data, f)
+        os.replace(tmp, self.budget_path)
+      except OSError:
+        log.exception("Failed to save the Wolfram|Alpha budget usage to %s", self.budget_path)
+        if tmp is not None and os.path.exists(tmp):
+          os.remove(tmp)
+
+  def _gate(self, appid: str) -> _Gate:
+    gate = self._gates.get(appid)
+    if gate is None:
+      gate = _Gate(TokenBucket(self.rate, self.burst), self.max_concurrency)
+      self._gates[appid] = gate
+    return gate
+
+  def used(self, appid: str) -> int:
+    """The number of requests sent with the app id this month"""
+    self._check_month()
+    return self._used.get(appid, 0)
+
+  def remaining(self, appid: str) -> Optional[int]:
+    """The number of requests left in the monthly budget of the app id, `None` for no limit"""
+    if self.monthly_budget is None:
+      return None
+    return max(0, self.monthly_budget - self.used(appid))
+
+  def _check_month(self):
+    month = self._current_month()
+    if month != self._month:
+      with self._lock:
+        self._month = month
+        self._used = {}
+
+  def _spend(self, appid: str):
+    """Counts a request against the budget, raising if the budget was already spent"""
+    self._check_month()
+    with self._lock:
+      used = self._used.get(appid, 0)
+      if self.monthly_budget is not None and used >= self.monthly_budget:
+        raise BudgetExhausted(
+          f"the monthly budget of {self.monthly_budget} requests has been exhausted"
+        )
+      self._used[appid] = used + 1
+
+  def _refund(self, appid: str):
+    with self._lock:
+      self._used[appid] = max(0, self._used.get(appid, 0) - 1)
+
+  @asynccontextmanager
+  async def limit(self, appid: str, priority: int = Priority.NORMAL) -> AsyncIterator[None]:
+    """Waits until a request can be sent with the app id, and holds a concurrency slot
+
+    Raises
+    ------
+    ~wolfram.BudgetExhausted
+      The monthly budget has been spent.
+    """
+    gate = self._gate(appid)
+    self._spend(appid)
+    try:
+      await gate.acquire(priority)
+    except BaseException:
+      self._refund(appid)
+      raise
+
+    try:
+      if self.budget_path is not None:
+        await asyncio.get_running_loop().run_in_executor(None, self._save)
+      yield
+    finally:
+      gate.release()
+
+  @contextmanager
+  def limit_sync(self, appid: str) -> Iterator[None]:
+    """Same as `limit`, but blocks the current thread. Priorities are not supported"""
+    gate = self._gate(appid)
+    self._spend(appid)
+    gate.acquire_sync()
+    try:
+      self._save()
+      yield
+    finally:
+      gate.release_sync()
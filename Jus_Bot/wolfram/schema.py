@@ -0,0 +1,173 @@
+"""
+Typed decoding of responses, with msgspec structs generated from the TypedDicts in `types.py`
+
+A response is decoded and validated in one pass straight from the body. The structs
+behave as read-only mappings, so `Model.from_dict` constructs models from them
+like it does from dicts. Keys that `types.py` does not describe are not kept.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+  Any,
+  Dict,
+  Iterator,
+  List,
+  Literal,
+  Tuple,
+  Type,
+  Union,
+  get_args,
+  get_origin,
+  get_type_hints,
+  is_typeddict
+)
+
+from . import types
+from .exceptions import InvalidResponse
+
+try:
+  import msgspec
+except ImportError:
+  msgspec = None
+
+AVAILABLE = msgspec is not None
+
+_typed: ContextVar[bool] = ContextVar("typed_decoding", default=False)
+
+@contextmanager
+def typed_decoding(enabled: bool = True) -> Iterator[None]:
+  """Makes the FullResults API decode responses into typed structs within the block"""
+  if enabled and not AVAILABLE:
+    raise RuntimeError("msgspec must be installed for typed decoding")
+  token = _typed.set(enabled)
+  try:
+    yield
+  finally:
+    _typed.reset(token)
+
+def typed_decoding_enabled() -> bool:
+  """Whether responses are decoded into typed structs in the current context"""
+  return _typed.get()
+
+
+
+if AVAILABLE:
+  UNSET = msgspec.UNSET
+
+  class TypedResponse(msgspec.Struct):
+    """The base of the generated structs, unset fields are treated as missing keys"""
+
+    def get(self, key: str, default: Any = None) -> Any:
+      value = getattr(self, key, UNSET)
+      return default if value is UNSET else value
+
+    def __getitem__(self, key: str) -> Any:
+      value = getattr(self, key, UNSET) if key in self.__struct_fields__ else UNSET
+      if value is UNSET:
+        raise KeyError(key)
+      return value
+
+    def __contains__(self, key: str) -> bool:
+      return key in self.__struct_fields__ and getattr(self, key) is not UNSET
+
+    def __iter__(self) -> Iterator[str]:
+      for name in self.__struct_fields__:
+        if getattr(self, name) is not UNSET:
+          yield name
+
+    def keys(self) -> Iterator[str]:
+      return iter(self)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+      for name in self.__struct_fields__:
+        value = getattr(self, name)
+        if value is not UNSET:
+          yield name, value
+else:
+  UNSET = object()
+  TypedResponse = None
+
+_structs: Dict[Any, Type] = {}
+
+def _struct_name(typed_dict: type) -> str:
+  return typed_dict.__name__[:-len("Dict")] + "Struct"
+
+def _field_type(tp: Any) -> Any:
+  """Translates a type used in `types.py` into one msgspec can decode"""
+  if is_typeddict(tp):
+    return struct_for(tp)
+
+  origin = get_origin(tp)
+  if origin is Literal:
+    # Literals are only used to document the values the API sends, e.g. `false` for no error
+    return type(get_args(tp)[0])
+  if origin is list:
+    return List[_field_type(get_args(tp)[0])]
+  if origin is Union:
+    args = get_args(tp)
+    dicts = tuple(arg for arg in args if is_typeddict(arg))
+    others = [_field_type(arg) for arg in args if not is_typeddict(arg)]
+    # msgspec cannot tell structs apart without a tag, so alternatives are merged into one
+    if len(dicts) > 1:
+      others.append(_merged_struct(dicts))
+    elif dicts:
+      others.append(struct_for(dicts[0]))
+    return Union[tuple(others)]
+  return tp
+
+def _define(name: str, hints: Dict[str, Any]) -> Type:
+  struct = msgspec.defstruct(
+    name,
+    [(key, Union[_field_type(tp), msgspec.UnsetType], UNSET) for key, tp in hints.items()],
+    bases=(TypedResponse,),
+    module=__name__
+  )
+  # Kept as module attributes so that the structs can be pickled
+  globals()[name] = struct
+  return struct
+
+def _merged_struct(typed_dicts: Tuple[type, ...]) -> Type:
+  struct = _structs.get(typed_dicts)
+  if struct is None:
+    hints: Dict[str, Any] = {}
+    for typed_dict in typed_dicts:
+      for key, tp in get_type_hints(typed_dict).items():
+        hints[key] = Union[hints[key], tp] if key in hints else tp
+    name = "Or".join(_struct_name(typed_dict)[:-len("Struct")] for typed_dict in typed_dicts) + "Struct"
+    struct = _structs[typed_dicts] = _define(name, hints)
+  return struct
+
+def struct_for(typed_dict: type) -> Type:
+  """Gets the struct generated from a TypedDict, every key is optional"""
+  if not AVAILABLE:
+    raise RuntimeError("msgspec must be installed for typed decoding")
+  struct = _structs.get(typed_dict)
+  if struct is None:
+    struct = _structs[typed_dict] = _define(_struct_name(typed_dict), get_type_hints(typed_dict))
+  return struct
+
+_full_results_decoder = None
+
+def decode_full_results(data: bytes) -> Any:
+  """Decodes the `queryresult` of a FullResults API response into a typed struct
+
+  Raises
+  ------
+  ~wolfram.exceptions.InvalidResponse
+    The response is not valid JSON, or does not match `types.FullResultsDict`.
+  """
+  global _full_results_decoder
+  if _full_results_decoder is None:
+    envelope = msgspec.defstruct(
+      "FullResultsResponse",
+      [("queryresult", struct_for(types.FullResultsDict))],
+      module=__name__
+    )
+    globals()["FullResultsResponse"] = envelope
+    _full_results_decoder = msgspec.json.Decoder(envelope)
+  try:
+    return _full_results_decoder.decode(data).queryresult
+  except msgspec.DecodeError as e:
+    raise InvalidResponse(str(e)) from e
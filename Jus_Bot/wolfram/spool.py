@@ -0,0 +1,123 @@
+"""
+Binary buffers that are kept in memory while small, and in a temporary file once they grow
+"""
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import tempfile
+import weakref
+
+from typing import BinaryIO, Iterable, Optional
+
+# Bodies up to this size are kept in memory
+SPOOL_SIZE = 1024 * 1024
+# The size of the chunks bodies are streamed in
+CHUNK_SIZE = 64 * 1024
+
+def _remove(path: str):
+  try:
+    os.remove(path)
+  except OSError:
+    pass
+
+class SpooledBuffer:
+  """
+  A write-once buffer of bytes that moves to a temporary file when it grows past `max_size`
+
+  The buffer is written to in chunks, then `finish` makes it read-only.
+  Once finished, every call to `open` gets its own file object, so readers never
+  share a position. The temporary file is removed when the buffer is garbage collected.
+
+  Parameters
+  ----------
+  max_size: `int`
+    The largest size that is kept in memory, in bytes.
+  """
+
+  def __init__(self, max_size: int = SPOOL_SIZE):
+    self.max_size = max_size
+    self._memory: Optional[io.BytesIO] = io.BytesIO()
+    self._data: Optional[bytes] = None
+    self._file: Optional[BinaryIO] = None
+    self._path: Optional[str] = None
+    self._size = 0
+
+  @classmethod
+  def from_bytes(cls, data: bytes) -> SpooledBuffer:
+    """Wraps bytes that are already in memory, without copying them"""
+    self = cls(max_size=len(data))
+    self._memory = None
+    self._data = data
+    self._size = len(data)
+    return self
+
+  @property
+  def size(self) -> int:
+    """The number of bytes written"""
+    return self._size
+
+  @property
+  def rolled(self) -> bool:
+    """Whether the buffer was moved to a temporary file"""
+    return self._path is not None
+
+  @property
+  def finished(self) -> bool:
+    return self._memory is None and self._file is None
+
+  def write(self, chunk: bytes):
+    if self.finished:
+      raise ValueError("cannot write to a finished buffer")
+    self._size += len(chunk)
+    if self._file is None and self._size > self.max_size:
+      fd, self._path = tempfile.mkstemp(prefix="jusbot-", suffix=".spool")
+      weakref.finalize(self, _remove, self._path)
+      self._file = os.fdopen(fd, "wb")
+      self._file.write(self._memory.getbuffer())
+      self._memory = None
+    (self._file or self._memory).write(chunk)
+
+  def writelines(self, chunks: Iterable[bytes]):
+    for chunk in chunks:
+      self.write(chunk)
+
+  def finish(self) -> SpooledBuffer:
+    """Stops writing to the buffer, it can be read from afterwards"""
+    if self._file is not None:
+      self._file.close()
+      self._file = None
+    elif self._memory is not None:
+      # Shares the buffer of the BytesIO instead of copying it
+      self._data = self._memory.getvalue()
+      self._memory = None
+    return self
+
+  def _check(self):
+    if not self.finished:
+      raise ValueError("buffer is still being written to")
+
+  def open(self) -> BinaryIO:
+    """Opens a new read-only file object at the start of the buffer, e.g. to pass to `discord.File`"""
+    self._check()
+    if self._path is not None:
+      return open(self._path, "rb")
+    # BytesIO shares the bytes until it is written to
+    return io.BytesIO(self._data)
+
+  def view(self) -> memoryview:
+    """A read-only view of the buffer, the file is memory mapped if it was rolled over"""
+    self._check()
+    if self._path is not None:
+      with open(self._path, "rb") as f:
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    return memoryview(self._data)
+
+  def getvalue(self) -> bytes:
+    """The contents of the buffer as bytes, only copied if the buffer was rolled over"""
+    self._check()
+    if self._path is not None:
+      with open(self._path, "rb") as f:
+        return f.read()
+    return self._data
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import zlib
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from hashlib import sha1
+from threading import Lock
+from time import monotonic, time
+from typing import TYPE_CHECKING, Dict, Hashable, Mapping, Optional, Type
+
+if TYPE_CHECKING:
+  from .api import API
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+  key TEXT PRIMARY KEY,
+  data BLOB NOT NULL,
+  size INTEGER NOT NULL,
+  expires REAL NOT NULL,
+  accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+"""
+
+class DiskCache:
+  """
+  A persistent cache of raw API responses, kept in a SQLite file
+
+  This is meant to be used as a second tier behind a `ResultCache`, so results
+  survive restarts. Only APIs with `PERSIST` set are stored, and responses are
+  compressed with zlib. Every database operation runs on a single worker thread,
+  async callers should use the `a`-prefixed methods so the event loop never blocks on disk.
+
+  Parameters
+  ----------
+  path: `str`
+    The path to the SQLite file.
+  max_bytes: :class:`int`
+    The maximum total size of the compressed responses, in bytes.
+    The least recently used responses are removed when vacuuming. Defaults to 64 MiB
+  ttls: Optional[Mapping[Type[:class:`~wolfram.api.API`], :class:`float`]]
+    The time to live of entries, in seconds, by API. APIs that are not
+    specified use their `PERSIST_TTL`
+  compress_level: :class:`int`
+    The zlib compression level. Defaults to `6`
+  vacuum_interval: :class:`float`
+    How often expired and excess entries are removed, in seconds. Defaults to `600`
+  """
+
+  def __init__(
+    self,
+    path: str,
+    max_bytes: int = 64 * 1024 * 1024,
+    ttls: Optional[Mapping[Type[API], float]] = None,
+    compress_level: int = 6,
+    vacuum_interval: float = 600.0
+  ):
+    self.path = path
+    self.max_bytes = max_bytes
+    self.ttls: Dict[Type[API], Optional[float]] = dict(ttls or {})
+    self.compress_level = compress_level
+    self.vacuum_interval = vacuum_interval
+
+    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wolfram-diskcache")
+    self._lock = Lock()
+    self._db = sqlite3.connect(path, check_same_thread=False)
+    self._db.executescript(_SCHEMA)
+    self._last_vacuum = monotonic()
+    self._vacuuming: Optional[Future] = None
+
+    self.hits = 0
+    self.misses = 0
+
+  @property
+  def stats(self) -> Dict[str, int]:
+    """The cache counters, async callers should use `astats`"""
+    with self._lock:
+      entries, size = self._db.execute("SELECT COUNT(*), TOTAL(size) FROM results").fetchone()
+    return {
+      "hits": self.hits,
+      "misses": self.misses,
+      "entries": entries,
+      "bytes": int(size)
+    }
+
+  def ttl_for(self, api: Type[API]) -> Optional[float]:
+    """Gets the time to live of entries for an API, `None` if it should not be stored"""
+    if not api.PERSIST:
+      return None
+    return self.ttls.get(api, api.PERSIST_TTL)
+
+  @staticmethod
+  def _key(key: Hashable) -> str:
+    return sha1(repr(key).encode()).hexdigest()
+
+  def get(self, key: Hashable) -> Optional[bytes]:
+    """Gets a stored response, or `None` if there is no live entry for the key"""
+    k = self._key(key)
+    now = time()
+    with self._lock:
+      row = self._db.execute(
+        "SELECT data FROM results WHERE key = ? AND expires > ?", (k, now)
+      ).fetchone()
+      if row is not None:
+        self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, k))
+        self._db.commit()
+
+    if row is None:
+      self.misses += 1
+      return None
+    self.hits += 1
+    return zlib.decompress(row[0])
+
+  def put(self, key: Hashable, data: bytes, ttl: float):
+    """Stores a response"""
+    blob = zlib.compress(data, self.compress_level)
+    now = time()
+    with self._lock:
+      self._db.execute(
+        "INSERT OR REPLACE INTO results (key, data, size, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+        (self._key(key), blob, len(blob), now + ttl, now)
+      )
+      self._db.commit()
+
+  def vacuum(self):
+    """Removes expired entries, then the least recently used ones until under `max_bytes`"""
+    with self._lock:
+      self._db.execute("DELETE FROM results WHERE expires <= ?", (time(),))
+      total = self._db.execute("SELECT TOTAL(size) FROM results").fetchone()[0]
+      if total > self.max_bytes:
+        excess = total - self.max_bytes
+        removed = 0
+        keys = []
+        for k, size in self._db.execute("SELECT key, size FROM results ORDER BY accessed"):
+          if removed >= excess:
+            break
+          keys.append((k,))
+          removed += size
+        self._db.executemany("DELETE FROM results WHERE key = ?", keys)
+      self._db.commit()
+      self._db.execute("VACUUM")
+      self._last_vacuum = monotonic()
+
+  def maybe_vacuum(self):
+    """Starts vacuuming on the cache's worker thread if `vacuum_interval` has passed since the last time"""
+    due = monotonic() - self._last_vacuum >= self.vacuum_interval
+    if due and (self._vacuuming is None or self._vacuuming.done()):
+      self._vacuuming = self._executor.submit(self.vacuum)
+      self._vacuuming.add_done_callback(self._vacuum_done)
+
+  async def aget(self, key: Hashable) -> Optional[bytes]:
+    """|coro|
+
+    Same as `get`, but runs on the cache's worker thread
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(self._executor, self.get, key)
+
+  async def aput(self, key: Hashable, data: bytes, ttl: float):
+    """|coro|
+
+    Same as `put`, but runs on the cache's worker thread.
+    Vacuuming is started in the background when it is due.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(self._executor, self.put, key, data, ttl)
+    self.maybe_vacuum()
+
+  async def astats(self) -> Dict[str, int]:
+    """|coro|
+
+    Same as `stats`, but runs on the cache's worker thread
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(self._executor, lambda: self.stats)
+
+  @staticmethod
+  def _vacuum_done(future: Future):
+    if not future.cancelled() and future.exception() is not None:
+      log.error("Failed to vacuum the disk cache", exc_info=future.exception())
+
+  def _close(self):
+    with self._lock:
+      self._db.close()
+
+  def close(self):
+    """Closes the database, waiting for pending operations to finish. Async callers should use `aclose`"""
+    self._executor.shutdown(wait=True)
+    self._close()
+
+  async def aclose(self):
+    """|coro|
+
+    Same as `close`, but the pending operations are waited for on the cache's worker thread
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(self._executor, self._close)
+    self._executor.shutdown(wait=False)
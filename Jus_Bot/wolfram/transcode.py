@@ -0,0 +1,193 @@
+"""
+Re-encoding of Simple API images before they are uploaded, off the event loop
+
+Pillow holds the GIL while it encodes, so conversions run in a process pool instead of a thread.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter, process_time
+from typing import Dict, NamedTuple, Optional
+
+from .models import SimpleImage
+
+try:
+  from PIL import Image
+except ImportError:
+  Image = None
+
+AVAILABLE = Image is not None
+if AVAILABLE:
+  # Moved to `Image.Resampling` in Pillow 9.1
+  LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+log = logging.getLogger(__name__)
+
+# Every encode of a size target lowers the quality by this much
+QUALITY_STEP = 10
+MIN_QUALITY = 30
+
+class TranscodeOptions(NamedTuple):
+  """How images are re-encoded
+
+  `format` is either `webp` or `png`. `quality` only applies to WebP, PNGs are optimized instead.
+  Images wider than `max_width` are downscaled, and `colors` quantizes them to a palette of that size.
+  If the result is larger than `target_bytes`, WebP images are encoded again at a lower quality
+  and PNGs are quantized, until it fits or cannot be made smaller.
+  """
+  format: str = "webp"
+  quality: int = 80
+  max_width: Optional[int] = None
+  colors: Optional[int] = None
+  target_bytes: Optional[int] = None
+
+class Conversion(NamedTuple):
+  """A re-encoded image along with the metrics of its conversion"""
+  data: bytes
+  format: str
+  original_bytes: int
+  bytes: int
+  width: int
+  height: int
+  quality: Optional[int]
+  cpu_time: float # Spent in the worker, in seconds
+  latency: float = 0.0 # Including the wait for a worker, in seconds
+
+  @property
+  def ratio(self) -> float:
+    """The size of the result relative to the original"""
+    return self.bytes / self.original_bytes if self.original_bytes else 1.0
+
+  @property
+  def filename(self) -> str:
+    return f"result.{self.format}"
+
+def _encode(img: Image.Image, options: TranscodeOptions, quality: int, colors: Optional[int]) -> bytes:
+  if colors is not None:
+    img = img.quantize(colors)
+  out = io.BytesIO()
+  if options.format == "webp":
+    img.save(out, "WEBP", quality=quality, method=4)
+  else:
+    img.save(out, "PNG", optimize=True)
+  return out.getvalue()
+
+def transcode(data: bytes, options: TranscodeOptions) -> Conversion:
+  """Re-encodes an image, this is what runs in the worker processes
+
+  The original is returned as is if re-encoding does not make it smaller.
+  """
+  start = process_time()
+  img = Image.open(io.BytesIO(data))
+  original_format = (img.format or "png").lower()
+  if img.mode not in ("RGB", "RGBA", "P", "L"):
+    img = img.convert("RGBA")
+  resized = options.max_width is not None and img.width > options.max_width
+  if resized:
+    height = round(img.height * options.max_width / img.width)
+    img = img.resize((options.max_width, height), LANCZOS)
+
+  quality, colors = options.quality, options.colors
+  out = _encode(img, options, quality, colors)
+  while options.target_bytes is not None and len(out) > options.target_bytes:
+    if options.format == "webp" and quality > MIN_QUALITY:
+      quality = max(quality - QUALITY_STEP, MIN_QUALITY)
+    elif options.format != "webp" and (colors is None or colors > 16):
+      colors = 256 if colors is None else colors // 2
+    else:
+      break
+    out = _encode(img, options, quality, colors)
+
+  if len(out) >= len(data) and not resized:
+    return Conversion(data, original_format, len(data), len(data), img.width, img.height, None, process_time() - start)
+  return Conversion(
+    out,
+    options.format,
+    len(data),
+    len(out),
+    img.width,
+    img.height,
+    quality if options.format == "webp" else None,
+    process_time() - start
+  )
+
+class Transcoder:
+  """
+  Re-encodes images in a process pool, so that Pillow never blocks the event loop
+
+  Parameters
+  ----------
+  options: :class:`TranscodeOptions`
+    The default options of every conversion.
+  max_workers: Optional[:class:`int`]
+    The number of worker processes, started on first use. Defaults to `1`
+  """
+
+  def __init__(self, options: TranscodeOptions = TranscodeOptions(), max_workers: Optional[int] = 1):
+    if not AVAILABLE:
+      raise RuntimeError("pillow must be installed to transcode images")
+    if options.format not in ("webp", "png"):
+      raise ValueError(f"Unknown format '{options.format}'.")
+    self.options = options
+    self.max_workers = max_workers
+    self._executor: Optional[ProcessPoolExecutor] = None
+
+    self.conversions = 0
+    self.failures = 0
+    self.original_bytes = 0
+    self.bytes = 0
+    self.cpu_time = 0.0
+    self.latency = 0.0
+
+  @property
+  def stats(self) -> Dict[str, float]:
+    """The conversion counters, times are in seconds"""
+    return {
+      "conversions": self.conversions,
+      "failures": self.failures,
+      "original_bytes": self.original_bytes,
+      "bytes": self.bytes,
+      "cpu_time": self.cpu_time,
+      "latency": self.latency
+    }
+
+  async def transcode(self, image: SimpleImage, **options) -> Conversion:
+    """|coro|
+
+    Re-encodes an image, `options` override the fields of the default :class:`TranscodeOptions`
+    """
+    if self._executor is None:
+      self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+    opts = self.options._replace(**options) if options else self.options
+    data = await image.aread()
+
+    start = perf_counter()
+    loop = asyncio.get_running_loop()
+    try:
+      conversion = await loop.run_in_executor(self._executor, transcode, data, opts)
+    except Exception:
+      self.failures += 1
+      raise
+    conversion = conversion._replace(latency=perf_counter() - start)
+
+    self.conversions += 1
+    self.original_bytes += conversion.original_bytes
+    self.bytes += conversion.bytes
+    self.cpu_time += conversion.cpu_time
+    self.latency += conversion.latency
+    log.debug(
+      "Transcoded %d bytes to %d bytes of %s in %.1fms (%.1fms in the worker)",
+      conversion.original_bytes, conversion.bytes, conversion.format,
+      conversion.latency * 1000, conversion.cpu_time * 1000
+    )
+    return conversion
+
+  def close(self):
+    """Shuts down the worker processes"""
+    if self._executor is not None:
+      self._executor.shutdown(wait=False)
+      self._executor = None
@@ -0,0 +1,227 @@
+"""
+Transports send the requests of the clients, one per HTTP library
+
+A transport only moves bytes. Clients build the url and go through the caches and rate limiter,
+then the response is checked by `api.check_status` and parsed by its API.
+"""
+from __future__ import annotations
+
+import asyncio
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .exceptions import RequestTimeout, TransportError
+from .spool import CHUNK_SIZE, SPOOL_SIZE, SpooledBuffer
+
+if TYPE_CHECKING:
+  from ..pool import HTTPPool
+
+import aiohttp
+import requests
+
+Body = Union[bytes, SpooledBuffer]
+
+class Timeout(NamedTuple):
+  """How long a request may take, in seconds. `None` waits forever"""
+  connect: Optional[float] = None
+  total: Optional[float] = None
+
+class Response(NamedTuple):
+  """A response as seen by the clients, independent of the HTTP library"""
+  url: str
+  status: int
+  body: Body # A finished `SpooledBuffer` if the body was streamed
+  elapsed: float # In seconds
+
+  @property
+  def size(self) -> int:
+    """The size of the body, in bytes"""
+    return self.body.size if isinstance(self.body, SpooledBuffer) else len(self.body)
+
+  @property
+  def host(self) -> str:
+    return urlsplit(self.url).netloc
+
+  @property
+  def text(self) -> str:
+    body = self.body.getvalue() if isinstance(self.body, SpooledBuffer) else self.body
+    return body.decode("utf-8", errors="replace")
+
+class Transport:
+  """
+  The base class of transports, which send GET requests for a client
+
+  Sync transports implement `get` and async transports implement `aget`.
+  If `stream` is `True`, the body is read in chunks into a :class:`~wolfram.spool.SpooledBuffer`
+  instead of being read whole.
+
+  Failures of the HTTP library are raised as :class:`~wolfram.exceptions.TransportError`,
+  and :class:`~wolfram.exceptions.RequestTimeout` once `timeout` is exceeded.
+  """
+
+  def get(self, url: str, *, stream: bool = False, timeout: Optional[Timeout] = None) -> Response:
+    raise NotImplementedError(f"{self.__class__.__name__} does not support sync requests")
+
+  async def aget(self, url: str, *, stream: bool = False, timeout: Optional[Timeout] = None) -> Response:
+    raise NotImplementedError(f"{self.__class__.__name__} does not support async requests")
+
+  def close(self):
+    """Closes the connections of the transport"""
+
+  async def aclose(self):
+    """|coro|
+
+    Same as `close`, for async transports
+    """
+    self.close()
+
+class RequestsTransport(Transport):
+  """
+  A sync transport backed by a `requests.Session`, so that connections are kept alive between queries
+
+  Parameters
+  ----------
+  session: Optional[`requests.Session`]
+    The session to send requests with, one is created on first use if not given.
+
+  requests has no total timeout, so `Timeout.total` bounds every read from the socket instead.
+  """
+
+  def __init__(self, session: Optional[requests.Session] = None):
+    self._session = session
+    self._owner = session is None
+
+  @property
+  def session(self) -> requests.Session:
+    if self._session is None:
+      self._session = requests.Session()
+    return self._session
+
+  def get(self, url: str, *, stream: bool = False, timeout: Optional[Timeout] = None) -> Response:
+    start = perf_counter()
+    try:
+      with self.session.get(url, stream=stream, timeout=tuple(timeout) if timeout is not None else None) as resp:
+        if stream and resp.ok:
+          body = SpooledBuffer(SPOOL_SIZE)
+          body.writelines(resp.iter_content(CHUNK_SIZE))
+          body = body.finish()
+        else:
+          body = resp.content
+        return Response(url, resp.status_code, body, perf_counter() - start)
+    except requests.Timeout as e:
+      raise RequestTimeout(f"request timed out after {perf_counter() - start:.1f}s") from e
+    except requests.RequestException as e:
+      raise TransportError(str(e)) from e
+
+  def close(self):
+    if self._session is not None and self._owner:
+      self._session.close()
+      self._session = None
+
+class AiohttpTransport(Transport):
+  """
+  An async transport backed by aiohttp
+
+  Parameters
+  ----------
+  pool: Optional[:class:`~Jus_Bot.pool.HTTPPool`]
+    The connection pool to draw the session from. If not given, the transport
+    opens its own session on first use.
+  name: `str`
+    The name of the session in the pool. Defaults to `wolfram`
+  """
+
+  def __init__(self, pool: Optional[HTTPPool] = None, name: str = "wolfram"):
+    self.pool = pool
+    self.name = name
+    self._session: Optional[aiohttp.ClientSession] = None
+
+  @property
+  def session(self) -> aiohttp.ClientSession:
+    if self.pool is not None:
+      return self.pool.session(self.name)
+    if self._session is None or self._session.closed:
+      self._session = aiohttp.ClientSession()
+    return self._session
+
+  async def aget(self, url: str, *, stream: bool = False, timeout: Optional[Timeout] = None) -> Response:
+    start = perf_counter()
+    client_timeout = aiohttp.ClientTimeout(total=timeout.total, connect=timeout.connect) if timeout is not None else None
+    try:
+      async with self.session.get(url, timeout=client_timeout) as resp:
+        if stream and resp.status == 200:
+          body = SpooledBuffer(SPOOL_SIZE)
+          async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            body.write(chunk)
+          body = body.finish()
+        else:
+          body = await resp.read()
+        return Response(url, resp.status, body, perf_counter() - start)
+    except asyncio.TimeoutError as e:
+      raise RequestTimeout(f"request timed out after {perf_counter() - start:.1f}s") from e
+    except aiohttp.ClientError as e:
+      raise TransportError(str(e)) from e
+
+  async def aclose(self):
+    # The pool, if any, is left to its owner
+    if self._session is not None:
+      await self._session.close()
+      self._session = None
+
+Handler = Callable[[str], Union[bytes, Tuple[int, bytes]]]
+
+class MemoryTransport(Transport):
+  """
+  An in-memory stand-in for the API, for tests and benchmarks. It works with both clients
+
+  Parameters
+  ----------
+  responses: Optional[Mapping[`str`, Union[`bytes`, Tuple[`int`, `bytes`]]]]
+    The bodies to respond with by url path, e.g. `/v2/query`, optionally with a status.
+  handler: Optional[Callable[[`str`], Union[`bytes`, Tuple[`int`, `bytes`]]]]
+    Called with the url of every request whose path is not in `responses`.
+    Paths that are not handled get a 404.
+  latency: Union[`float`, Callable[[`str`], `float`]]
+    How long every async request takes in seconds, or a function of the url that decides it.
+    Requests that would take longer than their total timeout time out. Defaults to `0`
+  """
+
+  def __init__(
+    self,
+    responses: Optional[Mapping[str, Union[bytes, Tuple[int, bytes]]]] = None,
+    handler: Optional[Handler] = None,
+    latency: Union[float, Callable[[str], float]] = 0.0
+  ):
+    self.responses: Dict[str, Union[bytes, Tuple[int, bytes]]] = dict(responses or {})
+    self.handler = handler
+    self.latency = latency
+    self.requests: List[str] = []
+
+  def _respond(self, url: str, stream: bool, elapsed: float) -> Response:
+    self.requests.append(url)
+    path = urlsplit(url).path
+    if path in self.responses:
+      reply = self.responses[path]
+    elif self.handler is not None:
+      reply = self.handler(url)
+    else:
+      reply = (404, b"Not Found")
+    status, body = reply if isinstance(reply, tuple) else (200, reply)
+    if stream and status == 200:
+      body = SpooledBuffer.from_bytes(body)
+    return Response(url, status, body, elapsed)
+
+  def get(self, url: str, *, stream: bool = False, timeout: Optional[Timeout] = None) -> Response:
+    return self._respond(url, stream, 0.0)
+
+  async def aget(self, url: str, *, stream: bool = False, timeout: Optional[Timeout] = None) -> Response:
+    latency = self.latency(url) if callable(self.latency) else self.latency
+    if timeout is not None and timeout.total is not None and latency > timeout.total:
+      await asyncio.sleep(timeout.total)
+      self.requests.append(url)
+      raise RequestTimeout(f"request timed out after {timeout.total:.1f}s")
+    if latency:
+      await asyncio.sleep(latency)
+    return self._respond(url, stream, latency)
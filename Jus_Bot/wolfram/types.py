@@ -18,7 +18,7 @@ class FullResultsDict(WolframDict):
   numpods: int
   timing: float
 
-  tips: TipsDict
+  tips: Union[List[TipsDict], TipsDict]
 
   recalculate: Union[str, Literal[""]]
 
@@ -27,13 +27,13 @@ class FullResultsDict(WolframDict):
 
   pods: List[PodDict]
 
-  assumptions: AssumptionsDict
+  assumptions: Union[List[AssumptionsDict], AssumptionsDict]
 
   warnings: Union[
     List[
-      Union[SpellCheckWarningDict, DelimiterWarningDict, TranslationWarningDict]
+      Union[SpellCheckWarningDict, DelimiterWarningDict, TranslationWarningDict, ReinterpretWarningDict]
     ],
-    SpellCheckWarningDict, DelimiterWarningDict, TranslationWarningDict
+    SpellCheckWarningDict, DelimiterWarningDict, TranslationWarningDict, ReinterpretWarningDict
   ]
 
   sources: Union[
@@ -64,7 +64,10 @@ class ConversationalResultsDict(WolframDict):
 
 
 
-class PodDict(WolframDict):
+# `async` is a keyword, so the url of deferred pods cannot be declared in a class body
+DeferredPodDict = TypedDict("DeferredPodDict", {"async": str})
+
+class PodDict(WolframDict, DeferredPodDict):
   title: str
   primary: Optional[Literal[True]]
   error: Union[ErrorDict, Literal[False]]
@@ -0,0 +1,177 @@
+"""
+A local aiohttp stand-in for every Wolfram|Alpha API the clients use, so they can be measured without spending quota
+
+Run with `python -m benchmarks.aio_standin [port]` from the repository root, or use `serve()`
+inside a running event loop. `query`, `simple`, `result`, `spoken` and `conversation.jsp`
+are served under any prefix, so both `url=` and follow-up hosts work.
+
+Responses are read from a directory of recordings if given, named after the endpoint:
+`query.json`, `simple.gif`, `result.txt`, `spoken.txt` and `conversation.json`.
+Endpoints without a recording get a synthetic response: `query` is shaped by its parameters
+like `benchmarks.standin` does, and `simple` is `image_size` bytes of filler behind a GIF header.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import sys
+
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+from aiohttp import web
+
+from .standin import respond
+
+RECORDINGS = {
+  "query": ("query.json", "application/json;charset=utf-8"),
+  "simple": ("simple.gif", "image/gif"),
+  "result": ("result.txt", "text/plain;charset=utf-8"),
+  "spoken": ("spoken.txt", "text/plain;charset=utf-8"),
+  "conversation.jsp": ("conversation.json", "application/json;charset=utf-8")
+}
+
+def synthetic_image(size: int) -> bytes:
+  header = b"GIF89a"
+  filler = bytes(range(256)) * (size // 256 + 1)
+  return header + filler[:max(0, size - len(header))]
+
+class AioStandIn:
+  """
+  A stand-in server for the Wolfram|Alpha APIs
+
+  Parameters
+  ----------
+  pods: :class:`int`
+    The number of pods of synthetic `query` responses. Defaults to `20`
+  image_size: :class:`int`
+    The size of synthetic `simple` responses, in bytes. Defaults to `64KB`
+  latency: :class:`float`
+    How long every response takes before it is sent, in seconds. Defaults to `0`
+  jitter: :class:`float`
+    The most that is added to `latency` at random, in seconds. Defaults to `0`
+  error_rate: :class:`float`
+    The share of requests that get a `503`, which the clients retry. Defaults to `0`
+  recordings: Optional[:class:`str`]
+    The directory to read recorded responses from.
+  seed: :class:`int`
+    The seed of the latencies and errors, so runs can be compared. Defaults to `0`
+  """
+
+  def __init__(
+    self,
+    pods: int = 20,
+    image_size: int = 64 * 1024,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    recordings: Optional[str] = None,
+    seed: int = 0
+  ):
+    self.pods = pods
+    self.image_size = image_size
+    self.latency = latency
+    self.jitter = jitter
+    self.error_rate = error_rate
+    self._random = random.Random(seed)
+    self._recorded: Dict[str, Tuple[bytes, str]] = {}
+    if recordings is not None:
+      for endpoint, (name, content_type) in RECORDINGS.items():
+        path = os.path.join(recordings, name)
+        if os.path.exists(path):
+          with open(path, "rb") as f:
+            self._recorded[endpoint] = (f.read(), content_type)
+
+    self._image = synthetic_image(image_size)
+    self._runner: Optional[web.AppRunner] = None
+    self.host = "127.0.0.1"
+    self.port = 0
+
+    self.requests: Counter = Counter()
+    self.errors = 0
+    self.bytes_sent = 0
+
+  @property
+  def url(self) -> str:
+    return f"http://{self.host}:{self.port}/"
+
+  def _synthetic(self, endpoint: str, request: web.Request) -> Tuple[bytes, str]:
+    content_type = RECORDINGS[endpoint][1]
+    params = request.query
+    if endpoint == "query":
+      body = {"queryresult": respond({k: params.getall(k) for k in params.keys()}, self.pods)}
+      return json.dumps(body).encode(), content_type
+    if endpoint == "simple":
+      return self._image, content_type
+    if endpoint == "result":
+      return b"3.1415926535897932384626433832795028841971693993751", content_type
+    if endpoint == "spoken":
+      return b"The answer is about 3.1415926535897932384626433832795028841971693993751", content_type
+    body = {
+      "result": "The answer is about 3.1415926535897932384626433832795028841971693993751",
+      "conversationID": "MSP" + "0123456789abcdef" * 2,
+      "host": f"{self.host}:{self.port}",
+      "s": 3
+    }
+    return json.dumps(body).encode(), content_type
+
+  async def handle(self, request: web.Request) -> web.Response:
+    endpoint = request.path.rstrip("/").rsplit("/", 1)[-1]
+    if endpoint not in RECORDINGS:
+      return web.Response(status=404, text="Not Found")
+    self.requests[endpoint] += 1
+
+    delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+    failed = self.error_rate and self._random.random() < self.error_rate
+    if delay:
+      await asyncio.sleep(delay)
+    if failed:
+      self.errors += 1
+      return web.Response(status=503, text="Service Unavailable")
+
+    body, content_type = self._recorded.get(endpoint) or self._synthetic(endpoint, request)
+    self.bytes_sent += len(body)
+    return web.Response(body=body, headers={"Content-Type": content_type})
+
+  async def start(self, host: str = "127.0.0.1", port: int = 0):
+    """|coro|
+
+    Starts serving in the running event loop, on a free port by default
+    """
+    app = web.Application()
+    app.router.add_get("/{path:.*}", self.handle)
+    self._runner = web.AppRunner(app, access_log=None)
+    await self._runner.setup()
+    site = web.TCPSite(self._runner, host, port)
+    await site.start()
+    self.host, self.port = site._server.sockets[0].getsockname()[:2]
+
+  async def close(self):
+    """|coro|
+
+    Stops the server
+    """
+    if self._runner is not None:
+      await self._runner.cleanup()
+      self._runner = None
+
+@asynccontextmanager
+async def serve(port: int = 0, **options) -> AsyncIterator[AioStandIn]:
+  """Runs a stand-in server for the duration of the block, with the options of :class:`AioStandIn`"""
+  server = AioStandIn(**options)
+  await server.start(port=port)
+  try:
+    yield server
+  finally:
+    await server.close()
+
+async def main(port: int = 8766):
+  async with serve(port) as server:
+    print(f"Serving Wolfram|Alpha stand-in on {server.url}")
+    await asyncio.Event().wait()
+
+if __name__ == "__main__":
+  asyncio.run(main(*map(int, sys.argv[1:])))
@@ -0,0 +1,52 @@
+"""
+Compares the JSON decoders on `queryresult` response bodies
+
+Run with `python -m benchmarks.json_decode [response.json ...]` from the repository root.
+Recorded responses are read from the given files, synthetic ones are used otherwise.
+`text` is what `ClientResponse.json()` does: decode the body to a string, then `json.loads` it.
+Only decoding is timed, constructing the models costs the same with every decoder.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+
+from .payloads import full_results
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+DECODERS = {
+  "text": lambda body: json.loads(body.decode("utf-8")),
+  "json": json.loads
+}
+if orjson is not None:
+  DECODERS["orjson"] = orjson.loads
+
+def bodies(paths):
+  if paths:
+    for path in paths:
+      with open(path, "rb") as f:
+        yield path, f.read()
+  else:
+    for pods in (10, 50, 100):
+      yield f"{pods} pods", json.dumps({"queryresult": full_results(pods)}).encode()
+
+def measure(body: bytes, number: int = 200):
+  times = {}
+  for name, loads in DECODERS.items():
+    times[name] = min(timeit.repeat(lambda: loads(body), number=number, repeat=5)) / number
+  return times
+
+def main(paths=()):
+  names = " ".join(f"{name:>10}" for name in DECODERS)
+  print(f"{'body':>20} {'bytes':>8} {names}")
+  for label, body in bodies(paths):
+    times = measure(body)
+    print(f"{label:>20} {len(body):>8} " + " ".join(f"{t * 1e6:>8.1f}us" for t in times.values()))
+
+if __name__ == "__main__":
+  main(sys.argv[1:])
@@ -0,0 +1,50 @@
+"""
+Compares eager and lazy construction of `FullResults` on large responses
+
+Run with `python -m benchmarks.lazy_models [pods ...]` from the repository root.
+Each case decodes the payload, then reads `pods[*].text` like the wolfram cog does.
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+
+from Jus_Bot.wolfram.models import FullResults
+
+from .payloads import full_results
+
+def cog_access(res: FullResults):
+  return [pod.text for pod in res.pods]
+
+def measure(raw: dict, lazy: bool, number: int = 200):
+  decode = lambda: FullResults.from_dict(raw, lazy=lazy)
+  decode_and_read = lambda: cog_access(decode())
+
+  decode_time = min(timeit.repeat(decode, number=number, repeat=5)) / number
+  read_time = min(timeit.repeat(decode_and_read, number=number, repeat=5)) / number
+
+  tracemalloc.start()
+  snapshot = tracemalloc.take_snapshot()
+  res = decode()
+  cog_access(res)
+  stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+  tracemalloc.stop()
+  blocks = sum(stat.count_diff for stat in stats)
+  size = sum(stat.size_diff for stat in stats)
+  return decode_time, read_time, blocks, size
+
+def main(pod_counts=(10, 50, 100)):
+  print(f"{'pods':>5} {'mode':>6} {'decode':>10} {'decode+read':>12} {'allocs':>8} {'bytes':>9}")
+  for pods in pod_counts:
+    raw = full_results(pods)
+    for lazy in (False, True):
+      decode_time, read_time, blocks, size = measure(raw, lazy)
+      mode = "lazy" if lazy else "eager"
+      print(
+        f"{pods:>5} {mode:>6} {decode_time * 1e6:>8.1f}us {read_time * 1e6:>10.1f}us"
+        f" {blocks:>8} {size:>9}"
+      )
+
+if __name__ == "__main__":
+  main(tuple(int(arg) for arg in sys.argv[1:]) or (10, 50, 100))
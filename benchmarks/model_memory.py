@@ -0,0 +1,96 @@
+"""
+Reports how much memory a cached `FullResults` holds on to, with and without slotted models
+
+Run with `python -m benchmarks.model_memory [pods ...]` from the repository root.
+`payload` is the decoded JSON, `models` is everything constructed by `FullResults.from_dict`
+on top of it, both compared to the size of the response body. `kept` is what is left once
+the response itself is let go, as in a cache, for each raw retention policy.
+
+Every row is measured for both model layouts: `slots`, and `dict` as on Python versions
+without slotted dataclasses. The `dict` rows are measured in a child process started with
+`JUS_DICT_MODELS` set, as the layout is chosen when the models are imported.
+"""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+from typing import Dict, List
+
+from Jus_Bot.wolfram.models import SLOTS, FullResults, Retention
+
+from .payloads import full_results
+
+def retained(func):
+  """Returns the result of `func` along with the bytes it allocated and kept alive"""
+  gc.collect()
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  result = func()
+  gc.collect()
+  after = tracemalloc.get_traced_memory()[0]
+  tracemalloc.stop()
+  return result, after - before
+
+def touch(res: FullResults):
+  # Everything is read so that lazy fields are accounted for as well
+  return [(p.subpods, p.error) for p in res.pods] and res.assumptions
+
+def measure(pods: int) -> Dict[str, int]:
+  body = json.dumps({"queryresult": full_results(pods)}).encode()
+  raw, payload = retained(lambda: json.loads(body)["queryresult"])
+  res, models = retained(lambda: FullResults.from_dict(raw))
+  _, touched = retained(lambda: touch(res))
+
+  row = {"pods": pods, "body": len(body), "payload": payload, "models": models + touched}
+  for policy in Retention:
+    def decode():
+      res = FullResults.from_dict(json.loads(body)["queryresult"], retention=policy)
+      touch(res)
+      return res
+    _, row[f"kept/{policy.value}"] = retained(decode)
+  return row
+
+def measure_dict_layout(pod_counts) -> List[Dict[str, int]]:
+  """Measures the rows in a child process whose models have a `__dict__`"""
+  env = dict(os.environ, JUS_DICT_MODELS="1")
+  out = subprocess.run(
+    [sys.executable, "-m", "benchmarks.model_memory", "--json", *map(str, pod_counts)],
+    env=env, capture_output=True, text=True, check=True
+  ).stdout
+  return json.loads(out)
+
+def main(pod_counts=(10, 50, 100)):
+  layouts = {"slots" if SLOTS else "dict": [measure(pods) for pods in pod_counts]}
+  if SLOTS:
+    layouts["dict"] = measure_dict_layout(pod_counts)
+
+  policies = " ".join(f"{'kept/' + policy.value:>13}" for policy in Retention)
+  print(f"{'layout':>6} {'pods':>5} {'body':>9} {'payload':>9} {'models':>9} {'total/body':>11} {policies}")
+  for name, rows in layouts.items():
+    for row in rows:
+      print(
+        f"{name:>6} {row['pods']:>5} {row['body']:>9} {row['payload']:>9} {row['models']:>9} "
+        f"{(row['payload'] + row['models']) / row['body']:>10.2f}x "
+        + " ".join(f"{row['kept/' + policy.value]:>13}" for policy in Retention)
+      )
+
+  if len(layouts) == 2:
+    print()
+    for slotted, plain in zip(layouts["slots"], layouts["dict"]):
+      print(
+        f"{slotted['pods']:>5} pods: models {plain['models']} -> {slotted['models']} bytes "
+        f"({1 - slotted['models'] / plain['models']:.0%} less) with slots"
+      )
+
+if __name__ == "__main__":
+  args = sys.argv[1:]
+  if args[:1] == ["--json"]:
+    # The rows of the layout of this process, for `measure_dict_layout`
+    print(json.dumps([measure(int(arg)) for arg in args[1:]]))
+  else:
+    main(tuple(int(arg) for arg in args) or (10, 50, 100))
@@ -0,0 +1,124 @@
+"""
+Checks and times the model layer on the recorded `queryresult` corpus
+
+Run with `python -m benchmarks.parse_corpus [version] [payload ...]` from the repository root,
+the latest corpus version is used by default. Payloads are listed in `corpus/<version>/index.json`
+along with a summary of what the models should read from them: the pod texts, assumption texts,
+warning kinds, url parameters and so on. Every payload is checked against its summary in every
+decoding mode before it is timed, the exit status is non-zero if any differ.
+
+`decode` is `FullResultsAPI.parse` on the body, `read` also builds the summary, which is what
+lazy decoding defers. `peak` is the traced memory while decoding and reading, and `objects`
+is the number of objects the result keeps alive.
+
+The corpus is versioned: payloads are never changed in place, a new version is added instead
+so that timings stay comparable with earlier runs.
+"""
+from __future__ import annotations
+
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+from Jus_Bot.wolfram.api import FullResultsAPI
+from Jus_Bot.wolfram.models import FullResults, lazy_models
+from Jus_Bot.wolfram.schema import AVAILABLE as TYPED_AVAILABLE, typed_decoding
+
+CORPUS = Path(__file__).parent / "corpus"
+
+MODES = ("eager", "lazy", "typed") if TYPED_AVAILABLE else ("eager", "lazy")
+
+def latest() -> str:
+  return max((p.name for p in CORPUS.iterdir() if p.is_dir()), key=lambda v: int(v.lstrip("v")))
+
+def load(version: str) -> Iterator[Tuple[str, bytes, Dict[str, Any]]]:
+  """The name, body and expected summary of every payload of a corpus version, in index order"""
+  path = CORPUS / version
+  with open(path / "index.json", encoding="utf-8") as f:
+    index = json.load(f)
+  for name, entry in index.items():
+    yield name, (path / f"{name}.json").read_bytes(), entry["expected"]
+
+def summary(res: FullResults) -> Dict[str, Any]:
+  """What the bot and the clients read from a result, in plain values"""
+  pods = res.pods or ()
+  return {
+    "success": res.success,
+    "error": res.error.code if res.is_error else None,
+    "fallthrough": res.is_fallthrough,
+    "numpods": res.numpods,
+    "texts": [pod.text for pod in pods],
+    "primary": [pod.id for pod in pods if pod.primary],
+    "deferred": [pod.async_url.params["id"] for pod in res.deferred],
+    "pod_errors": [pod.error.msg for pod in pods if pod.error],
+    "images": sum(len(subpod.img.themes) for pod in pods for subpod in pod.subpods if subpod.img is not None),
+    "recalculate": res.recalculate.params if res.recalculate else None,
+    "assumptions": [a.text for a in res.assumptions or ()],
+    "warnings": [[type(w).__name__, w.msg] for w in res.warnings or ()],
+    "sources": [source.url.path for source in res.sources or ()],
+    "didyoumeans": [[d.val, d.score] for d in res.didyoumeans or ()],
+    "tips": [tip.text for tip in res.tips or ()],
+    "generalization": res.generalization.url.params if res.generalization is not None else None,
+    "languagemsg": res.languagemsg.msg if res.languagemsg is not None else None,
+    "futuretopic": res.futuretopic.topic if res.futuretopic is not None else None,
+    "examplepage": res.examplepage.url.url if res.examplepage is not None else None
+  }
+
+def decoder(mode: str):
+  def decode(body: bytes) -> FullResults:
+    with ExitStack() as stack:
+      stack.enter_context(lazy_models(mode == "lazy"))
+      stack.enter_context(typed_decoding(mode == "typed"))
+      return FullResultsAPI.parse(body)
+  return decode
+
+def memory(decode, body: bytes) -> Tuple[int, int]:
+  """The peak traced memory of decoding and reading a body, and the number of objects the result keeps"""
+  gc.collect()
+  objects = len(gc.get_objects())
+  tracemalloc.start()
+  res = decode(body)
+  summary(res)
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+  gc.collect()
+  return peak, len(gc.get_objects()) - objects
+
+def check(name: str, body: bytes, expected: Dict[str, Any]) -> List[str]:
+  """The modes whose summary of a payload differs from the expected one"""
+  # Round-tripped through JSON, like the expected summary was
+  return [mode for mode in MODES if json.loads(json.dumps(summary(decoder(mode)(body)))) != expected]
+
+def main(version: str = None, *names: str, number: int = 50) -> bool:
+  version = version or latest()
+  ok = True
+  print(f"corpus {version}")
+  print(f"{'payload':>30} {'KB':>6} {'pods':>5} {'mode':>6} {'decode':>10} {'read':>10} {'peak':>8} {'objects':>8}")
+  for name, body, expected in load(version):
+    if names and name not in names:
+      continue
+    failed = check(name, body, expected)
+    if failed:
+      ok = False
+      print(f"{name:>30} FAILED in {', '.join(failed)}")
+      continue
+
+    for mode in MODES:
+      decode = decoder(mode)
+      decode_time = min(timeit.repeat(lambda: decode(body), number=number, repeat=5)) / number
+      read_time = min(timeit.repeat(lambda: summary(decode(body)), number=number, repeat=5)) / number
+      peak, objects = memory(decode, body)
+      print(
+        f"{name:>30} {len(body) / 1024:>6.1f} {len(expected['texts']):>5} {mode:>6} "
+        f"{decode_time * 1e6:>8.1f}us {read_time * 1e6:>8.1f}us {peak / 1024:>6.0f}KB {objects:>8}"
+      )
+  return ok
+
+if __name__ == "__main__":
+  sys.exit(0 if main(*sys.argv[1:]) else 1)
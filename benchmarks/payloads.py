@@ -0,0 +1,79 @@
+"""
+Synthetic `queryresult` payloads shaped like real FullResults API responses
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+IMG = "https:\/\/www6b3.wolframalpha.com\/Calculate\/MSP\/MSP{n}?MSPStoreType=image\/gif&s={n}"
+
+def subpod(n: int, text: str) -> Dict[str, Any]:
+  return {
+    "title": "",
+    "img": {
+      "src": IMG.format(n=n),
+      "alt": text,
+      "title": text,
+      "width": 312,
+      "height": 36,
+      "type": "Default",
+      "themes": "1,2,3,4,5,6,7,8,9,10,11,12",
+      "colorinvertable": True,
+      "contenttype": "image/gif"
+    },
+    "plaintext": text
+  }
+
+def pod(n: int, subpods: int = 2) -> Dict[str, Any]:
+  return {
+    "title": f"Pod number {n}",
+    "scanner": "Data",
+    "id": f"Pod{n}",
+    "position": 100 * (n + 1),
+    "error": False,
+    "numsubpods": subpods,
+    "primary": n == 1,
+    "subpods": [subpod(n * 10 + i, f"result {n}.{i} = {n * 3.14159:.5f}") for i in range(subpods)],
+    "expressiontypes": [{"name": "Default"}] * subpods,
+    "states": [{"name": "More digits", "input": f"Pod{n}__More digits"}]
+  }
+
+def full_results(pods: int = 50, subpods: int = 2) -> Dict[str, Any]:
+  """A successful `queryresult` with `pods` pods, assumptions, warnings and sources"""
+  pod_list: List[Dict[str, Any]] = [pod(n, subpods) for n in range(pods)]
+  return {
+    "success": True,
+    "error": False,
+    "numpods": pods,
+    "datatypes": "Math",
+    "timedout": "",
+    "timedoutpods": "",
+    "timing": 1.234,
+    "parsetiming": 0.321,
+    "parsetimedout": False,
+    "recalculate": "",
+    "id": "MSP1234567890",
+    "host": "https:\/\/www6b3.wolframalpha.com",
+    "server": "12",
+    "related": "",
+    "version": "2.6",
+    "inputstring": "pi",
+    "pods": pod_list,
+    "assumptions": {
+      "type": "Clash",
+      "word": "pi",
+      "template": "Assuming \"${word}\" is ${desc1}. Use as ${desc2} instead",
+      "count": 2,
+      "values": [
+        {"name": "NamedConstant", "desc": "a mathematical constant", "input": "*C.pi-_*NamedConstant-"},
+        {"name": "Character", "desc": "a character", "input": "*C.pi-_*Character-"}
+      ]
+    },
+    "warnings": [
+      {"text": "Interpreting \"pie\" as \"pi\"", "word": "pie", "suggestion": "pi"},
+      {"text": "Translating from German to \"pi\"", "phrase": "pi", "trans": "pi", "lang": "German"}
+    ],
+    "sources": [
+      {"url": "https:\/\/www6b3.wolframalpha.com\/sources\/MathConstantData.html", "text": "Mathematical constant data"}
+    ]
+  }
@@ -0,0 +1,49 @@
+"""
+Compares the request profiles of the FullResults API by bytes on the wire and parse time
+
+Run with `python -m benchmarks.request_profiles [pods]` from the repository root.
+Each profile queries a local stand-in server (`benchmarks.standin`) through `AsyncClient`,
+then the response it got is parsed again and read like the wolfram cog does.
+`default` sends no profile, which is what the client did before profiles.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import timeit
+
+from urllib.request import urlopen
+
+from Jus_Bot.wolfram import AsyncClient, Profile
+from Jus_Bot.wolfram.api import FullResultsAPI
+
+from .standin import serve
+
+PROFILES = (None, *Profile)
+
+def cog_access(body: bytes):
+  return [pod.text for pod in FullResultsAPI.parse(body).pods]
+
+async def fetch(server, profile) -> bytes:
+  """Queries the stand-in with a profile, and gets the body of the response it sent"""
+  client = AsyncClient("BENCHMARK", profile=profile)
+  before = server.bytes_sent
+  try:
+    res = await client.full_results_query("pi", url=server.url)
+  finally:
+    await client.close()
+  assert server.bytes_sent > before and res.success
+  with urlopen(server.url.rstrip("/") + server.last_path) as resp:
+    return resp.read()
+
+def main(pods: int = 20, number: int = 200):
+  print(f"{'profile':>10} {'pods':>5} {'bytes':>8} {'parse':>10}")
+  with serve(pods=pods) as server:
+    for profile in PROFILES:
+      body = asyncio.run(fetch(server, profile))
+      parse = min(timeit.repeat(lambda: cog_access(body), number=number, repeat=5)) / number
+      name = str(profile) if profile is not None else "default"
+      print(f"{name:>10} {len(FullResultsAPI.parse(body).pods):>5} {len(body):>8} {parse * 1e6:>8.1f}us")
+
+if __name__ == "__main__":
+  main(*map(int, sys.argv[1:]))
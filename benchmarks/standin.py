@@ -0,0 +1,120 @@
+"""
+A local stand-in for the FullResults API, serving synthetic responses shaped by the request
+
+Run with `python -m benchmarks.standin [port]` from the repository root, then point a client
+at it with `full_results_query(..., url="http://127.0.0.1:<port>/")`.
+`format`, `excludepodid`, `includepodid` and `podindex` are honoured like the API does,
+every other parameter is ignored.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import threading
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+from urllib.parse import parse_qs, urlsplit
+
+from .payloads import IMG, full_results
+
+# The API's formats when `format` is not given
+DEFAULT_FORMATS = ("plaintext", "image")
+
+# Pods that are only a picture, like the plots of real responses
+IMAGE_PODS = {3: "Plot", 7: "NumberLine"}
+
+def subpod_formats(subpod: Dict[str, Any], n: int, formats) -> Dict[str, Any]:
+  """Keeps or adds the sections of a synthetic subpod for the requested formats"""
+  text = subpod["plaintext"]
+  out = {"title": subpod["title"]}
+  if "plaintext" in formats:
+    out["plaintext"] = text
+  if "image" in formats:
+    out["img"] = subpod["img"]
+  if "imagemap" in formats:
+    out["imagemap"] = {"rect": [{"left": 0, "top": 0, "right": 312, "bottom": 36, "query": text, "assumptions": "", "title": text}]}
+  if "minput" in formats:
+    out["minput"] = f"N[{text}, 50]"
+  if "moutput" in formats:
+    out["moutput"] = text
+  if "sound" in formats:
+    out["sound"] = {"url": IMG.format(n=n).replace("image\\/gif", "audio\\/wav"), "type": "audio/x-wav"}
+  return out
+
+def respond(params: Dict[str, List[str]], pods: int = 20) -> Dict[str, Any]:
+  """Builds the `queryresult` the API would send for a request's parameters"""
+  formats = params["format"][0].split(",") if "format" in params else DEFAULT_FORMATS
+  include = set(params.get("includepodid", ()))
+  exclude = set(params.get("excludepodid", ()))
+  indexes = {int(i) for i in params["podindex"][0].split(",")} if "podindex" in params else None
+
+  raw = full_results(pods)
+  shaped = []
+  for index, pod in enumerate(raw["pods"], start=1):
+    if index - 1 in IMAGE_PODS:
+      pod["id"] = IMAGE_PODS[index - 1]
+      for subpod in pod["subpods"]:
+        subpod["plaintext"] = ""
+    if indexes is not None and index not in indexes:
+      continue
+    if (include and pod["id"] not in include) or pod["id"] in exclude:
+      continue
+    pod["subpods"] = [subpod_formats(subpod, index * 10 + i, formats) for i, subpod in enumerate(pod["subpods"])]
+    shaped.append(pod)
+  raw["pods"] = shaped
+  raw["numpods"] = len(shaped)
+  return raw
+
+class StandInServer(ThreadingHTTPServer):
+  daemon_threads = True
+
+  def __init__(self, address, pods: int = 20):
+    super().__init__(address, StandInHandler)
+    self.pods = pods
+    self.bytes_sent = 0
+    self.requests = 0
+    self.last_path = None
+
+  @property
+  def url(self) -> str:
+    host, port = self.server_address[:2]
+    return f"http://{host}:{port}/"
+
+class StandInHandler(BaseHTTPRequestHandler):
+  server: StandInServer
+
+  def do_GET(self):
+    params = parse_qs(urlsplit(self.path).query)
+    body = json.dumps({"queryresult": respond(params, self.server.pods)}).encode()
+    self.server.bytes_sent += len(body)
+    self.server.requests += 1
+    self.server.last_path = self.path
+
+    self.send_response(200)
+    self.send_header("Content-Type", "application/json;charset=utf-8")
+    self.send_header("Content-Length", str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, format, *args):
+    pass
+
+@contextmanager
+def serve(port: int = 0, pods: int = 20) -> Iterator[StandInServer]:
+  """Runs a stand-in server in a thread for the duration of the block, on a free port by default"""
+  server = StandInServer(("127.0.0.1", port), pods=pods)
+  thread = threading.Thread(target=server.serve_forever, daemon=True)
+  thread.start()
+  try:
+    yield server
+  finally:
+    server.shutdown()
+    server.server_close()
+
+if __name__ == "__main__":
+  port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+  server = StandInServer(("127.0.0.1", port))
+  print(f"Serving FullResults stand-in on {server.url}")
+  server.serve_forever()
@@ -0,0 +1,173 @@
+"""
+Measures the throughput of `AsyncClient` in different modes against a local stand-in
+
+Run with `python -m benchmarks.throughput [--requests N] [--concurrency C] ...` from the repository root,
+`--help` lists every option. Each mode sends the same mix of queries over every API
+(`benchmarks.aio_standin`), reading the results like the wolfram cog does, and reports
+requests per second, p50/p99 latency, and the peak and kept memory of a second run under tracemalloc.
+
+The stand-in runs in the same event loop by default, so it takes its share of the CPU.
+Start it with `python -m benchmarks.aio_standin` and pass `--url` to keep it out of the way.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import random
+import tracemalloc
+
+from time import perf_counter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from Jus_Bot.pool import HTTPPool
+from Jus_Bot.wolfram import AsyncClient, RequestPolicy, ResultCache
+from Jus_Bot.wolfram.api import ConversationalAPI, FullResultsAPI, ShortAPI, SimpleAPI, SpokenAPI
+from Jus_Bot.wolfram.schema import AVAILABLE as TYPED_AVAILABLE
+
+from .aio_standin import serve
+
+# The share of each API in the queries, roughly what the cogs send
+MIX = {
+  FullResultsAPI: 0.5,
+  ShortAPI: 0.15,
+  SpokenAPI: 0.1,
+  SimpleAPI: 0.1,
+  ConversationalAPI: 0.15
+}
+
+def modes() -> Dict[str, Callable[[HTTPPool], Dict[str, Any]]]:
+  """The options of the client in each mode, given a fresh pool"""
+  table = {
+    "session": lambda pool: {},
+    "pooled": lambda pool: {"pool": pool},
+    "lazy": lambda pool: {"pool": pool, "lazy": True},
+    "compact": lambda pool: {"pool": pool, "lazy": True, "retention": "compact"},
+    "cached": lambda pool: {"pool": pool, "lazy": True, "cache": ResultCache()}
+  }
+  if TYPED_AVAILABLE:
+    table["typed"] = lambda pool: {"pool": pool, "typed": True}
+  return table
+
+class Run(NamedTuple):
+  wall: float
+  latencies: List[float]
+  failures: int
+
+  @property
+  def rps(self) -> float:
+    return len(self.latencies) / self.wall
+
+  def quantile(self, q: float) -> float:
+    latencies = sorted(self.latencies)
+    return latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+def workload(requests: int, distinct: int, seed: int = 0):
+  """The queries of a run, repeated inputs are what the cache can save"""
+  rng = random.Random(seed)
+  apis = rng.choices(list(MIX), weights=list(MIX.values()), k=requests)
+  return [(api, f"input {rng.randrange(distinct)}") for api in apis]
+
+async def send(client: AsyncClient, url: str, api, text: str):
+  if api is FullResultsAPI:
+    res = await client.query(api, url, input=text)
+    return [pod.text for pod in res.pods]
+  res = await client.query(api, url, i=text)
+  if api is SimpleAPI:
+    return res.size
+  if api is ConversationalAPI:
+    return res.result
+  return res
+
+async def run(url: str, options: Callable[[HTTPPool], Dict[str, Any]], queries, concurrency: int) -> Run:
+  pool = HTTPPool()
+  # Retries of injected errors should not be dominated by the backoff
+  client = AsyncClient("BENCHMARK", policy=RequestPolicy(backoff=0.01), **options(pool))
+  latencies: List[float] = []
+  failures = 0
+  queue = iter(queries)
+
+  async def worker():
+    nonlocal failures
+    for api, text in queue:
+      start = perf_counter()
+      try:
+        await send(client, url, api, text)
+      except Exception:
+        failures += 1
+      else:
+        latencies.append(perf_counter() - start)
+
+  start = perf_counter()
+  try:
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+  finally:
+    wall = perf_counter() - start
+    await client.close()
+    await pool.close()
+  return Run(wall, latencies, failures)
+
+async def measure_memory(url: str, options, queries, concurrency: int):
+  """The peak and kept traced memory of a run, in bytes"""
+  gc.collect()
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  await run(url, options, queries, concurrency)
+  gc.collect()
+  current, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return peak - before, current - before
+
+async def bench(args, url: str, server=None):
+  queries = workload(args.requests, args.distinct, args.seed)
+  print(
+    f"{'mode':>8} {'req/s':>8} {'p50':>9} {'p99':>9} {'failed':>6} "
+    f"{'sent':>9} {'peak':>9} {'kept':>9}"
+  )
+  for name, options in modes().items():
+    if args.modes and name not in args.modes:
+      continue
+    # Warms up the imports and the stand-in
+    await run(url, options, queries[:args.concurrency], args.concurrency)
+    sent = server.bytes_sent if server is not None else 0
+    result = await run(url, options, queries, args.concurrency)
+    sent = server.bytes_sent - sent if server is not None else 0
+    peak, kept = await measure_memory(url, options, queries, args.concurrency)
+    print(
+      f"{name:>8} {result.rps:>8.0f} {result.quantile(0.5) * 1000:>7.2f}ms {result.quantile(0.99) * 1000:>7.2f}ms "
+      f"{result.failures:>6} {sent / 1024:>7.0f}KB {peak / 1024:>7.0f}KB {kept / 1024:>7.0f}KB"
+    )
+
+async def main(args):
+  if args.url is not None:
+    await bench(args, args.url)
+    return
+  async with serve(
+    pods=args.pods,
+    image_size=args.image_size,
+    latency=args.latency,
+    jitter=args.jitter,
+    error_rate=args.error_rate,
+    recordings=args.recordings,
+    seed=args.seed
+  ) as server:
+    await bench(args, server.url, server)
+
+def parse_args(argv: Optional[List[str]] = None):
+  parser = argparse.ArgumentParser(prog="python -m benchmarks.throughput", description=__doc__.strip().splitlines()[0])
+  parser.add_argument("--requests", type=int, default=2000, help="queries per run")
+  parser.add_argument("--concurrency", type=int, default=16, help="queries in flight at once")
+  parser.add_argument("--distinct", type=int, default=200, help="distinct inputs the queries are drawn from")
+  parser.add_argument("--modes", nargs="*", help="only run these modes")
+  parser.add_argument("--url", help="an already running stand-in, the options below are ignored")
+  parser.add_argument("--pods", type=int, default=20, help="pods of synthetic FullResults responses")
+  parser.add_argument("--image-size", type=int, default=64 * 1024, help="bytes of synthetic Simple API responses")
+  parser.add_argument("--latency", type=float, default=0.0, help="latency of the stand-in, in seconds")
+  parser.add_argument("--jitter", type=float, default=0.0, help="random latency added on top, in seconds")
+  parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests that get a 503")
+  parser.add_argument("--recordings", help="directory of recorded responses")
+  parser.add_argument("--seed", type=int, default=0)
+  return parser.parse_args(argv)
+
+if __name__ == "__main__":
+  asyncio.run(main(parse_args()))
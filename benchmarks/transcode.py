@@ -0,0 +1,66 @@
+"""
+Measures the size and latency of re-encoding Simple API images with different options
+
+Run with `python -m benchmarks.transcode [image ...]` from the repository root, nothing is measured without pillow.
+Recorded images are read from the given files, a synthetic one is drawn otherwise.
+Latency includes handing the image to the worker process and back.
+"""
+from __future__ import annotations
+
+import asyncio
+import io
+import sys
+
+from Jus_Bot.wolfram.models import SimpleImage
+from Jus_Bot.wolfram.transcode import AVAILABLE, TranscodeOptions, Transcoder
+
+if AVAILABLE:
+  from PIL import Image, ImageDraw
+
+OPTIONS = {
+  "webp q80": TranscodeOptions(format="webp", quality=80),
+  "webp q50": TranscodeOptions(format="webp", quality=50),
+  "webp 400w": TranscodeOptions(format="webp", max_width=400),
+  "png": TranscodeOptions(format="png"),
+  "png 64c": TranscodeOptions(format="png", colors=64)
+}
+
+def synthetic() -> bytes:
+  """A white image with rows of text, like the output of the Simple API"""
+  img = Image.new("RGB", (500, 1200), "white")
+  draw = ImageDraw.Draw(img)
+  for y in range(10, 1200, 18):
+    draw.text((10, y), f"{y / 7:.10f} = decimal approximation of {y}/7", fill=(40, 40, 40))
+  out = io.BytesIO()
+  img.save(out, "PNG")
+  return out.getvalue()
+
+def images(paths):
+  if paths:
+    for path in paths:
+      with open(path, "rb") as f:
+        yield path, f.read()
+  else:
+    yield "synthetic", synthetic()
+
+async def main(paths=()):
+  if not AVAILABLE:
+    print("pillow is not installed, skipping")
+    return
+  transcoder = Transcoder()
+  print(f"{'image':>20} {'options':>10} {'bytes':>8} {'ratio':>6} {'worker':>9} {'latency':>9}")
+  try:
+    # The first conversion also starts the worker
+    await transcoder.transcode(SimpleImage(synthetic()))
+    for label, data in images(paths):
+      for name, options in OPTIONS.items():
+        c = await transcoder.transcode(SimpleImage(data), **options._asdict())
+        print(
+          f"{label:>20} {name:>10} {c.bytes:>8} {c.ratio:>6.2f} "
+          f"{c.cpu_time * 1000:>7.1f}ms {c.latency * 1000:>7.1f}ms"
+        )
+  finally:
+    transcoder.close()
+
+if __name__ == "__main__":
+  asyncio.run(main(sys.argv[1:]))
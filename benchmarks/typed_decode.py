@@ -0,0 +1,80 @@
+"""
+Checks the typed decoder against `FullResults.from_dict` on plain dicts, and compares their speed
+
+Run with `python -m benchmarks.typed_decode [response.json ...]` from the repository root,
+nothing is checked without msgspec. Recorded responses are read from the given files, synthetic ones
+are used otherwise. Every field of every model has to be equal for both decoders,
+the exit status is non-zero if any differ.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+
+from dataclasses import fields
+
+from Jus_Bot.wolfram.api import FullResultsAPI
+from Jus_Bot.wolfram.models import FullResults, Model, WolframURL
+from Jus_Bot.wolfram.schema import AVAILABLE, typed_decoding
+
+from .payloads import full_results
+
+def bodies(paths):
+  if paths:
+    for path in paths:
+      with open(path, "rb") as f:
+        yield path, f.read()
+  else:
+    yield "10 pods", json.dumps({"queryresult": full_results(10)}).encode()
+    yield "50 pods", json.dumps({"queryresult": full_results(50)}).encode()
+    # Single objects where lists are expected, errors and the other optional fields
+    raw = full_results(5)
+    raw["pods"][0]["error"] = {"code": "1", "msg": "Pod failed"}
+    raw["tips"] = {"text": "Check your spelling"}
+    raw["recalculate"] = "https:\/\/www6b3.wolframalpha.com\/api\/v2\/recalc.jsp?id=MSP1"
+    raw["warnings"] = {
+      "text": "Reinterpreting \"pie\" as",
+      "new": "pi",
+      "score": "0.5",
+      "level": "medium",
+      "alternative": {"score": "0.3", "level": "low", "val": "pies"}
+    }
+    raw["didyoumeans"] = {"score": "0.36", "level": "medium", "val": "pi"}
+    yield "optional fields", json.dumps({"queryresult": raw}).encode()
+
+def dump(value):
+  """Turns models into comparable values"""
+  if isinstance(value, Model):
+    return (type(value).__name__, {f.name: dump(getattr(value, f.name)) for f in fields(value)})
+  if isinstance(value, list):
+    return [dump(v) for v in value]
+  if isinstance(value, WolframURL):
+    return value.url
+  return value
+
+def decode_dict(body: bytes) -> FullResults:
+  return FullResultsAPI.parse(body)
+
+def decode_typed(body: bytes) -> FullResults:
+  with typed_decoding():
+    return FullResultsAPI.parse(body)
+
+def main(paths=(), number: int = 200):
+  if not AVAILABLE:
+    print("msgspec is not installed, skipping")
+    return True
+  ok = True
+  print(f"{'body':>20} {'parity':>7} {'dict':>10} {'typed':>10}")
+  for label, body in bodies(paths):
+    same = dump(decode_dict(body)) == dump(decode_typed(body))
+    ok = ok and same
+    times = [
+      min(timeit.repeat(lambda: decode(body), number=number, repeat=5)) / number
+      for decode in (decode_dict, decode_typed)
+    ]
+    print(f"{label:>20} {'ok' if same else 'FAILED':>7} " + " ".join(f"{t * 1e6:>8.1f}us" for t in times))
+  return ok
+
+if __name__ == "__main__":
+  sys.exit(0 if main(sys.argv[1:]) else 1)